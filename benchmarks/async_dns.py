@@ -0,0 +1,198 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the benchmark of the DNS lookups of our availability endpoint: on the
+event loop (async) against in our threads (threads).
+
+Usage:
+
+    $ python benchmarks/upstreams.py --dns-port 5353 --dns-latency 200
+    $ python benchmarks/async_dns.py [--nameserver 127.0.0.1:5353] [--concurrency 500]
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import List
+
+MODES = {"threads": False, "async": True}
+"""
+The modes we benchmark and whether the DNS lookups run on the event loop.
+"""
+
+
+def percentile(values: List[float], rank: int) -> float:
+    """
+    Provides the given percentile of the given (sorted) values.
+    """
+
+    return values[min(len(values) - 1, int(len(values) * rank / 100))]
+
+
+class ThreadCounter(threading.Thread):
+    """
+    Samples the number of threads of the process.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        super().__init__(daemon=True)
+
+        self.interval = interval
+        self.peak = threading.active_count()
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, threading.active_count())
+
+
+async def bench(app, mode: str, requests: int, concurrency: int) -> dict:
+    """
+    Benchmarks our availability endpoint in the given mode.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    statuses = {}
+
+    async def check(client: httpx.AsyncClient, index: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/v1/availability/domain",
+                json={
+                    "subject": f"sub{index}.{mode}.example.org",
+                    "params": {"use_http_code_lookup": False},
+                },
+            )
+            latencies.append(time.perf_counter() - start)
+
+            status = response.json().get("status") if response.is_success else None
+            statuses[status] = statuses.get(status, 0) + 1
+
+    counter = ThreadCounter()
+    counter.start()
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(check(client, x) for x in range(requests)))
+        elapsed = time.perf_counter() - started_at
+
+    counter.stopped.set()
+    latencies.sort()
+
+    return {
+        "requests_per_second": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "peak_threads": counter.peak,
+        "statuses": statuses,
+    }
+
+
+def main() -> None:
+    """
+    Provides the entrypoint of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nameserver", default="127.0.0.1:5353")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument(
+        "--workers", type=int, default=32, help="The number of threads of our checks."
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("PYFUNCEBLE_WORKERS_DATA_DIR", tempfile.mkdtemp())
+    os.environ["SCHEDULER_MAX_WORKERS"] = str(args.workers)
+
+    # pylint: disable=import-outside-toplevel
+    import PyFunceble.storage
+
+    from pyfunceble_webworker.core.dns_cache import DNS_CACHE
+    from pyfunceble_webworker.core.settings import core_settings
+    from pyfunceble_webworker.main import app
+
+    PyFunceble.storage.CONFIGURATION.dns.server = [args.nameserver]
+    PyFunceble.storage.CONFIGURATION.dns.protocol = "UDP"
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    print(
+        f"{'mode':<8} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'threads':>8}  statuses"
+    )
+
+    for mode, enabled in MODES.items():
+        core_settings.DNS_ASYNC_ENABLED = enabled
+        DNS_CACHE.clear()
+
+        result = asyncio.run(bench(app, mode, args.requests, args.concurrency))
+
+        print(
+            f"{mode:<8} {result['requests_per_second']:10.2f} "
+            f"{result['p50_ms']:9.3f} {result['p95_ms']:9.3f} "
+            f"{result['p99_ms']:9.3f} {result['peak_threads']:8d}  "
+            f"{result['statuses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
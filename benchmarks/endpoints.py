@@ -0,0 +1,472 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the benchmark of our endpoints. Each endpoint is driven in-process
+- with our default settings - while the DNS, WHOIS and HTTP upstreams are
+stubbed.
+
+Usage (from the root of the repository):
+
+    $ python -m benchmarks.endpoints [--requests 500] [--save baseline.json]
+    $ python -m benchmarks.endpoints --compare baseline.json
+
+.. note::
+    PyFunceble still needs its datasets (IANA, PSL, ...). They are downloaded
+    on the first run - or read from the PyFunceble configuration directory.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+ENDPOINTS: Dict[str, dict] = {
+    "POST /v1/syntax/domain": {"json": {"subject": "example.org"}},
+    "POST /v1/syntax/ip": {"json": {"subject": "192.0.2.1"}},
+    "POST /v1/syntax/url": {"json": {"subject": "https://example.org/"}},
+    "POST /v1/converter/complements": {"json": {"subject": "example.org"}},
+    "POST /v1/converter/adblock": {"json": {"data": "||example.org^$third-party"}},
+    "POST /v1/converter/adblock/bulk": {
+        "json": {"data": [f"||sub{x}.example.org^" for x in range(100)]}
+    },
+    "POST /v1/converter/cidr": {"json": {"data": "192.0.2.0/28"}},
+    "POST /v1/converter/wildcard": {"json": {"data": "*.example.org"}},
+    "POST /v1/converter/hosts": {"json": {"data": "0.0.0.0 example.org"}},
+    "POST /v1/converter/plain": {"json": {"data": "example.org"}},
+    "POST /v1/converter/rpz": {
+        "json": {"data": "example.org.rpz-zone.example CNAME .", "soas": []}
+    },
+    "POST /v1/reputation/domain": {"json": {"subject": "example.org"}},
+    "POST /v1/reputation/ip": {"json": {"subject": "192.0.2.1"}},
+    "POST /v1/reputation/url": {"json": {"subject": "https://example.org/"}},
+    "POST /v1/reputation/domain-and-ip": {"json": {"subject": "example.org"}},
+    "POST /v1/availability/domain": {"json": {"subject": "example.org"}},
+    "POST /v1/availability/ip": {"json": {"subject": "192.0.2.1"}},
+    "POST /v1/availability/url": {"json": {"subject": "https://example.org/"}},
+    "POST /v1/availability/domain-and-ip": {"json": {"subject": "example.org"}},
+}
+"""
+The endpoints we benchmark and the request we send to each of them.
+"""
+
+BENCHMARKED_PREFIXES = (
+    "/v1/syntax",
+    "/v1/converter",
+    "/v1/reputation",
+    "/v1/availability",
+)
+"""
+The prefix of the routes which should be benchmarked.
+"""
+
+DNS_ANSWERS = {
+    "A": ["192.0.2.1"],
+    "AAAA": ["2001:db8::1"],
+    "NS": ["ns1.example.org."],
+    "PTR": ["example.org."],
+}
+"""
+The answers of our stubbed DNS upstreams.
+"""
+
+WHOIS_RECORD = """Domain Name: EXAMPLE.ORG
+Registrar: Example Registrar
+Registry Expiry Date: 2030-08-30T04:00:00Z
+"""
+"""
+The record of our stubbed WHOIS upstreams.
+"""
+
+HTTP_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+"""
+The response of our stubbed HTTP upstreams.
+"""
+
+
+class StubResponse:
+    """
+    Provides the response of our stubbed HTTP lookups.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.status_code = 200
+        self.history = []
+
+
+def get_dns_response(query, *args, **kwargs):
+    """
+    Provides the response of our stubbed DNS upstreams to the given query.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import dns.message
+    import dns.rdata
+    import dns.rdataclass
+    import dns.rdatatype
+
+    response = dns.message.make_response(query)
+
+    for question in query.question:
+        answers = DNS_ANSWERS.get(dns.rdatatype.to_text(question.rdtype), [])
+
+        if not answers:
+            continue
+
+        rrset = response.find_rrset(
+            response.answer,
+            question.name,
+            dns.rdataclass.IN,
+            question.rdtype,
+            create=True,
+        )
+
+        for answer in answers:
+            rrset.add(
+                dns.rdata.from_text(dns.rdataclass.IN, question.rdtype, answer), 300
+            )
+
+    return response
+
+
+async def get_dns_response_async(query, *args, **kwargs):
+    """
+    Provides - asynchronously - the response of our stubbed DNS upstreams to
+    the given query.
+    """
+
+    return get_dns_response(query)
+
+
+def install_stubs() -> None:
+    """
+    Replaces the upstreams of PyFunceble and of our HTTP client with stubs.
+
+    .. warning::
+        Has to be called before the import of our application: our caches,
+        limits and timeouts are wrapped around the stubs - as they are around
+        the real upstreams.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+
+    import dns.asyncquery
+    import dns.query
+    import httpcore
+    import PyFunceble.factory
+    from PyFunceble.query.whois.query_tool import WhoisQueryTool
+
+    from pyfunceble_webworker.core.http_client import HTTP_CLIENT
+
+    class StubNetworkStream(httpcore.AsyncNetworkStream):
+        """
+        Provides the connections of our stubbed HTTP upstreams.
+        """
+
+        def __init__(self) -> None:
+            self.pending = 0
+
+        async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+            if not self.pending:
+                return b""
+
+            self.pending -= 1
+            return HTTP_RESPONSE
+
+        async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+            self.pending += buffer.count(b"\r\n\r\n")
+
+        async def aclose(self) -> None:
+            pass
+
+        async def start_tls(self, *args, **kwargs) -> "StubNetworkStream":
+            return self
+
+        def get_extra_info(self, info: str) -> None:
+            return None
+
+    class StubNetworkBackend(httpcore.AsyncNetworkBackend):
+        """
+        Provides the network backend of our stubbed HTTP upstreams.
+        """
+
+        async def connect_tcp(self, *args, **kwargs) -> StubNetworkStream:
+            return StubNetworkStream()
+
+        async def sleep(self, seconds: float) -> None:
+            await asyncio.sleep(seconds)
+
+    def whois_query(self) -> str:
+        self.lookup_record.record = WHOIS_RECORD
+        self.lookup_record.expiration_date = self.expiration_date
+        self.lookup_record.registrar = self.registrar
+
+        return self.lookup_record.record
+
+    def http_get(url: str, *args, **kwargs) -> StubResponse:
+        return StubResponse(url)
+
+    for name in ("udp", "tcp", "tls", "https"):
+        setattr(dns.query, name, get_dns_response)
+        setattr(dns.asyncquery, name, get_dns_response_async)
+
+    # Our HTTP client resolves the hosts (through the stubbed DNS upstreams)
+    # before connecting through the backend we replace.
+    HTTP_CLIENT.backend.backend = StubNetworkBackend()
+
+    WhoisQueryTool.query = whois_query
+    # Still used when our HTTP client can't be: e.g. through a SOCKS proxy.
+    PyFunceble.factory.Requester.get = http_get
+    PyFunceble.factory.Requester.head = http_get
+
+
+def percentile(values: List[float], rank: int) -> float:
+    """
+    Provides the given percentile of the given (sorted) values.
+    """
+
+    return values[min(len(values) - 1, int(len(values) * rank / 100))]
+
+
+def bench(client, endpoint: str, requests: int, warmup: int) -> dict:
+    """
+    Benchmarks the given endpoint.
+    """
+
+    method, path = endpoint.split(" ", 1)
+    kwargs = ENDPOINTS[endpoint]
+
+    for _ in range(warmup):
+        response = client.request(method, path, **kwargs)
+
+        if response.status_code != 200:
+            raise SystemExit(
+                f"{endpoint} answered with {response.status_code}: {response.text}"
+            )
+
+    latencies = []
+    started_at = time.perf_counter()
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.request(method, path, **kwargs)
+        latencies.append(time.perf_counter() - start)
+
+    elapsed = time.perf_counter() - started_at
+    latencies.sort()
+
+    # Allocations are measured in a separate pass: tracing slows everything
+    # down.
+    allocations = []
+    tracemalloc.start()
+
+    for _ in range(max(requests // 10, 1)):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        client.request(method, path, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        allocations.append(peak - before)
+
+    tracemalloc.stop()
+
+    return {
+        "requests_per_second": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "peak_alloc_kib": round(statistics.mean(allocations) / 1024, 2),
+    }
+
+
+def get_metadata(requests: int) -> dict:
+    """
+    Provides the context of the benchmark.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import fastapi
+    import pydantic
+    import PyFunceble.storage
+
+    from pyfunceble_webworker import __version__
+
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "worker": __version__,
+        "pyfunceble": PyFunceble.storage.PROJECT_VERSION,
+        "fastapi": fastapi.__version__,
+        "pydantic": pydantic.VERSION,
+        "requests": requests,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    Prints the comparison of the given results against the given baseline.
+
+    :return:
+        The endpoints which regressed by more than the given tolerance.
+    """
+
+    regressions = []
+
+    print()
+    print(f"{'endpoint':<40} {'req/s':>10} {'baseline':>10} {'delta':>8}")
+
+    for endpoint, result in results.items():
+        if endpoint not in baseline["results"]:
+            continue
+
+        current = result["requests_per_second"]
+        previous = baseline["results"][endpoint]["requests_per_second"]
+        delta = (current - previous) / previous
+
+        flag = ""
+
+        if delta < -tolerance:
+            regressions.append(endpoint)
+            flag = " !"
+
+        print(f"{endpoint:<40} {current:10.2f} {previous:10.2f} {delta:+8.1%}{flag}")
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Provides the entrypoint of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--filter", default="", help="Only benchmark the endpoints containing it."
+    )
+    parser.add_argument("--save", help="Saves the results into the given file.")
+    parser.add_argument("--compare", help="Compares against the given baseline.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="The throughput loss (ratio) tolerated by --compare.",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("PYFUNCEBLE_WORKERS_DATA_DIR", tempfile.mkdtemp())
+
+    install_stubs()
+
+    # pylint: disable=import-outside-toplevel
+    from fastapi.testclient import TestClient
+
+    from pyfunceble_webworker.main import app
+
+    routes: List[Tuple[str, str]] = [
+        (method, route.path)
+        for route in app.routes
+        if route.path.startswith(BENCHMARKED_PREFIXES)
+        for method in getattr(route, "methods", ())
+    ]
+
+    for method, path in routes:
+        if f"{method} {path}" not in ENDPOINTS:
+            print(f"Not benchmarked (no request defined): {method} {path}")
+
+    results = {}
+
+    print(
+        f"{'endpoint':<40} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'KiB/req':>9}"
+    )
+
+    # Not used as a context manager: our periodic (startup) tasks - e.g. the
+    # refresh of the datasets - would hit the network in the background.
+    client = TestClient(app)
+
+    for endpoint in ENDPOINTS:
+        if args.filter not in endpoint:
+            continue
+
+        result = results[endpoint] = bench(client, endpoint, args.requests, args.warmup)
+        print(
+            f"{endpoint:<40} {result['requests_per_second']:10.2f} "
+            f"{result['p50_ms']:9.3f} {result['p95_ms']:9.3f} "
+            f"{result['p99_ms']:9.3f} {result['peak_alloc_kib']:9.2f}"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file_stream:
+            json.dump(
+                {"metadata": get_metadata(args.requests), "results": results},
+                file_stream,
+                indent=4,
+            )
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file_stream:
+            regressions = compare(results, json.load(file_stream), args.tolerance)
+
+        if regressions:
+            raise SystemExit(f"Regression(s): {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
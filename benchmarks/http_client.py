@@ -0,0 +1,237 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the benchmark of the HTTP status code lookups: through PyFunceble
+(requests) against through our HTTP client (client).
+
+Usage:
+
+    $ python benchmarks/upstreams.py --dns-port 5353 --http-port 8080 --http-latency 50
+    $ python benchmarks/http_client.py [--nameserver 127.0.0.1:5353] [--port 8080]
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import concurrent.futures
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import List
+
+MODES = {"requests": False, "client": True}
+"""
+The modes we benchmark and whether our HTTP client is used.
+"""
+
+
+def percentile(values: List[float], rank: int) -> float:
+    """
+    Provides the given percentile of the given (sorted) values.
+    """
+
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(len(values) * rank / 100))]
+
+
+class ConnectionCounter:
+    """
+    Counts the connections opened by PyFunceble and by our HTTP client.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def increment(self) -> None:
+        """
+        Counts a new connection.
+        """
+
+        with self.lock:
+            self.count += 1
+
+    def install(self) -> None:
+        """
+        Installs our counter in front of the connections of urllib3 and of
+        our HTTP client.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        import urllib3.connection
+
+        from pyfunceble_webworker.core.http_client import HTTP_CLIENT
+
+        connect = urllib3.connection.HTTPConnection.connect
+        connect_tcp = HTTP_CLIENT.backend.connect_tcp
+
+        def counted_connect(*args, **kwargs):
+            self.increment()
+            return connect(*args, **kwargs)
+
+        async def counted_connect_tcp(*args, **kwargs):
+            self.increment()
+            return await connect_tcp(*args, **kwargs)
+
+        urllib3.connection.HTTPConnection.connect = counted_connect
+        HTTP_CLIENT.backend.connect_tcp = counted_connect_tcp
+
+
+def bench(urls: List[str], threads: int, counter: ConnectionCounter) -> dict:
+    """
+    Queries the HTTP status code of the given URLs from the given number of
+    threads - like our checks do.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from PyFunceble.query.http_status_code import HTTPStatusCode
+
+    latencies = []
+    status_codes = {}
+
+    def query(url: str) -> None:
+        start = time.perf_counter()
+        status_code = HTTPStatusCode(url).get_status_code()
+        latencies.append(time.perf_counter() - start)
+
+        status_codes[status_code] = status_codes.get(status_code, 0) + 1
+
+    counter.count = 0
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        started_at = time.perf_counter()
+        list(executor.map(query, urls))
+        elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+
+    return {
+        "requests_per_second": round(len(urls) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "connections": counter.count,
+        "status_codes": status_codes,
+    }
+
+
+def main() -> None:
+    """
+    Provides the entrypoint of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nameserver", default="127.0.0.1:5353")
+    parser.add_argument(
+        "--port", type=int, default=8080, help="The port of the HTTP stand-in."
+    )
+    parser.add_argument("--urls", type=int, default=2000)
+    parser.add_argument(
+        "--hosts", type=int, default=4, help="The number of hosts the URLs spread over."
+    )
+    parser.add_argument(
+        "--threads", type=int, default=32, help="The number of threads of our checks."
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("PYFUNCEBLE_WORKERS_DATA_DIR", tempfile.mkdtemp())
+
+    # pylint: disable=import-outside-toplevel
+    import PyFunceble.storage
+    from PyFunceble.query.dns.query_tool import DNSQueryTool
+    from PyFunceble.query.http_status_code import HTTPStatusCode
+
+    import pyfunceble_webworker.main  # noqa: F401 ## Installs our HTTP client.
+    from pyfunceble_webworker.core.http_client import HTTP_CLIENT
+
+    PyFunceble.storage.CONFIGURATION.dns.server = [args.nameserver]
+    PyFunceble.storage.CONFIGURATION.dns.protocol = "UDP"
+    # The nameservers are shared by all query tools - including the one of
+    # PyFunceble's requester.
+    DNSQueryTool()
+    logging.getLogger("urllib3").setLevel(logging.CRITICAL)
+
+    counter = ConnectionCounter()
+    counter.install()
+
+    client_get_status_code = HTTPStatusCode.get_status_code
+    requests_get_status_code = getattr(
+        client_get_status_code, "__wrapped__", client_get_status_code
+    )
+
+    urls = [
+        f"http://host{x % args.hosts}.example.org:{args.port}/status/200?{x}"
+        for x in range(args.urls)
+    ]
+
+    print(
+        f"{'mode':<9} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'connections':>12}  status codes"
+    )
+
+    for mode, enabled in MODES.items():
+        HTTPStatusCode.get_status_code = (
+            client_get_status_code if enabled else requests_get_status_code
+        )
+
+        result = bench(urls, args.threads, counter)
+
+        print(
+            f"{mode:<9} {result['requests_per_second']:10.2f} "
+            f"{result['p50_ms']:9.3f} {result['p99_ms']:9.3f} "
+            f"{result['connections']:12d}  {result['status_codes']}"
+        )
+
+    HTTP_CLIENT.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+This is the benchmark of our logging. The same load is driven in-process - with
+the access log enabled - while the records are dropped, written by the
+request path, or queued and written by a background thread.
+
+Usage:
+
+    $ python benchmarks/logs.py [--requests 2000] [--concurrency 8]
+    $ python benchmarks/logs.py --sink-latency 1
+
+.. note::
+    The console handler writes into a file instead of the terminal. Use
+    :code:`--sink-latency` to reproduce a console which does not keep up -
+    e.g. a container log driver under pressure.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import concurrent.futures
+import importlib.resources
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+from PyFunceble.helpers.dict import DictHelper
+
+MODES = ("none", "direct", "queue")
+"""
+The logging modes we compare.
+"""
+
+
+class SlowStream:
+    """
+    Provides a stream which takes the given time (in seconds) for each write.
+    """
+
+    def __init__(self, stream, latency: float) -> None:
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, data: str) -> int:
+        time.sleep(self.latency)
+
+        return self.stream.write(data)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def get_config(directory: str, console) -> dict:
+    """
+    Provides our logging configuration - writing into the given directory.
+    """
+
+    with importlib.resources.path(
+        "pyfunceble_webworker.data", "logger.yaml"
+    ) as logger_config_path:
+        config = DictHelper.from_yaml_file(str(logger_config_path))
+
+    config["handlers"]["file"]["filename"] = os.path.join(
+        directory, config["handlers"]["file"]["filename"]
+    )
+    config["handlers"]["console"]["stream"] = console
+
+    return config
+
+
+def percentile(values: List[float], rank: int) -> float:
+    """
+    Provides the given percentile of the given (sorted) values.
+    """
+
+    return values[min(len(values) - 1, int(len(values) * rank / 100))]
+
+
+def bench(client, requests: int, concurrency: int) -> dict:
+    """
+    Sends the given number of requests - from the given number of threads.
+    """
+
+    def request(_) -> float:
+        start = time.perf_counter()
+        client.post("/v1/syntax/domain", json={"subject": "example.org"})
+
+        return time.perf_counter() - start
+
+    with concurrent.futures.ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(request, range(concurrency * 10)))
+
+        started_at = time.perf_counter()
+        latencies = sorted(executor.map(request, range(requests)))
+        elapsed = time.perf_counter() - started_at
+
+    return {
+        "requests_per_second": requests / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+    }
+
+
+def main() -> None:
+    """
+    Provides the entrypoint of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--sink-latency",
+        type=float,
+        default=0,
+        help="The time (in milliseconds) taken by each write to the console.",
+    )
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+
+    os.environ.setdefault("PYFUNCEBLE_WORKERS_DATA_DIR", directory)
+    os.environ["ACCESS_LOG_ENABLED"] = "true"
+
+    # pylint: disable=import-outside-toplevel
+    from fastapi.testclient import TestClient
+
+    from pyfunceble_webworker.core.logs import start_logging, stop_logging
+    from pyfunceble_webworker.main import app
+
+    # The client we drive the load with logs each request too.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    results = {}
+
+    with open(
+        os.path.join(directory, "console.log"), "w", encoding="utf-8"
+    ) as console_file, TestClient(app) as client:
+        console = SlowStream(console_file, args.sink_latency / 1000)
+
+        # The modes are interleaved and the best round is kept so that the
+        # noise (warm-up, GC, ...) does not favor one of them.
+        for _ in range(args.rounds):
+            for mode in MODES:
+                start_logging(get_config(directory, console), use_queue=mode == "queue")
+                logging.disable(logging.INFO if mode == "none" else logging.NOTSET)
+
+                result = bench(client, args.requests, args.concurrency)
+
+                if mode not in results or result["mean_ms"] < results[mode]["mean_ms"]:
+                    results[mode] = result
+
+                stop_logging()
+
+    logging.disable(logging.NOTSET)
+
+    print(f"{'mode':<8} {'req/s':>10} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+
+    for mode, result in results.items():
+        print(
+            f"{mode:<8} {result['requests_per_second']:10.2f} "
+            f"{result['mean_ms']:9.3f} {result['p50_ms']:9.3f} "
+            f"{result['p99_ms']:9.3f}"
+        )
+
+    for mode in MODES[1:]:
+        overhead = results[mode]["mean_ms"] - results["none"]["mean_ms"]
+        print(f"{mode:<8} adds {overhead:+.3f} ms per request (mean)")
+
+
+if __name__ == "__main__":
+    main()
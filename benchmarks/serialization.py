@@ -0,0 +1,232 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the benchmark of the serialization of the result of our checkers.
+
+Usage:
+
+    $ python benchmarks/serialization.py [--items 10000]
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import asyncio
+import copy
+import datetime
+import json
+import time
+from typing import List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.core.responses import FastJSONResponse, project
+from pyfunceble_webworker.models.availability import AvailabilityStatus
+
+STATUS = {
+    "subject_kind": "domain",
+    "subject": "example.org",
+    "idna_subject": "example.org",
+    "netloc": "example.org",
+    "status": "ACTIVE",
+    "status_source": "DNSLOOKUP",
+    "tested_at": datetime.datetime.now(datetime.timezone.utc),
+    "params": {
+        "do_syntax_check_first": True,
+        "use_platform": False,
+        "use_extra_rules": True,
+        "use_whois_lookup": False,
+        "use_dns_lookup": True,
+        "use_netinfo_lookup": False,
+        "use_http_code_lookup": True,
+        "use_reputation_lookup": False,
+        "use_whois_db": False,
+    },
+    "checker_type": "AVAILABILITY",
+    "dns_lookup_record": {
+        "nameserver": "9.9.9.9",
+        "port": 53,
+        "follow_nameserver_order": True,
+        "preferred_protocol": "UDP",
+        "query_record_type": "A",
+        "query_timeout": 5.0,
+        "subject": "example.org",
+        "response": ["93.184.215.14"],
+    },
+    "whois_lookup_record": {
+        "server": None,
+        "port": 43,
+        "query_timeout": 5.0,
+        "subject": "example.org",
+        "record": None,
+        "expiration_date": None,
+        "registrar": None,
+    },
+    "domain_syntax": True,
+    "second_level_domain_syntax": True,
+    "subdomain_syntax": False,
+    "ip_syntax": False,
+    "ipv4_syntax": False,
+    "ipv6_syntax": False,
+    "ipv4_range_syntax": False,
+    "ipv6_range_syntax": False,
+    "url_syntax": False,
+    "expiration_date": None,
+    "registrar": None,
+    "whois_record": None,
+    "status_before_extra_rules": None,
+    "status_after_extra_rules": None,
+    "status_source_before_extra_rules": None,
+    "status_source_after_extra_rules": None,
+    "dns_lookup": {
+        "NS": None,
+        "A": ["93.184.215.14"],
+        "AAAA": ["2606:2800:21f:cb07:6820:80da:af6b:8b2c"],
+        "CNAME": None,
+    },
+    "netinfo": None,
+    "http_status_code": 200,
+}
+
+
+def validated_path(items: list) -> bytes:
+    """
+    Reproduces what FastAPI does with the response model: validation,
+    serialization and the standard JSON encoding.
+    """
+
+    field = create_model_field(
+        "response", List[AvailabilityStatus], mode="serialization"
+    )
+
+    async def run():
+        return await serialize_response(field=field, response_content=items)
+
+    return json.dumps(
+        asyncio.run(run()),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def fast_path(items: list) -> bytes:
+    """
+    Reproduces what our fast path does: projection and orjson encoding.
+    """
+
+    return FastJSONResponse([project(AvailabilityStatus, x) for x in items]).body
+
+
+def compact_path(items: list) -> bytes:
+    """
+    Reproduces what our fast path does when the compact mode is requested.
+    """
+
+    fields = frozenset(responses_defaults.COMPACT_FIELDS)
+
+    return FastJSONResponse(
+        [project(AvailabilityStatus, x, fields) for x in items]
+    ).body
+
+
+def bench(name: str, func, items: list, rounds: int) -> float:
+    """
+    Runs the given function and provides the per-item cost (in microseconds).
+    """
+
+    best = None
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(items)
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    per_item = best / len(items) * 1_000_000
+    print(f"{name:<12} {per_item:10.2f} µs/item {best * 1000:10.2f} ms total")
+
+    return per_item
+
+
+def main() -> None:
+    """
+    Provides the entrypoint of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    items = [copy.deepcopy(STATUS) for _ in range(args.items)]
+
+    if json.loads(validated_path(items[:1])) != json.loads(fast_path(items[:1])):
+        raise SystemExit("The fast path does not provide the same output.")
+
+    validated = bench("validated", validated_path, items, args.rounds)
+    fast = bench("fast", fast_path, items, args.rounds)
+
+    compact = bench("compact", compact_path, items, args.rounds)
+
+    print(
+        f"speedup      {validated / fast:10.2f}x (compact: {validated / compact:.2f}x)"
+    )
+    print(
+        f"bytes/item   {len(fast_path(items[:1])):10d}    "
+        f"(compact: {len(compact_path(items[:1]))})"
+    )
+
+
+if __name__ == "__main__":
+    main()
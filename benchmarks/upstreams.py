@@ -0,0 +1,478 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+This is the local stand-in of the upstreams we query: a DNS server (UDP and
+TCP), a WHOIS server and a HTTP target. Latencies, error rates and TTLs are
+configurable per server - so that the load tests of our availability and
+reputation endpoints are reproducible offline.
+
+Usage:
+
+    $ python benchmarks/upstreams.py --write-config /data [--dns-latency 20]
+    $ UPSTREAM_WHOIS_SERVER=127.0.0.1:4343 uvicorn pyfunceble_webworker.main:app
+
+.. note::
+    The HTTP target acts as the (global) HTTP proxy of PyFunceble. Therefore,
+    only :code:`http://` subjects reach it. A :code:`/status/<code>` path
+    makes it answer with the given status code and a
+    :code:`/redirect/<count>` path with the given number of redirects.
+
+.. note::
+    Every name under :code:`nxdomain.` or :code:`.invalid` is answered with
+    :code:`NXDOMAIN`.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import http.server
+import os
+import random
+import socketserver
+import struct
+import threading
+import time
+import urllib.parse
+from typing import NamedTuple, Optional
+
+import dns.exception
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+import yaml
+
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+
+DNS_ANSWERS = {
+    dns.rdatatype.A: "127.0.0.1",
+    dns.rdatatype.AAAA: "::1",
+    dns.rdatatype.NS: "ns1.example.org.",
+    dns.rdatatype.PTR: "localhost.",
+}
+"""
+The answer of our DNS server - per record type. Any other record type gets an
+empty answer.
+"""
+
+WHOIS_RECORD = """Domain Name: {subject}
+Registrar: Example Registrar
+Registry Expiry Date: 2030-08-30T04:00:00Z
+"""
+"""
+The record of our WHOIS server.
+"""
+
+
+class Profile(NamedTuple):
+    """
+    Describes how one of our servers behaves.
+    """
+
+    latency: float
+    """
+    The (mean) time - in seconds - before an answer.
+    """
+
+    jitter: float
+    """
+    The maximum deviation - in seconds - of the latency.
+    """
+
+    error_rate: float
+    """
+    The ratio of the queries that fail.
+    """
+
+    ttl: int
+    """
+    The TTL - in seconds - of our answers.
+    """
+
+
+class Upstream:
+    """
+    Provides the behavior and the counters shared by all our servers.
+    """
+
+    def __init__(self, name: str, profile: Profile, seed: Optional[int]) -> None:
+        self.name = name
+        self.profile = profile
+
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.queries = 0
+        self.errors = 0
+
+    def delay(self) -> bool:
+        """
+        Waits for the latency of the upstream.
+
+        :return:
+            Whether the current query should fail.
+        """
+
+        with self.lock:
+            self.queries += 1
+
+            latency = self.profile.latency + self.random.uniform(
+                -self.profile.jitter, self.profile.jitter
+            )
+            failed = self.random.random() < self.profile.error_rate
+
+            if failed:
+                self.errors += 1
+
+        if latency > 0:
+            time.sleep(latency)
+
+        return failed
+
+
+def is_nxdomain(name: str) -> bool:
+    """
+    Checks if the given name does not exist.
+    """
+
+    name = name.lower().rstrip(".")
+
+    return name.startswith("nxdomain.") or name.endswith(".invalid")
+
+
+def build_dns_answer(wire: bytes, upstream: Upstream) -> Optional[bytes]:
+    """
+    Provides the answer to the given DNS query.
+    """
+
+    try:
+        query = dns.message.from_wire(wire)
+    except dns.exception.DNSException:
+        return None
+
+    response = dns.message.make_response(query)
+    response.flags |= dns.flags.AA
+
+    if upstream.delay():
+        response.set_rcode(dns.rcode.SERVFAIL)
+        return response.to_wire()
+
+    for question in query.question:
+        if is_nxdomain(question.name.to_text()):
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif question.rdtype in DNS_ANSWERS:
+            response.answer.append(
+                dns.rrset.from_text(
+                    question.name,
+                    upstream.profile.ttl,
+                    "IN",
+                    question.rdtype,
+                    DNS_ANSWERS[question.rdtype],
+                )
+            )
+
+    return response.to_wire()
+
+
+class DNSUDPHandler(socketserver.BaseRequestHandler):
+    """
+    Answers the DNS queries over UDP.
+    """
+
+    def handle(self) -> None:
+        data, sock = self.request
+        answer = build_dns_answer(data, self.server.upstream)
+
+        if answer:
+            sock.sendto(answer, self.client_address)
+
+
+class DNSTCPHandler(socketserver.BaseRequestHandler):
+    """
+    Answers the DNS queries over TCP.
+    """
+
+    def handle(self) -> None:
+        while True:
+            header = self.request.recv(2)
+
+            if len(header) < 2:
+                break
+
+            (length,) = struct.unpack("!H", header)
+            data = b""
+
+            while len(data) < length:
+                chunk = self.request.recv(length - len(data))
+
+                if not chunk:
+                    return
+
+                data += chunk
+
+            answer = build_dns_answer(data, self.server.upstream)
+
+            if not answer:
+                break
+
+            self.request.sendall(struct.pack("!H", len(answer)) + answer)
+
+
+class WhoisHandler(socketserver.StreamRequestHandler):
+    """
+    Answers the WHOIS queries. A failure closes the connection without any
+    answer.
+    """
+
+    def handle(self) -> None:
+        subject = self.rfile.readline().decode("utf-8", "replace").strip()
+
+        if self.server.upstream.delay():
+            return
+
+        self.wfile.write(WHOIS_RECORD.format(subject=subject.upper()).encode())
+
+
+class HTTPHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers the HTTP requests. A failure is answered with a 503.
+
+    As we are the proxy of PyFunceble, we also receive the requests to the
+    names which do not exist: we drop them - like an unreachable host.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def answer(self, with_body: bool) -> None:
+        """
+        Answers the current request.
+        """
+
+        upstream = self.server.upstream
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path
+
+        if is_nxdomain(url.hostname or self.headers.get("Host", "")):
+            self.close_connection = True
+            return
+
+        location = None
+
+        if upstream.delay():
+            status_code = 503
+        elif path.startswith("/status/") and path[8:].isdigit():
+            status_code = int(path[8:])
+        elif path.startswith("/redirect/") and path[10:].isdigit():
+            redirects = int(path[10:])
+            status_code = 302 if redirects else 200
+            location = f"/redirect/{redirects - 1}" if redirects else None
+        else:
+            status_code = 200
+
+        body = f"{status_code}\n".encode()
+
+        self.send_response(status_code)
+
+        if location:
+            self.send_header("Location", location)
+
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", f"max-age={upstream.profile.ttl}")
+        self.end_headers()
+
+        if with_body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.answer(True)
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        self.answer(False)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def start_server(server_class, address: tuple, handler, upstream: Upstream):
+    """
+    Starts the given server in the background.
+    """
+
+    server_class.allow_reuse_address = True
+    server_class.daemon_threads = True
+
+    server = server_class(address, handler)
+    server.upstream = upstream
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def write_config(directory: str, host: str, args: argparse.Namespace) -> str:
+    """
+    Writes the PyFunceble configuration pointing to our servers into the given
+    (data) directory.
+    """
+
+    path = os.path.join(directory, assets_defaults.OVERWRITE_CONFIG_FILE)
+
+    if os.path.isfile(path) and os.path.getsize(path) and not args.force:
+        raise SystemExit(f"{path} already exists. Use --force to overwrite it.")
+
+    with open(path, "w", encoding="utf-8") as file_stream:
+        yaml.safe_dump(
+            {
+                "dns": {
+                    "server": [f"{host}:{args.dns_port}"],
+                    "protocol": "UDP",
+                    "follow_server_order": True,
+                },
+                "proxy": {"global": {"http": f"http://{host}:{args.http_port}"}},
+            },
+            file_stream,
+        )
+
+    return path
+
+
+def main() -> None:
+    """
+    Provides the entrypoint of the harness.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--dns-port", type=int, default=5353)
+    parser.add_argument("--whois-port", type=int, default=4343)
+    parser.add_argument("--http-port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, help="Makes the failures reproducible.")
+    parser.add_argument(
+        "--write-config",
+        metavar="DATA_DIR",
+        help="Writes the PyFunceble configuration of the worker into DATA_DIR.",
+    )
+    parser.add_argument("--force", action="store_true")
+
+    for name, ttl in (("dns", 300), ("whois", 0), ("http", 0)):
+        parser.add_argument(
+            f"--{name}-latency", type=float, default=0, help="In milliseconds."
+        )
+        parser.add_argument(
+            f"--{name}-jitter", type=float, default=0, help="In milliseconds."
+        )
+        parser.add_argument(f"--{name}-error-rate", type=float, default=0)
+        parser.add_argument(f"--{name}-ttl", type=int, default=ttl, help="In seconds.")
+
+    args = parser.parse_args()
+
+    upstreams = {
+        name: Upstream(
+            name,
+            Profile(
+                latency=getattr(args, f"{name}_latency") / 1000,
+                jitter=getattr(args, f"{name}_jitter") / 1000,
+                error_rate=getattr(args, f"{name}_error_rate"),
+                ttl=getattr(args, f"{name}_ttl"),
+            ),
+            None if args.seed is None else args.seed + index,
+        )
+        for index, name in enumerate(("dns", "whois", "http"))
+    }
+
+    start_server(
+        socketserver.ThreadingUDPServer,
+        (args.host, args.dns_port),
+        DNSUDPHandler,
+        upstreams["dns"],
+    )
+    start_server(
+        socketserver.ThreadingTCPServer,
+        (args.host, args.dns_port),
+        DNSTCPHandler,
+        upstreams["dns"],
+    )
+    start_server(
+        socketserver.ThreadingTCPServer,
+        (args.host, args.whois_port),
+        WhoisHandler,
+        upstreams["whois"],
+    )
+    start_server(
+        http.server.ThreadingHTTPServer,
+        (args.host, args.http_port),
+        HTTPHandler,
+        upstreams["http"],
+    )
+
+    print(f"DNS   {args.host}:{args.dns_port} (UDP & TCP)")
+    print(f"WHOIS {args.host}:{args.whois_port}")
+    print(f"HTTP  {args.host}:{args.http_port}")
+
+    if args.write_config:
+        print(f"Wrote {write_config(args.write_config, args.host, args)}")
+        print(
+            f"Start the worker with UPSTREAM_WHOIS_SERVER={args.host}:{args.whois_port}"
+        )
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+
+    for upstream in upstreams.values():
+        print(
+            f"{upstream.name:<6} {upstream.queries:8d} queries "
+            f"{upstream.errors:8d} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the identification of our clients.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from typing import FrozenSet
+
+from fastapi import Request
+from starlette.datastructures import Headers
+from starlette.types import Scope
+
+from pyfunceble_webworker.core.settings import core_settings
+
+
+def identify_client(scope: Scope, api_key_header: str, api_keys: FrozenSet[str]) -> str:
+    """
+    Provides the identity of the client of the given request.
+
+    Clients are identified by their API key - when known - or by their IP.
+    Unknown keys are ignored so that a client can't get a new identity by
+    rotating keys.
+    """
+
+    api_key = Headers(scope=scope).get(api_key_header)
+
+    if api_key and api_key in api_keys:
+        return f"key:{api_key}"
+
+    client = scope.get("client")
+
+    return f"ip:{client[0]}" if client else "ip:unknown"
+
+
+def get_client(request: Request) -> str:
+    """
+    Provides the identity of the client of the current request.
+    """
+
+    return identify_client(
+        request.scope,
+        core_settings.RATE_LIMIT_API_KEY_HEADER,
+        frozenset(core_settings.RATE_LIMIT_API_KEYS),
+    )
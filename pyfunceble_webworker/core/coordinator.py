@@ -0,0 +1,632 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our coordinator. In coordinator mode, a node
+shards large jobs across its peers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import bisect
+import collections
+import contextlib
+import hashlib
+import logging
+import os
+import secrets
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+import orjson
+import requests
+
+import pyfunceble_webworker.storage
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+from pyfunceble_webworker.core.defaults import routes as routes_defaults
+from pyfunceble_webworker.core.jobs import (
+    JOB_RUNNERS,
+    JobRunner,
+    get_job_path,
+    update_job,
+    write_json,
+)
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.models.jobs import JobState
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover ## Not available under Windows.
+    fcntl = None
+
+SHARD_UNFINISHED_STATES = ("PENDING", "RUNNING")
+"""
+The states of the shards which are still to be run.
+"""
+
+
+class HashRing:
+    """
+    Provides a consistent hash ring.
+
+    Each node is placed multiple times (virtual nodes) on the ring so that the
+    keys are evenly spread. Adding or removing a node only moves the keys of
+    that node.
+
+    :param nodes:
+        The nodes of the ring.
+    :param virtual_nodes:
+        The number of times each node is placed on the ring.
+    """
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = 64) -> None:
+        self.ring = sorted(
+            (self.hash(f"{node}#{index}"), node)
+            for node in set(nodes)
+            for index in range(virtual_nodes)
+        )
+        self.hashes = [x for x, _ in self.ring]
+
+    @staticmethod
+    def hash(value: str) -> int:
+        """
+        Provides the position of the given value on the ring.
+        """
+
+        return int.from_bytes(
+            hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+
+    def get_node(self, key: str) -> str:
+        """
+        Provides the node responsible of the given key.
+
+        :raise ValueError:
+            When the ring is empty.
+        """
+
+        if not self.ring:
+            raise ValueError("Empty ring.")
+
+        index = bisect.bisect(self.hashes, self.hash(key)) % len(self.ring)
+
+        return self.ring[index][1]
+
+
+def normalize_peer(url: str) -> str:
+    """
+    Provides the normalized base URL of the given peer.
+    """
+
+    return str(url).rstrip("/")
+
+
+def get_peers_file() -> str:
+    """
+    Provides the path of the file where we persist our registered peers.
+    """
+
+    return os.path.join(
+        pyfunceble_webworker.storage.CONFIG_DIRECTORY, assets_defaults.PEERS_FILE
+    )
+
+
+def read_registered_peers() -> List[str]:
+    """
+    Provides the peers registered through our API.
+    """
+
+    try:
+        with open(get_peers_file(), "rb") as stream:
+            return orjson.loads(stream.read())
+    except (OSError, ValueError):
+        return []
+
+
+def get_peers() -> List[str]:
+    """
+    Provides all our peers: the ones from our settings and the registered ones.
+    """
+
+    return list(
+        dict.fromkeys(
+            normalize_peer(x)
+            for x in [*core_settings.COORDINATOR_PEERS, *read_registered_peers()]
+        )
+    )
+
+
+@contextlib.contextmanager
+def peers_lock() -> Iterator[None]:
+    """
+    Provides an exclusive lock over our registered peers.
+
+    .. note::
+        Without :code:`fcntl` (e.g. Windows), we don't lock.
+    """
+
+    with open(
+        os.path.join(
+            pyfunceble_webworker.storage.CONFIG_DIRECTORY,
+            assets_defaults.PEERS_LOCK_FILE,
+        ),
+        "a",
+        encoding="utf-8",
+    ) as lock_stream:
+        if fcntl is not None:
+            fcntl.flock(lock_stream.fileno(), fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_stream.fileno(), fcntl.LOCK_UN)
+
+
+def register_peer(url: str) -> List[str]:
+    """
+    Registers the given peer.
+
+    The registrations - of any worker - are serialized so that none of them
+    gets lost.
+    """
+
+    url = normalize_peer(url)
+
+    with peers_lock():
+        peers = read_registered_peers()
+
+        if url not in peers:
+            write_json(get_peers_file(), [*peers, url])
+
+    return get_peers()
+
+
+def unregister_peer(url: str) -> List[str]:
+    """
+    Unregisters the given peer.
+
+    .. note::
+        Peers from our settings can't be unregistered.
+    """
+
+    url = normalize_peer(url)
+
+    with peers_lock():
+        peers = read_registered_peers()
+
+        if url in peers:
+            write_json(get_peers_file(), [x for x in peers if x != url])
+
+    return get_peers()
+
+
+def get_session() -> requests.Session:
+    """
+    Provides a session to talk to our peers.
+    """
+
+    session = requests.Session()
+
+    if core_settings.COORDINATOR_API_KEY:
+        session.headers[core_settings.RATE_LIMIT_API_KEY_HEADER] = (
+            core_settings.COORDINATOR_API_KEY
+        )
+
+    return session
+
+
+def probe_peer(url: str, session: Optional[requests.Session] = None) -> dict:
+    """
+    Provides the identity and readiness of the given peer.
+    """
+
+    session = session or get_session()
+    result = {"url": url, "id": None, "ready": False}
+
+    try:
+        req = session.get(
+            f"{url}{routes_defaults.V1_URL_PREFIX}/info",
+            timeout=core_settings.COORDINATOR_REQUEST_TIMEOUT,
+        )
+        req.raise_for_status()
+        result["id"] = req.json()["id"]
+
+        req = session.get(
+            f"{url}{routes_defaults.V1_URL_PREFIX}/ready",
+            timeout=core_settings.COORDINATOR_REQUEST_TIMEOUT,
+        )
+        result["ready"] = req.status_code == 200
+    except (requests.RequestException, ValueError, KeyError):
+        pass
+
+    return result
+
+
+def get_ready_peers(session: Optional[requests.Session] = None) -> List[str]:
+    """
+    Provides the peers which are ready to work.
+    """
+
+    return [x for x in get_peers() if probe_peer(x, session)["ready"]]
+
+
+def read_shards(job_id: str) -> Optional[List[dict]]:
+    """
+    Reads the shards of the given job.
+    """
+
+    try:
+        with open(
+            get_job_path(job_id, assets_defaults.JOB_SHARDS_FILE), "rb"
+        ) as stream:
+            return orjson.loads(stream.read())
+    except (OSError, ValueError):
+        return None
+
+
+class ShardLost(Exception):
+    """
+    Describes a shard which is lost by its peer.
+    """
+
+
+class CoordinatorRunner(JobRunner):
+    """
+    Provides the runner of a distributed job.
+
+    The subjects are sharded across our peers by consistent hashing. Each shard
+    is submitted as a job to its peer. We then poll the peers and checkpoint
+    their results into our own results file - exactly like a local job.
+
+    A shard whose peer fails (:code:`COORDINATOR_MAX_ERRORS` consecutive
+    errors) or loses it is reassigned - without the subjects already tested -
+    to another peer, up to :code:`COORDINATOR_SHARD_RETRIES` times.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.session = get_session()
+        self.subjects: List[str] = []
+        self.shards: List[dict] = []
+        self.done: Set[int] = set()
+
+    def get_url(self, peer: str, *path: str) -> str:
+        """
+        Provides the URL of the given job endpoint of the given peer.
+        """
+
+        return "/".join([f"{peer}{routes_defaults.V1_URL_PREFIX}/jobs", *path])
+
+    def build_shards(self, indexes: List[int], peers: List[str], attempts: int) -> None:
+        """
+        Shards the given subjects across the given peers.
+        """
+
+        ring = HashRing(peers, core_settings.COORDINATOR_VIRTUAL_NODES)
+        groups: Dict[str, List[int]] = collections.defaultdict(list)
+
+        for index in indexes:
+            groups[ring.get_node(self.subjects[index])].append(index)
+
+        shard_size = max(core_settings.COORDINATOR_SHARD_SIZE, 1)
+
+        for peer, peer_indexes in groups.items():
+            for start in range(0, len(peer_indexes), shard_size):
+                self.shards.append(
+                    {
+                        "id": secrets.token_hex(4),
+                        "peer": peer,
+                        "remote_id": None,
+                        "indexes": peer_indexes[start : start + shard_size],
+                        "state": "PENDING",
+                        "attempts": attempts,
+                        "fetched": 0,
+                        "errors": 0,
+                    }
+                )
+
+    def save_shards(self) -> None:
+        """
+        Persists our shards.
+        """
+
+        write_json(
+            get_job_path(self.job["id"], assets_defaults.JOB_SHARDS_FILE), self.shards
+        )
+
+    def delete_remote(self, shard: dict) -> None:
+        """
+        Cancels - best effort - the remote job of the given shard.
+        """
+
+        if shard["remote_id"] is None:
+            return
+
+        try:
+            self.session.delete(
+                self.get_url(shard["peer"], shard["remote_id"]),
+                timeout=core_settings.COORDINATOR_REQUEST_TIMEOUT,
+            )
+        except requests.RequestException:
+            pass
+
+    def reassign(self, shard: dict, results_stream) -> None:
+        """
+        Reassigns the subjects - not tested yet - of the given shard.
+        """
+
+        shard["state"] = "FAILED"
+        self.delete_remote(shard)
+
+        remaining = [x for x in shard["indexes"] if x not in self.done]
+
+        if not remaining:
+            return
+
+        failed_peers = {x["peer"] for x in self.shards if x["state"] == "FAILED"}
+        peers = get_ready_peers(self.session)
+        peers = [x for x in peers if x not in failed_peers] or peers
+        attempts = shard["attempts"] + 1
+
+        if attempts > core_settings.COORDINATOR_SHARD_RETRIES or not peers:
+            logging.critical(
+                "Could not test %d subject(s) of the %s job on any peer.",
+                len(remaining),
+                self.job["id"],
+            )
+
+            for index in remaining:
+                self.record(
+                    results_stream,
+                    {
+                        "index": index,
+                        "subject": self.subjects[index],
+                        "error": "Could not test the subject on any peer.",
+                    },
+                )
+                self.done.add(index)
+
+            return
+
+        logging.warning(
+            "Reassigning %d subject(s) of the %s job (attempt %d).",
+            len(remaining),
+            self.job["id"],
+            attempts,
+        )
+        self.build_shards(remaining, peers, attempts)
+
+    def advance(self, shard: dict, results_stream) -> None:
+        """
+        Submits the given shard or collects its new results.
+
+        :raise ShardLost:
+            When the peer lost the shard.
+        """
+
+        timeout = core_settings.COORDINATOR_REQUEST_TIMEOUT
+
+        if shard["remote_id"] is None:
+            req = self.session.post(
+                self.get_url(shard["peer"]),
+                json={
+                    "checker": self.job["checker"],
+                    "subjects": [self.subjects[x] for x in shard["indexes"]],
+                    "params": self.job["params"],
+                    "freshness": self.job.get("freshness"),
+                },
+                timeout=timeout,
+            )
+            req.raise_for_status()
+
+            shard["remote_id"] = req.json()["id"]
+            shard["state"] = "RUNNING"
+            return
+
+        req = self.session.get(
+            self.get_url(shard["peer"], shard["remote_id"]), timeout=timeout
+        )
+
+        if req.status_code == 404:
+            raise ShardLost("Unknown remote job.")
+
+        req.raise_for_status()
+        remote = req.json()
+
+        if remote["state"] == JobState.cancelled.value:
+            raise ShardLost("Remote job cancelled.")
+
+        while shard["fetched"] < remote["completed"]:
+            req = self.session.get(
+                self.get_url(shard["peer"], shard["remote_id"], "results"),
+                params={"offset": shard["fetched"], "limit": 1000},
+                timeout=timeout,
+            )
+            req.raise_for_status()
+            items = req.json()
+
+            if not items:
+                break
+
+            for item in items:
+                index = shard["indexes"][item["index"]]
+
+                if index not in self.done:
+                    self.record(
+                        results_stream,
+                        {
+                            "index": index,
+                            "subject": self.subjects[index],
+                            "status": item.get("status"),
+                            "error": item.get("error"),
+                            "stored": item.get("stored"),
+                        },
+                    )
+                    self.done.add(index)
+
+            shard["fetched"] += len(items)
+
+        if remote["state"] == JobState.done.value and shard["fetched"] >= len(
+            shard["indexes"]
+        ):
+            shard["state"] = "DONE"
+
+    def process(self) -> None:
+        job_id = self.job["id"]
+
+        self.done = self.load_checkpoint()
+        self.completed = len(self.done)
+
+        with open(
+            get_job_path(job_id, assets_defaults.JOB_SUBJECTS_FILE),
+            "r",
+            encoding="utf-8",
+            newline="\n",
+        ) as stream:
+            self.subjects = [x.rstrip("\n") for x in stream]
+
+        if self.job["state"] != JobState.running.value:
+            job = update_job(job_id, state=JobState.running.value)
+
+            if job is None:
+                logging.info("The %s job was deleted. Not running it.", job_id)
+                return
+
+            self.job = job
+
+        self.shards = read_shards(job_id) or []
+
+        while not self.shards and not self.stop_event.is_set():
+            peers = get_ready_peers(self.session)
+
+            if peers:
+                self.build_shards(
+                    [x for x in range(len(self.subjects)) if x not in self.done],
+                    peers,
+                    0,
+                )
+                self.save_shards()
+                break
+
+            logging.warning("No peer ready to run the %s job.", job_id)
+            self.stop_event.wait(core_settings.COORDINATOR_POLL_INTERVAL)
+
+        logging.info(
+            "Starting the %s distributed job (%d shard(s)).", job_id, len(self.shards)
+        )
+
+        cancelled = False
+
+        with open(
+            get_job_path(job_id, assets_defaults.JOB_RESULTS_FILE), "ab"
+        ) as results_stream:
+            while not self.stop_event.is_set():
+                active = [
+                    x for x in self.shards if x["state"] in SHARD_UNFINISHED_STATES
+                ]
+
+                if not active:
+                    break
+
+                for shard in active:
+                    try:
+                        self.advance(shard, results_stream)
+                        shard["errors"] = 0
+                    except ShardLost as exception:
+                        logging.warning(
+                            "Shard %s of the %s job lost by %s. (%s)",
+                            shard["id"],
+                            job_id,
+                            shard["peer"],
+                            exception,
+                        )
+                        self.reassign(shard, results_stream)
+                    except (
+                        requests.RequestException,
+                        ValueError,
+                        KeyError,
+                    ) as exception:
+                        shard["errors"] += 1
+                        logging.warning(
+                            "Could not reach %s for the %s job. (%s)",
+                            shard["peer"],
+                            job_id,
+                            exception,
+                        )
+
+                        if shard["errors"] >= core_settings.COORDINATOR_MAX_ERRORS:
+                            self.reassign(shard, results_stream)
+
+                # Results first: on crash, we fetch some results again instead
+                # of losing them.
+                self.checkpoint(results_stream)
+                self.save_shards()
+
+                if self.is_cancelled():
+                    cancelled = True
+                    break
+
+                self.stop_event.wait(core_settings.COORDINATOR_POLL_INTERVAL)
+
+            self.checkpoint(results_stream)
+            self.save_shards()
+
+        if cancelled:
+            for shard in self.shards:
+                if shard["state"] in SHARD_UNFINISHED_STATES:
+                    self.delete_remote(shard)
+
+        if cancelled or self.stop_event.is_set():
+            logging.info("Stopped the %s job.", job_id)
+            return
+
+        self.finish()
+
+
+# The runner of our distributed jobs.
+JOB_RUNNERS[True] = CoordinatorRunner
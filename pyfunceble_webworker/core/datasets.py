@@ -0,0 +1,533 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the management of the PyFunceble datasets.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Dict, Iterator, List, NamedTuple, Optional, Type
+
+import PyFunceble.storage
+import requests
+from PyFunceble.dataset.base import DatasetBase
+from PyFunceble.dataset.iana import IanaDataset
+from PyFunceble.dataset.ipv4_reputation import IPV4ReputationDataset
+from PyFunceble.dataset.public_suffix import PublicSuffixDataset
+from PyFunceble.dataset.user_agent import UserAgentDataset
+from PyFunceble.downloader.base import DownloaderBase
+from PyFunceble.downloader.iana import IANADownloader
+from PyFunceble.downloader.ipv4_reputation import IPV4ReputationDownloader
+from PyFunceble.downloader.public_suffix import PublicSuffixDownloader
+from PyFunceble.downloader.user_agents import UserAgentsDownloader
+from PyFunceble.helpers.dict import DictHelper
+from PyFunceble.helpers.directory import DirectoryHelper
+
+import pyfunceble_webworker.storage
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+from pyfunceble_webworker.core.settings import core_settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover ## Not available under Windows.
+    fcntl = None
+
+
+class Dataset(NamedTuple):
+    """
+    Describes one of the datasets we manage.
+    """
+
+    name: str
+    filename: str
+    downloader: Type[DownloaderBase]
+    dataset: Type[DatasetBase]
+    storage_index: Optional[str] = None
+
+
+DATASETS: Dict[str, Dataset] = {
+    "ipv4_reputation": Dataset(
+        "reputation",
+        PyFunceble.storage.IPV4_REPUTATION_FILENAME,
+        IPV4ReputationDownloader,
+        IPV4ReputationDataset,
+    ),
+    "user_agents": Dataset(
+        "user-agent",
+        PyFunceble.storage.USER_AGENT_FILENAME,
+        UserAgentsDownloader,
+        UserAgentDataset,
+        "USER_AGENTS",
+    ),
+    "psl": Dataset(
+        "PSL",
+        PyFunceble.storage.PUBLIC_SUFFIX_DUMP_FILENAME,
+        PublicSuffixDownloader,
+        PublicSuffixDataset,
+        "PUBLIC_SUFFIX",
+    ),
+    "iana": Dataset(
+        "IANA",
+        PyFunceble.storage.IANA_DUMP_FILENAME,
+        IANADownloader,
+        IanaDataset,
+        "IANA",
+    ),
+}
+"""
+The datasets we manage, indexed by the download time index of their
+downloader.
+"""
+
+
+def get_snapshot_directory() -> str:
+    """
+    Provides the directory where we persist the snapshot of the datasets.
+
+    This directory is shared by all the workers using the same data directory.
+    """
+
+    return os.path.join(
+        pyfunceble_webworker.storage.CONFIG_DIRECTORY,
+        assets_defaults.DATASETS_SNAPSHOT_DIRECTORY,
+    )
+
+
+@contextlib.contextmanager
+def snapshot_lock(blocking: bool = True) -> Iterator[None]:
+    """
+    Provides an exclusive lock over our snapshot directory.
+
+    Only one worker (of any process) can write into the snapshot directory at a
+    time. The others wait for the lock to be released.
+
+    .. note::
+        Without :code:`fcntl` (e.g. Windows), we don't lock.
+
+    :param blocking:
+        Whether we wait for the lock to be released.
+
+    :raise BlockingIOError:
+        When we don't wait and another worker holds the lock.
+    """
+
+    DirectoryHelper(get_snapshot_directory()).create()
+
+    with open(
+        os.path.join(get_snapshot_directory(), assets_defaults.DATASETS_LOCK_FILE),
+        "a",
+        encoding="utf-8",
+    ) as lock_stream:
+        if fcntl is not None:
+            fcntl.flock(
+                lock_stream.fileno(),
+                fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB,
+            )
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_stream.fileno(), fcntl.LOCK_UN)
+
+
+def write_dataset(destination: str, content: str) -> None:
+    """
+    Writes the given content into the given destination.
+
+    We write through a temporary file so that a reader never sees a partially
+    written dataset.
+    """
+
+    temp_destination = os.path.join(
+        os.path.dirname(destination), f".{os.path.basename(destination)}.tmp"
+    )
+
+    with open(temp_destination, "w", encoding="utf-8") as file_stream:
+        file_stream.write(content)
+
+    os.replace(temp_destination, destination)
+
+
+def is_valid_dataset(dataset: Dataset, content: str) -> bool:
+    """
+    Checks if the given content is a valid version of the given dataset.
+    """
+
+    if not content or not content.strip():
+        return False
+
+    if dataset.filename.endswith(".json"):
+        try:
+            return bool(json.loads(content))
+        except ValueError:
+            return False
+
+    return True
+
+
+def seed_snapshot(*sources: str, blocking: bool = True) -> List[str]:
+    """
+    Seeds our snapshot with the datasets it's missing, from the first of the
+    given source directories which provides them.
+
+    :param blocking:
+        Whether we wait for the worker holding the :py:func:`snapshot_lock`.
+
+    :raise BlockingIOError:
+        When we don't wait and another worker holds the lock.
+
+    :return:
+        The datasets which were seeded.
+    """
+
+    seeded = []
+    snapshot_directory = get_snapshot_directory()
+    downtimes_file = os.path.join(snapshot_directory, PyFunceble.storage.DOWN_FILENAME)
+
+    with snapshot_lock(blocking=blocking):
+        downtimes = DictHelper.from_json_file(downtimes_file)
+
+        for name, dataset in DATASETS.items():
+            if os.path.isfile(os.path.join(snapshot_directory, dataset.filename)):
+                continue
+
+            for source in sources:
+                source_file = os.path.join(source, dataset.filename)
+
+                if not source or not os.path.isfile(source_file):
+                    continue
+
+                with open(source_file, "r", encoding="utf-8") as file_stream:
+                    content = file_stream.read()
+
+                if not is_valid_dataset(dataset, content):
+                    continue
+
+                write_dataset(
+                    os.path.join(snapshot_directory, dataset.filename), content
+                )
+
+                source_downtimes = DictHelper.from_json_file(
+                    os.path.join(source, PyFunceble.storage.DOWN_FILENAME)
+                )
+
+                if name in source_downtimes:
+                    downtimes[name] = source_downtimes[name]
+
+                seeded.append(name)
+                break
+
+        if seeded:
+            DictHelper(downtimes).to_json_file(downtimes_file)
+
+    return seeded
+
+
+def link_datasets(destination: str) -> List[str]:
+    """
+    Links the datasets of our snapshot into the given destination.
+
+    The links make PyFunceble read the (shared) datasets of our snapshot. When
+    we can't link, we copy.
+
+    :return:
+        The datasets which were linked.
+    """
+
+    linked = []
+
+    for name, dataset in DATASETS.items():
+        source = os.path.join(get_snapshot_directory(), dataset.filename)
+        link = os.path.join(destination, dataset.filename)
+
+        if not os.path.isfile(source):
+            continue
+
+        if os.path.lexists(link):
+            os.remove(link)
+
+        try:
+            os.symlink(source, link)
+        except OSError:
+            shutil.copyfile(source, link)
+
+        linked.append(name)
+
+    return linked
+
+
+def restore_snapshot(*sources: str) -> List[str]:
+    """
+    Restores the datasets of our snapshot into the PyFunceble directory.
+
+    We never wait for the worker holding the :py:func:`snapshot_lock` - it may
+    be downloading for a while. The datasets our snapshot is missing are then
+    copied from the given sources instead.
+
+    :param sources:
+        The directories to seed our snapshot from - when it's missing some
+        datasets.
+
+    :return:
+        The datasets which were restored.
+    """
+
+    sources = [
+        x
+        for x in sources
+        if x and os.path.realpath(x) != os.path.realpath(get_snapshot_directory())
+    ]
+
+    try:
+        seed_snapshot(*sources, blocking=False)
+    except BlockingIOError:
+        logging.info("Snapshot locked by another worker. Not seeding it.")
+
+    restored = link_datasets(PyFunceble.storage.CONFIG_DIRECTORY)
+
+    for name, dataset in DATASETS.items():
+        if name in restored:
+            continue
+
+        destination = os.path.join(
+            PyFunceble.storage.CONFIG_DIRECTORY, dataset.filename
+        )
+
+        for source in sources:
+            source_file = os.path.join(source, dataset.filename)
+
+            if not os.path.isfile(source_file):
+                continue
+
+            if os.path.lexists(destination):
+                # May be a (dangling) link into our snapshot.
+                os.remove(destination)
+
+            shutil.copyfile(source_file, destination)
+            restored.append(name)
+            break
+
+    return restored
+
+
+def get_metadata_file() -> str:
+    """
+    Provides the path of the file holding the validators of our datasets.
+    """
+
+    return os.path.join(
+        get_snapshot_directory(), assets_defaults.DATASETS_METADATA_FILE
+    )
+
+
+def download_dataset(name: str, metadata: dict) -> bool:
+    """
+    Downloads the given dataset into our snapshot - if the last download
+    expired.
+
+    The download is conditional (ETag / Last-Modified) and the downloaded
+    content is compared (hash) to the one we already have. The dataset is only
+    written when it really changed.
+
+    .. warning::
+        Should only be called while holding the :py:func:`snapshot_lock`.
+
+    :param metadata:
+        The validators of all our datasets. The entry of the given dataset is
+        updated in place.
+
+    :return:
+        Whether a new version was written.
+    """
+
+    dataset = DATASETS[name]
+    downloader = dataset.downloader()
+    downloader.set_destination(os.path.join(get_snapshot_directory(), dataset.filename))
+    downloader.downtimes_file.set_path(
+        os.path.join(get_snapshot_directory(), PyFunceble.storage.DOWN_FILENAME)
+    )
+
+    # The registry of download times is shared by all downloaders (class level).
+    # Only the one of our snapshot matters.
+    downloader.all_downtimes.clear()
+    downloader.all_downtimes.update(downloader.get_all_downtimes())
+
+    if not downloader.authorized or not downloader.is_last_download_expired():
+        return False
+
+    if name in core_settings.DATASETS_LINKS:
+        downloader.set_download_link(str(core_settings.DATASETS_LINKS[name]))
+
+    validators = metadata.setdefault(name, {})
+    headers = {}
+
+    if os.path.isfile(downloader.destination):
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    req = requests.get(
+        downloader.download_link,
+        headers=headers,
+        timeout=core_settings.DATASETS_DOWNLOAD_TIMEOUT,
+    )
+
+    if req.status_code == 304:
+        changed = False
+    elif req.status_code == 200:
+        content = req.text
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        changed = digest != validators.get("sha256") or not os.path.isfile(
+            downloader.destination
+        )
+
+        if changed:
+            if not is_valid_dataset(dataset, content):
+                raise ValueError("Invalid dataset downloaded.")
+
+            write_dataset(downloader.destination, content)
+
+        validators["sha256"] = digest
+        validators["etag"] = req.headers.get("ETag")
+        validators["last_modified"] = req.headers.get("Last-Modified")
+    else:
+        raise requests.HTTPError(
+            f"Unexpected status code: {req.status_code}", response=req
+        )
+
+    downloader.set_current_downtime()
+    downloader.save_all_downtimes()
+
+    return changed
+
+
+def load_datasets() -> bool:
+    """
+    Loads the datasets into memory so that our first requests do not have to.
+
+    A dataset is only reloaded when its file changed since we last loaded it.
+
+    :return:
+        Whether all datasets are loaded.
+    """
+
+    loaded = pyfunceble_webworker.storage.LOADED_DATASETS
+
+    for name, dataset in DATASETS.items():
+        try:
+            modified_at = os.stat(
+                os.path.join(PyFunceble.storage.CONFIG_DIRECTORY, dataset.filename)
+            ).st_mtime_ns
+
+            if loaded.get(name) == modified_at:
+                continue
+
+            if dataset.storage_index is not None:
+                setattr(PyFunceble.storage, dataset.storage_index, dict())
+
+            content = dataset.dataset().get_content()
+
+            if dataset.storage_index is None:
+                # This dataset is not cached in memory, we only ensure it's there.
+                content.close()
+        except (FileNotFoundError, OSError, ValueError) as exception:
+            logging.critical(
+                "Could not load PyFunceble's %s dataset. (%s)", dataset.name, exception
+            )
+            loaded.pop(name, None)
+        else:
+            loaded[name] = modified_at
+
+    return all(x in loaded for x in DATASETS)
+
+
+def update_datasets() -> None:
+    """
+    Updates the datasets of our snapshot and reloads (into memory) the ones
+    which changed.
+
+    Only one worker downloads at a time. The others wait for it to finish and
+    find the datasets up-to-date. A dataset which could not be updated stays as
+    it is.
+    """
+
+    with snapshot_lock():
+        metadata = DictHelper.from_json_file(get_metadata_file())
+
+        for name, dataset in DATASETS.items():
+            logging.info("Starting to update PyFunceble's %s dataset.", dataset.name)
+
+            try:
+                changed = download_dataset(name, metadata)
+            except Exception as exception:  # pylint: disable=broad-except
+                logging.critical(
+                    "Could not update PyFunceble's %s dataset. (%s)",
+                    dataset.name,
+                    exception,
+                )
+                continue
+
+            if changed:
+                logging.info(
+                    "Finished to update PyFunceble's %s dataset.", dataset.name
+                )
+            else:
+                logging.info("PyFunceble's %s dataset did not change.", dataset.name)
+
+        DictHelper(metadata).to_json_file(get_metadata_file())
+
+    link_datasets(PyFunceble.storage.CONFIG_DIRECTORY)
+    load_datasets()
@@ -90,3 +90,92 @@ OVERWRITE_CONFIG_FILE: str = ".PyFunceble.overwrite.yaml"
 """
 The name of the file to use to overwrite the PyFunceble configuration.
 """
+
+LOCATION_FILE: str = "location.json"
+"""
+The name of the file (under our data directory) where we persist the location
+of the current node.
+"""
+
+DATASETS_SNAPSHOT_DIRECTORY: str = "datasets"
+"""
+The name of the directory (under our data directory) where we persist the
+snapshot of the PyFunceble datasets.
+"""
+
+DATASETS_METADATA_FILE: str = ".metadata.json"
+"""
+The name of the file (under our snapshot directory) where we keep the
+validators (ETag, Last-Modified and hash) of the datasets of our snapshot.
+"""
+
+DATASETS_LOCK_FILE: str = ".lock"
+"""
+The name of the file (under our snapshot directory) used to elect the worker
+which is allowed to write into the snapshot.
+"""
+
+JOBS_DIRECTORY: str = "jobs"
+"""
+The name of the directory (under our data directory) where we persist our bulk
+jobs.
+"""
+
+JOB_FILE: str = "job.json"
+"""
+The name of the file (under the directory of a job) which describes the job.
+"""
+
+JOB_SUBJECTS_FILE: str = "subjects.txt"
+"""
+The name of the file (under the directory of a job) which lists the subjects
+to test.
+"""
+
+JOB_RESULTS_FILE: str = "results.jsonl"
+"""
+The name of the file (under the directory of a job) where we checkpoint the
+results of the tested subjects.
+"""
+
+JOB_SHARDS_FILE: str = "shards.json"
+"""
+The name of the file (under the directory of a distributed job) which describes
+the shards of the job.
+"""
+
+PEERS_FILE: str = "peers.json"
+"""
+The name of the file (under our data directory) where we persist the peers
+registered to our coordinator.
+"""
+
+PEERS_LOCK_FILE: str = ".peers.lock"
+"""
+The name of the file (under our data directory) used to serialize the updates
+of our registered peers.
+"""
+
+JOB_LOCK_FILE: str = ".lock"
+"""
+The name of the file (under the directory of a job) used to elect the worker
+which runs the job.
+"""
+
+JOB_UPDATE_LOCK_FILE: str = ".update.lock"
+"""
+The name of the file (under the directory of a job) used to serialize the
+updates of the description of the job.
+"""
+
+HISTORY_FILE: str = "history.sqlite3"
+"""
+The name of the file (under our data directory) where we record the results of
+our checkers.
+"""
+
+TRACES_FILE: str = "traces.jsonl"
+"""
+The name of the file (under our data directory) where we export our spans -
+when no other file is given.
+"""
@@ -60,3 +60,26 @@ URL_PREFIX: str = V1_URL_PREFIX
 """
 The prefix of all URL.
 """
+
+EXPENSIVE_ROUTES: tuple = (
+    f"{V1_URL_PREFIX}/availability",
+    f"{V1_URL_PREFIX}/reputation",
+    f"{V1_URL_PREFIX}/coordinator",
+)
+"""
+The prefix of the routes which rely on network lookups (DNS, WHOIS, HTTP) - or
+on requests to our peers.
+"""
+
+CHEAP_ROUTES: tuple = (
+    f"{V1_URL_PREFIX}/syntax",
+    f"{V1_URL_PREFIX}/converter",
+    f"{V1_URL_PREFIX}/jobs",
+)
+"""
+The prefix of the routes which are computed locally.
+
+.. note::
+    The subjects of a job are charged - at submission - as requests to the
+    equivalent single-subject route.
+"""
@@ -0,0 +1,896 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the DNS cache of the worker and the
+prefetching of the DNS records our bulk jobs are about to query.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import functools
+import ipaddress
+import threading
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import dns.asyncquery
+import dns.exception
+import dns.flags
+import dns.message
+import dns.query
+import dns.rcode
+import dns.rdatatype
+import domain2idna
+from PyFunceble.checker.syntax.domain import DomainSyntaxChecker
+from PyFunceble.checker.syntax.ip import IPSyntaxChecker
+from PyFunceble.converter.url2netloc import Url2Netloc
+from PyFunceble.query.dns.nameserver import Nameservers
+from PyFunceble.query.dns.query_tool import DNSQueryTool
+
+from pyfunceble_webworker.core.settings import core_settings
+
+SUBDOMAIN_LOOKUP_ORDER: Tuple[str, ...] = ("NS", "A", "AAAA", "CNAME", "DNAME")
+"""
+The order in which the availability checkers of PyFunceble query the records
+of a subdomain.
+"""
+
+DOMAIN_LOOKUP_ORDER: Tuple[str, ...] = ("NS", "CNAME", "A", "AAAA", "DNAME")
+"""
+The order in which the availability checkers of PyFunceble query the records
+of a (second level) domain.
+"""
+
+MAX_CNAME_DEPTH: int = 60
+"""
+The maximum length of the CNAME chains followed by the HTTP adapter of
+PyFunceble.
+"""
+
+FAILURES = (dns.exception.Timeout, OSError)
+"""
+The failures of a query we cache.
+"""
+
+CachedResponse = Union[dns.message.Message, Exception]
+
+
+class DNSCache:
+    """
+    Provides a cache of DNS responses which honours their TTL.
+
+    Responses are cached per nameserver - and protocol - so that the order of
+    the nameservers of PyFunceble keeps its meaning. Negative responses
+    (NXDOMAIN or no data) are cached as long as told by the SOA record of their
+    authority section. Failures (timeouts, SERVFAIL, REFUSED, ...) are cached -
+    as recommended by RFC 9520 - for :code:`failure_ttl` seconds so that a
+    check never waits twice for the same dead nameserver. Truncated responses
+    are never cached.
+
+    A query of a key which is already being queried waits for the running query
+    instead of sending its own.
+
+    :param max_size:
+        The maximum number of cached responses. :code:`0` to disable the cache.
+    :param max_ttl:
+        The maximum time (in seconds) a response is cached.
+    :param negative_ttl:
+        The time (in seconds) a negative response without SOA record is cached.
+    :param failure_ttl:
+        The time (in seconds) a failure is cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        max_ttl: float = 300.0,
+        negative_ttl: float = 60.0,
+        failure_ttl: float = 5.0,
+    ) -> None:
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.failure_ttl = failure_ttl
+
+        self.lock = threading.Lock()
+        self.entries: Dict[tuple, Tuple[float, CachedResponse]] = (
+            collections.OrderedDict()
+        )
+        self.running: Dict[tuple, threading.Event] = {}
+        # Only touched from our event loop.
+        self.running_async: Dict[tuple, asyncio.Event] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Tells whether the cache is enabled at all.
+        """
+
+        return self.max_size > 0
+
+    @staticmethod
+    def get_key(protocol: str, query: dns.message.Message, where: str, port) -> tuple:
+        """
+        Provides the key of the given query.
+        """
+
+        question = query.question[0]
+
+        return (
+            protocol,
+            where,
+            port,
+            query.flags,
+            question.name,
+            question.rdtype,
+            question.rdclass,
+        )
+
+    def get_ttl(self, response: dns.message.Message) -> Optional[float]:
+        """
+        Provides the time (in seconds) the given response can be cached.
+
+        :return:
+            The TTL or :code:`None` when the response should not be cached.
+        """
+
+        if response.flags & dns.flags.TC:
+            return None
+
+        if response.rcode() not in (dns.rcode.NOERROR, dns.rcode.NXDOMAIN):
+            return min(self.failure_ttl, self.max_ttl)
+
+        if response.rcode() == dns.rcode.NOERROR and response.answer:
+            return min(min(x.ttl for x in response.answer), self.max_ttl)
+
+        for rrset in response.authority:
+            if rrset.rdtype == dns.rdatatype.SOA and len(rrset) > 0:
+                return min(rrset.ttl, rrset[0].minimum, self.max_ttl)
+
+        return min(self.negative_ttl, self.max_ttl)
+
+    def lookup(self, key: tuple) -> Optional[CachedResponse]:
+        """
+        Provides the (fresh) cached response - or failure - of the given key.
+
+        .. warning::
+            The lock must be held by the caller.
+        """
+
+        try:
+            expires_at, response = self.entries[key]
+        except KeyError:
+            return None
+
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        return response
+
+    @staticmethod
+    def unpack(response: CachedResponse) -> dns.message.Message:
+        """
+        Provides the given cached response.
+
+        :raise Exception:
+            When a failure was cached.
+        """
+
+        if isinstance(response, Exception):
+            raise copy.copy(response)
+
+        return response
+
+    def store(self, key: tuple, response: CachedResponse) -> None:
+        """
+        Caches the given response - or failure - if cacheable.
+        """
+
+        if isinstance(response, Exception):
+            ttl = min(self.failure_ttl, self.max_ttl)
+        else:
+            ttl = self.get_ttl(response)
+
+        if not ttl or ttl <= 0:
+            return
+
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, response)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def fetch(self, key: tuple, func: Callable, *args, **kwargs) -> dns.message.Message:
+        """
+        Queries the given key through the given function and caches the
+        outcome.
+        """
+
+        with self.lock:
+            self.misses += 1
+
+        try:
+            response = func(*args, **kwargs)
+        except FAILURES as exception:
+            self.store(key, exception)
+            raise
+
+        self.store(key, response)
+
+        return response
+
+    async def fetch_async(
+        self, key: tuple, func: Callable, *args, **kwargs
+    ) -> dns.message.Message:
+        """
+        Queries the given key through the given coroutine function and caches
+        the outcome.
+        """
+
+        with self.lock:
+            self.misses += 1
+
+        try:
+            response = await func(*args, **kwargs)
+        except FAILURES as exception:
+            self.store(key, exception)
+            raise
+
+        self.store(key, response)
+
+        return response
+
+    def query(self, key: tuple, func: Callable, *args, **kwargs) -> dns.message.Message:
+        """
+        Provides the cached response of the given key or queries it through
+        the given function.
+        """
+
+        with self.lock:
+            response = self.lookup(key)
+
+            if response is None:
+                event = self.running.get(key)
+
+                if event is None:
+                    self.running[key] = threading.Event()
+
+        if response is not None:
+            return self.unpack(response)
+
+        if event is not None:
+            event.wait()
+
+            with self.lock:
+                response = self.lookup(key)
+
+            if response is not None:
+                return self.unpack(response)
+
+            # The running query was not cacheable: we query on our own.
+            return self.fetch(key, func, *args, **kwargs)
+
+        try:
+            return self.fetch(key, func, *args, **kwargs)
+        finally:
+            with self.lock:
+                self.running.pop(key).set()
+
+    async def query_async(
+        self, key: tuple, func: Callable, *args, **kwargs
+    ) -> dns.message.Message:
+        """
+        Provides the cached response of the given key or queries it through
+        the given coroutine function.
+        """
+
+        with self.lock:
+            response = self.lookup(key)
+
+        if response is not None:
+            return self.unpack(response)
+
+        event = self.running_async.get(key)
+
+        if event is not None:
+            await event.wait()
+
+            with self.lock:
+                response = self.lookup(key)
+
+            if response is not None:
+                return self.unpack(response)
+
+            return await self.fetch_async(key, func, *args, **kwargs)
+
+        event = self.running_async[key] = asyncio.Event()
+
+        try:
+            return await self.fetch_async(key, func, *args, **kwargs)
+        finally:
+            del self.running_async[key]
+            event.set()
+
+    def wrap(self, func: Callable, protocol: str) -> Callable:
+        """
+        Wraps the given :py:mod:`dns.query` (or :py:mod:`dns.asyncquery`)
+        function so that its responses are cached.
+        """
+
+        def reply(response, query):
+            if response.id != query.id:
+                # Cached responses are shared: we never touch them.
+                response = copy.copy(response)
+                response.id = query.id
+
+            return response
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(query, where, *args, **kwargs):
+                if not self.enabled or not query.question:
+                    return await func(query, where, *args, **kwargs)
+
+                key = self.get_key(protocol, query, where, kwargs.get("port"))
+
+                return reply(
+                    await self.query_async(key, func, query, where, *args, **kwargs),
+                    query,
+                )
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(query, where, *args, **kwargs):
+                if not self.enabled or not query.question:
+                    return func(query, where, *args, **kwargs)
+
+                key = self.get_key(protocol, query, where, kwargs.get("port"))
+
+                return reply(
+                    self.query(key, func, query, where, *args, **kwargs), query
+                )
+
+        wrapper.__wrapped_by_cache__ = True
+        return wrapper
+
+    def clear(self) -> None:
+        """
+        Empties the cache.
+        """
+
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Provides the statistics of the cache.
+        """
+
+        with self.lock:
+            return {"size": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+
+class DNSLookup(NamedTuple):
+    """
+    Describes a DNS lookup of a checker.
+
+    :param subject:
+        The subject to query.
+    :param record_types:
+        The record types to query - in order - until one of them gives an
+        answer.
+    :param follow_cname:
+        Whether the CNAME chain of the subject is followed first - as the HTTP
+        adapter of PyFunceble does - and the record types queried against its
+        end.
+    """
+
+    subject: str
+    record_types: Tuple[str, ...]
+    follow_cname: bool = False
+
+
+def get_availability_lookups(kwargs: dict, subject: str) -> List[DNSLookup]:
+    """
+    Provides the DNS lookups our availability checkers run against the given
+    subject.
+    """
+
+    subject = domain2idna.domain2idna(subject)
+    domain_syntax_checker = DomainSyntaxChecker(subject)
+    result = []
+
+    if kwargs.get("use_dns_lookup"):
+        if domain_syntax_checker.is_valid_subdomain():
+            result.append(DNSLookup(subject, SUBDOMAIN_LOOKUP_ORDER))
+        elif IPSyntaxChecker(subject).is_valid():
+            result.append(DNSLookup(subject, ("PTR",)))
+        elif domain_syntax_checker.is_valid():
+            result.append(DNSLookup(subject, DOMAIN_LOOKUP_ORDER))
+
+    if (
+        kwargs.get("use_http_code_lookup") or kwargs.get("use_extra_rules")
+    ) and domain_syntax_checker.is_valid():
+        # The HTTP requests resolve the subject too.
+        result.append(DNSLookup(subject, ("A",), follow_cname=True))
+
+    return result
+
+
+def get_url_availability_lookups(kwargs: dict, subject: str) -> List[DNSLookup]:
+    """
+    Provides the DNS lookups our URL availability checker runs against the
+    given subject.
+    """
+
+    # The DNS lookup always runs - against the URL base - to take URLs down.
+    return get_availability_lookups(
+        {**kwargs, "use_dns_lookup": True}, Url2Netloc(subject).get_converted()
+    )
+
+
+def get_reputation_lookups(
+    kwargs: dict, subject: str  # pylint: disable=unused-argument
+) -> List[DNSLookup]:
+    """
+    Provides the DNS lookups our domain reputation checkers run against the
+    given subject.
+    """
+
+    subject = domain2idna.domain2idna(subject)
+
+    if DomainSyntaxChecker(subject).is_valid():
+        return [DNSLookup(subject, ("A",))]
+
+    return []
+
+
+def get_url_reputation_lookups(
+    kwargs: dict, subject: str  # pylint: disable=unused-argument
+) -> List[DNSLookup]:
+    """
+    Provides the DNS lookups our URL reputation checker runs against the given
+    subject.
+    """
+
+    netloc = Url2Netloc(subject).get_converted()
+
+    if DomainSyntaxChecker(netloc).is_valid():
+        return [DNSLookup(netloc, ("A",))]
+
+    return []
+
+
+class DNSPrefetcher:
+    """
+    Provides the prefetching of the DNS records of upcoming subjects.
+
+    The subjects read through :py:meth:`iter_ahead` are resolved -
+    :code:`look_ahead` subjects ahead of their consumer and at most
+    :code:`max_in_flight` at the same time - so that their checkers find the
+    responses in our cache.
+
+    :param get_lookups:
+        Provides the DNS lookups of a subject. :code:`None` to disable the
+        prefetching.
+    :param max_in_flight:
+        The maximum number of subjects resolved at the same time. :code:`0` to
+        disable the prefetching.
+    :param look_ahead:
+        The number of subjects we read ahead of their consumer.
+    """
+
+    def __init__(
+        self,
+        get_lookups: Optional[Callable[[str], List[DNSLookup]]],
+        *,
+        max_in_flight: int = 32,
+        look_ahead: int = 256,
+    ) -> None:
+        self.get_lookups = get_lookups
+        self.max_in_flight = max_in_flight
+        self.look_ahead = look_ahead
+
+        self.executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.pending: Dict[str, concurrent.futures.Future] = {}
+
+    def __enter__(self) -> "DNSPrefetcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Tells whether we prefetch at all.
+        """
+
+        return self.get_lookups is not None and self.max_in_flight > 0
+
+    def prefetch(self, subject: str) -> None:
+        """
+        Runs the DNS lookups of the given subject - as its checker would.
+        """
+
+        try:
+            query_tool = self.local.query_tool
+        except AttributeError:
+            query_tool = self.local.query_tool = DNSQueryTool()
+
+        for lookup in self.get_lookups(subject):
+            run_lookup(query_tool, lookup)
+
+    def submit(self, subject: str) -> None:
+        """
+        Schedules the prefetching of the given subject - unless already
+        scheduled.
+        """
+
+        with self.lock:
+            if subject in self.pending:
+                return
+
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_in_flight, thread_name_prefix="dns-prefetch"
+                )
+
+            future = self.pending[subject] = self.executor.submit(
+                self.prefetch, subject
+            )
+
+        future.add_done_callback(functools.partial(self.forget, subject))
+
+    def forget(
+        self,
+        subject: str,
+        future: concurrent.futures.Future,  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Forgets the given (done) prefetching.
+        """
+
+        with self.lock:
+            self.pending.pop(subject, None)
+
+    def iter_ahead(self, items: Iterator[Tuple[int, str]]) -> Iterator[Tuple[int, str]]:
+        """
+        Provides the given index and subject pairs while prefetching the
+        upcoming ones.
+        """
+
+        if not self.enabled:
+            yield from items
+            return
+
+        buffer = collections.deque()
+
+        for item in items:
+            buffer.append(item)
+            self.submit(item[1])
+
+            if len(buffer) > self.look_ahead:
+                yield buffer.popleft()
+
+        while buffer:
+            yield buffer.popleft()
+
+    def shutdown(self) -> None:
+        """
+        Cancels the pending prefetching and stops our threads.
+        """
+
+        with self.lock:
+            pending = list(self.pending.values())
+            executor, self.executor = self.executor, None
+
+        for future in pending:
+            future.cancel()
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def run_lookup(query_tool: DNSQueryTool, lookup: DNSLookup) -> None:
+    """
+    Runs the given DNS lookup through the given query tool.
+    """
+
+    subject = lookup.subject
+
+    if lookup.follow_cname:
+        chain = []
+
+        while len(chain) < MAX_CNAME_DEPTH:
+            result = (
+                query_tool.set_query_record_type("CNAME").set_subject(subject).query()
+            )
+
+            if not result or any(x in chain for x in result):
+                break
+
+            chain.extend(result)
+            subject = result[0]
+
+        subject = chain[-1] if chain else lookup.subject
+
+    query_tool.set_subject(subject)
+
+    for record_type in lookup.record_types:
+        if query_tool.set_query_record_type(record_type).query():
+            break
+
+
+async def query_async(query_tool: DNSQueryTool, record_type: str) -> List[str]:
+    """
+    Queries - on the event loop - the given record of the subject of the given
+    query tool the way the tool would: same query, nameservers, protocol and
+    order.
+    """
+
+    query_tool.set_query_record_type(record_type)
+
+    if query_tool.query_message is None:
+        return []
+
+    protocol = query_tool.preferred_protocol.lower()
+
+    if protocol == "https":
+        nameservers = dict.fromkeys(query_tool.nameservers.get_nameservers())
+    else:
+        nameservers = query_tool.nameservers.get_nameserver_ports()
+
+    # pylint: disable=protected-access
+    for nameserver, port in query_tool._mix_order(nameservers).items():
+        kwargs = {"timeout": query_tool.query_timeout}
+
+        if port is not None:
+            kwargs["port"] = 853 if protocol == "tls" and port == 53 else port
+
+        try:
+            response = await getattr(dns.asyncquery, protocol)(
+                query_tool.query_message, nameserver, **kwargs
+            )
+        except (
+            dns.exception.Timeout,
+            OSError,
+            dns.query.UnexpectedSource,
+            dns.query.BadResponse,
+        ):
+            continue
+        except ValueError:
+            break
+
+        result = query_tool._get_result_from_response(response)
+
+        if result or query_tool.trust_server:
+            return result
+
+    return []
+
+
+def install_async_query_tool() -> DNSQueryTool:
+    """
+    Builds - off the event loop - the query tool our asynchronous lookups are
+    copied from.
+
+    .. note::
+        A new query tool (re)guesses - and may resolve - the nameservers shared
+        by all query tools. This must therefore be installed once PyFunceble's
+        configuration is loaded.
+    """
+
+    global ASYNC_QUERY_TOOL  # pylint: disable=global-statement
+
+    ASYNC_QUERY_TOOL = DNSQueryTool()
+
+    return ASYNC_QUERY_TOOL
+
+
+async def run_lookup_async(lookup: DNSLookup) -> List[str]:
+    """
+    Runs - on the event loop - the given DNS lookup.
+
+    :return:
+        The answer of the first record type which gave one.
+    """
+
+    # Only the subject and the record type are specific to a lookup.
+    query_tool = copy.copy(ASYNC_QUERY_TOOL or install_async_query_tool())
+    subject = lookup.subject
+
+    if lookup.follow_cname:
+        chain = []
+
+        while len(chain) < MAX_CNAME_DEPTH:
+            result = await query_async(query_tool.set_subject(subject), "CNAME")
+
+            if not result or any(x in chain for x in result):
+                break
+
+            chain.extend(result)
+            subject = result[0]
+
+        subject = chain[-1] if chain else lookup.subject
+
+    query_tool.set_subject(subject)
+
+    for record_type in lookup.record_types:
+        result = await query_async(query_tool, record_type)
+
+        if result:
+            return result
+
+    return []
+
+
+async def resolve_host_async(hostname: str) -> Optional[str]:
+    """
+    Resolves - on the event loop - the IP of the given hostname the way the
+    HTTP adapter of PyFunceble does: through the A record at the end of its
+    CNAME chain.
+    """
+
+    try:
+        ipaddress.ip_address(hostname)
+    except ValueError:
+        pass
+    else:
+        return hostname
+
+    result = await run_lookup_async(DNSLookup(hostname, ("A",), follow_cname=True))
+
+    return result[0] if result else None
+
+
+async def resolve_all_async(lookups: Sequence[DNSLookup]) -> None:
+    """
+    Runs - concurrently, on the event loop - the given DNS lookups so that the
+    checker running them next finds their responses in our cache instead of
+    waiting for them in one of our threads.
+    """
+
+    if DNS_CACHE.enabled and lookups:
+        await asyncio.gather(*(run_lookup_async(x) for x in lookups))
+
+
+DNS_CACHE = DNSCache()
+"""
+The DNS cache of the worker.
+"""
+
+ASYNC_QUERY_TOOL: Optional[DNSQueryTool] = None
+"""
+The query tool our asynchronous lookups are copied from.
+"""
+
+
+def install_atomic_nameservers() -> None:
+    """
+    Makes the (re)configuration of the nameservers of PyFunceble atomic.
+
+    .. note::
+        The nameservers are shared by all query tools - hence by all checks -
+        and reconfigured by each new one. Without this, a concurrent check may
+        see them empty and end up with an empty DNS lookup.
+    """
+
+    func = Nameservers.set_nameservers
+
+    if hasattr(func, "__wrapped_by_atomic__"):
+        return
+
+    @functools.wraps(func)
+    def set_nameservers(self, value):
+        staging = copy.copy(self)
+        func(staging, value)
+
+        self.nameserver_ports = staging.nameserver_ports
+        self.nameservers = staging.nameservers
+
+        return self
+
+    set_nameservers.__wrapped_by_atomic__ = True
+    Nameservers.set_nameservers = set_nameservers
+
+
+def install_dns_cache() -> None:
+    """
+    Configures our DNS cache from our settings and installs it in front of the
+    queries of PyFunceble.
+
+    .. note::
+        The cache is installed at the :py:mod:`dns.query` (and
+        :py:mod:`dns.asyncquery`) level - in front of our limits so that cached
+        responses are not limited.
+    """
+
+    DNS_CACHE.max_size = (
+        core_settings.DNS_CACHE_MAX_SIZE if core_settings.DNS_CACHE_ENABLED else 0
+    )
+    DNS_CACHE.max_ttl = core_settings.DNS_CACHE_MAX_TTL
+    DNS_CACHE.negative_ttl = core_settings.DNS_CACHE_NEGATIVE_TTL
+    DNS_CACHE.failure_ttl = core_settings.DNS_CACHE_FAILURE_TTL
+    DNS_CACHE.clear()
+
+    if not DNS_CACHE.enabled:
+        return
+
+    for module in (dns.query, dns.asyncquery):
+        for name in ("udp", "tcp", "https", "tls"):
+            func = getattr(module, name)
+
+            if not hasattr(func, "__wrapped_by_cache__"):
+                setattr(module, name, DNS_CACHE.wrap(func, name))
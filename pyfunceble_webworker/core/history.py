@@ -0,0 +1,450 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the (append-only) store of the results of our
+checkers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import collections
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple, Type
+
+import orjson
+from pydantic import BaseModel
+from PyFunceble import (
+    DomainAndIPAvailabilityChecker,
+    DomainAndIPReputationChecker,
+    DomainAvailabilityChecker,
+    DomainReputationChecker,
+    IPAvailabilityChecker,
+    IPReputationChecker,
+    URLAvailabilityChecker,
+    URLReputationChecker,
+)
+from PyFunceble.helpers.directory import DirectoryHelper
+
+import pyfunceble_webworker.storage
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+from pyfunceble_webworker.core.responses import encode_default, project
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.models.availability import AvailabilityStatus
+from pyfunceble_webworker.models.jobs import JobChecker
+from pyfunceble_webworker.models.reputation import ReputationStatus
+
+HISTORY_CHECKERS: Dict[Type, Tuple[JobChecker, Type[BaseModel]]] = {
+    DomainAvailabilityChecker: (JobChecker.availability_domain, AvailabilityStatus),
+    IPAvailabilityChecker: (JobChecker.availability_ip, AvailabilityStatus),
+    URLAvailabilityChecker: (JobChecker.availability_url, AvailabilityStatus),
+    DomainAndIPAvailabilityChecker: (
+        JobChecker.availability_domain_and_ip,
+        AvailabilityStatus,
+    ),
+    DomainReputationChecker: (JobChecker.reputation_domain, ReputationStatus),
+    IPReputationChecker: (JobChecker.reputation_ip, ReputationStatus),
+    URLReputationChecker: (JobChecker.reputation_url, ReputationStatus),
+    DomainAndIPReputationChecker: (
+        JobChecker.reputation_domain_and_ip,
+        ReputationStatus,
+    ),
+}
+"""
+The checkers whose results we record - and under which name. The syntax of a
+subject never changes: it has no history worth recording.
+"""
+
+MAX_QUEUE_SIZE: int = 65536
+"""
+The maximum number of results waiting to be written. Results over it are
+dropped.
+"""
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS results (
+    subject TEXT NOT NULL,
+    checker TEXT NOT NULL,
+    tested_at REAL NOT NULL,
+    status TEXT,
+    status_source TEXT,
+    params TEXT,
+    result BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_subject ON results (subject, checker, tested_at);
+CREATE INDEX IF NOT EXISTS results_tested_at ON results (tested_at);
+"""
+"""
+The schema of our store. Results are only ever inserted - and deleted once
+expired.
+"""
+
+
+def get_params_key(params: Any) -> Optional[str]:
+    """
+    Provides the key under which the results tested with the given parameters
+    are recorded.
+    """
+
+    if params is None:
+        return None
+
+    return orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def get_checker_params_key(checker: Type, kwargs: dict) -> Optional[str]:
+    """
+    Provides the key under which the given checker - initialized with the given
+    arguments - records its results.
+    """
+
+    _, model = HISTORY_CHECKERS[checker]
+
+    return get_params_key(
+        project(model, {"params": checker(**kwargs).params}).get("params")
+    )
+
+
+def encode_result(checker: Type, status: Any) -> tuple:
+    """
+    Provides the row of the given status of the given checker.
+    """
+
+    name, model = HISTORY_CHECKERS[checker]
+    result = project(model, status)
+
+    return (
+        result["subject"],
+        name.value,
+        result["tested_at"].timestamp(),
+        result["status"],
+        result["status_source"],
+        get_params_key(result.get("params")),
+        orjson.dumps(result, default=encode_default, option=orjson.OPT_UTC_Z),
+    )
+
+
+class HistoryStore:
+    """
+    Provides our (append-only) store of the results of our checkers.
+
+    Recording a result only queues it: the queued results are written - in
+    batches - by a background thread.
+
+    :param path:
+        The path of our (SQLite) database. It may be shared by multiple
+        workers.
+    :param batch_size:
+        The maximum number of results written at once.
+    :param flush_interval:
+        The maximum time (in seconds) a result waits before being written.
+    """
+
+    def __init__(self, path: str, *, batch_size: int, flush_interval: float) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.queue: Deque[Tuple[Type, Any]] = collections.deque()
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.dropped = 0
+
+        with contextlib.closing(self.connect()) as connection:
+            connection.executescript(SCHEMA)
+
+        self.thread = threading.Thread(
+            target=self.run, name="pyfunceble-history", daemon=True
+        )
+        self.thread.start()
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Provides a new connection to our database.
+        """
+
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        # Readers never block our writers - and the other way around.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        return connection
+
+    def record(self, checker: Type, status: Any) -> None:
+        """
+        Queues the given status of the given checker.
+        """
+
+        if checker not in HISTORY_CHECKERS:
+            return
+
+        with self.condition:
+            if self.stopped or len(self.queue) >= MAX_QUEUE_SIZE:
+                self.dropped += 1
+                return
+
+            self.queue.append((checker, status))
+
+            if len(self.queue) >= self.batch_size:
+                self.condition.notify()
+
+    def run(self) -> None:
+        """
+        Writes the queued results until we are stopped.
+        """
+
+        connection = self.connect()
+
+        while True:
+            with self.condition:
+                if not self.stopped and len(self.queue) < self.batch_size:
+                    self.condition.wait(self.flush_interval)
+
+                batch = [
+                    self.queue.popleft()
+                    for _ in range(min(len(self.queue), self.batch_size))
+                ]
+                done = self.stopped and not self.queue
+
+            if batch:
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [encode_result(*x) for x in batch],
+                        )
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception("Could not record %d result(s).", len(batch))
+
+            if done:
+                break
+
+        connection.close()
+
+    def get_history(
+        self, subject: str, checker: Optional[JobChecker] = None
+    ) -> List[tuple]:
+        """
+        Provides the (checker, tested_at, status, status_source) of the recorded
+        results of the given subject - in the order they were tested.
+        """
+
+        query = (
+            "SELECT checker, tested_at, status, status_source FROM results "
+            "WHERE subject = ?"
+        )
+        args = [subject]
+
+        if checker is not None:
+            query += " AND checker = ?"
+            args.append(checker.value)
+
+        with contextlib.closing(self.connect()) as connection:
+            return connection.execute(
+                f"{query} ORDER BY checker, tested_at", args
+            ).fetchall()
+
+    def get_latest_results(
+        self, checker: JobChecker, params: Optional[str], subjects: List[str]
+    ) -> Dict[str, tuple]:
+        """
+        Provides the (tested_at, status, result) of the latest result - tested
+        with the given parameters - of each of the given subjects.
+
+        :param params:
+            The key of the parameters - from :py:func:`get_params_key`.
+        """
+
+        with contextlib.closing(self.connect()) as connection:
+            # The other columns of an aggregate with MAX() are the ones of the
+            # row holding the maximum.
+            rows = connection.execute(
+                "SELECT subject, MAX(tested_at), status, result FROM results "
+                "WHERE checker = ? AND params IS ? "
+                f"AND subject IN ({', '.join('?' * len(subjects))}) "
+                "GROUP BY subject",
+                [checker.value, params, *subjects],
+            ).fetchall()
+
+        return {x[0]: x[1:] for x in rows}
+
+    def cleanup(self, retention_days: int, max_results: int) -> int:
+        """
+        Deletes the results older than the given number of days and - per
+        subject and checker - the results over the given number.
+
+        :return:
+            The number of deleted results.
+        """
+
+        expired_at = time.time() - retention_days * 24 * 60 * 60
+
+        with contextlib.closing(self.connect()) as connection, connection:
+            deleted = connection.execute(
+                "DELETE FROM results WHERE tested_at < ?", (expired_at,)
+            ).rowcount
+            deleted += connection.execute(
+                "DELETE FROM results WHERE rowid IN ("
+                "SELECT rowid FROM ("
+                "SELECT rowid, ROW_NUMBER() OVER ("
+                "PARTITION BY subject, checker ORDER BY tested_at DESC"
+                ") AS position FROM results"
+                ") WHERE position > ?)",
+                (max_results,),
+            ).rowcount
+
+        return deleted
+
+    def shutdown(self) -> None:
+        """
+        Writes the queued results and stops our thread.
+        """
+
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+        self.thread.join(self.flush_interval * 10)
+
+
+HISTORY: Optional[HistoryStore] = None
+"""
+Our store - when the history is enabled.
+"""
+
+
+def get_history_path() -> str:
+    """
+    Provides the path of our database.
+
+    It is shared by all the workers using the same data directory and survives
+    restarts.
+    """
+
+    return os.path.join(
+        pyfunceble_webworker.storage.CONFIG_DIRECTORY, assets_defaults.HISTORY_FILE
+    )
+
+
+def record_status(checker: Type, status: Any) -> None:
+    """
+    Records - when the history is enabled - the given status of the given
+    checker.
+    """
+
+    if HISTORY is not None:
+        HISTORY.record(checker, status)
+
+
+def get_latest_results(
+    checker: JobChecker, params: Optional[str], subjects: List[str]
+) -> Dict[str, tuple]:
+    """
+    Provides - when the history is enabled - the latest result of each of the
+    given subjects.
+
+    .. seealso::
+        :py:meth:`HistoryStore.get_latest_results`
+    """
+
+    if HISTORY is None:
+        return {}
+
+    return HISTORY.get_latest_results(checker, params, subjects)
+
+
+def start_history() -> None:
+    """
+    Opens our store - as configured through our settings.
+    """
+
+    global HISTORY  # pylint: disable=global-statement
+
+    if HISTORY is not None:
+        return
+
+    DirectoryHelper(pyfunceble_webworker.storage.CONFIG_DIRECTORY).create()
+
+    HISTORY = HistoryStore(
+        get_history_path(),
+        batch_size=core_settings.HISTORY_BATCH_SIZE,
+        flush_interval=core_settings.HISTORY_FLUSH_INTERVAL,
+    )
+
+
+def cleanup_history() -> int:
+    """
+    Deletes the results our settings tell us not to keep anymore.
+
+    :return:
+        The number of deleted results.
+    """
+
+    if HISTORY is None:
+        return 0
+
+    return HISTORY.cleanup(
+        core_settings.HISTORY_RETENTION_DAYS,
+        core_settings.HISTORY_MAX_RESULTS_PER_SUBJECT,
+    )
+
+
+def shutdown_history() -> None:
+    """
+    Writes the queued results and closes our store.
+    """
+
+    global HISTORY  # pylint: disable=global-statement
+
+    if HISTORY is not None:
+        HISTORY.shutdown()
+        HISTORY = None
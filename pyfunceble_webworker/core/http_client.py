@@ -0,0 +1,474 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our (async) HTTP client.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import ssl
+import threading
+import urllib.parse
+from typing import Coroutine, Dict, List, Optional, Tuple
+
+import certifi
+import httpcore
+import PyFunceble.factory
+from PyFunceble.converter.url2netloc import Url2Netloc
+from PyFunceble.query.http_status_code import HTTPStatusCode
+
+from pyfunceble_webworker.core.dns_cache import resolve_host_async
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.core.upstreams import HTTP_LIMITER, get_http_host
+
+try:
+    import h2
+except ImportError:  # pragma: no cover ## Optional dependency.
+    h2 = None
+
+REDIRECT_STATUS_CODES = frozenset((301, 302, 303, 307, 308))
+"""
+The status codes we follow the location of.
+"""
+
+SUPPORTED_PROXY_SCHEMES = frozenset(("http", "https"))
+"""
+The schemes of the proxies our HTTP client can talk through.
+"""
+
+REQUEST_ERRORS = (
+    httpcore.TimeoutException,
+    httpcore.NetworkError,
+    httpcore.ProtocolError,
+    httpcore.ProxyError,
+    httpcore.UnsupportedProtocol,
+    ssl.SSLError,
+    OSError,
+    ValueError,
+)
+"""
+The errors which make a HTTP status code unknown.
+"""
+
+
+class UnsupportedProxy(Exception):
+    """
+    Raised when a request has to go through a proxy our HTTP client can't
+    talk through.
+    """
+
+
+class ResolvingBackend(httpcore.AsyncNetworkBackend):
+    """
+    Provides the network backend of our HTTP client: the hosts are resolved -
+    like PyFunceble does - through the nameservers of PyFunceble.
+    """
+
+    def __init__(self) -> None:
+        self.backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await resolve_host_async(host)
+
+        if address is None:
+            raise httpcore.ConnectError(f"Could not resolve {host!r}.")
+
+        return await self.backend.connect_tcp(
+            address,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options,
+        )
+
+    async def connect_unix_socket(
+        self, path: str, timeout: Optional[float] = None, socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+
+def get_proxy(url: str) -> Optional[str]:
+    """
+    Provides the proxy - as configured in PyFunceble - the request to the given
+    URL has to go through.
+    """
+
+    split = urllib.parse.urlsplit(url)
+    adapter = PyFunceble.factory.Requester.session.get_adapter(url)
+
+    return adapter.fetch_proxy_from_pattern(split.hostname).get(split.scheme)
+
+
+def get_header(response: httpcore.Response, name: bytes) -> Optional[bytes]:
+    """
+    Provides the value of the given (lowercase) header of the given response.
+    """
+
+    for key, value in response.headers:
+        if key.lower() == name:
+            return value
+
+    return None
+
+
+def get_host_header(url: str) -> str:
+    """
+    Provides the :code:`Host` header of a request to the given URL.
+    """
+
+    return urllib.parse.urlsplit(url).netloc.rpartition("@")[-1]
+
+
+async def run_in_context(context: contextvars.Context, coroutine: Coroutine):
+    """
+    Runs the given coroutine in the given context - e.g. the one of the check
+    which waits for it.
+    """
+
+    return await context.run(asyncio.ensure_future, coroutine)
+
+
+class HTTPClient:
+    """
+    Provides the HTTP client our checks query the HTTP status codes through.
+
+    Its connections are pooled - per proxy and certificate verification - and
+    shared by all checks. When possible, they negotiate HTTP/2 so that the
+    requests to the same origin are multiplexed over a single connection. The
+    requests against each host are limited by our HTTP upstream limits.
+
+    The client runs on its own event loop (thread) so that our (synchronous)
+    checkers can wait for it.
+
+    :param http2:
+        Whether HTTP/2 is negotiated with HTTPS origins.
+    :param max_connections:
+        The maximum number of connections of each pool.
+    :param keepalive_expiry:
+        The time (in seconds) an idle connection is kept open.
+    :param max_redirects:
+        The maximum number of redirects followed.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        max_connections: int = 100,
+        keepalive_expiry: float = 5.0,
+        max_redirects: int = 10,
+    ) -> None:
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.max_redirects = max_redirects
+
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+
+        # Only touched from our event loop.
+        self.backend = ResolvingBackend()
+        self.pools: Dict[Tuple[Optional[str], bool], httpcore.AsyncConnectionPool] = {}
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Starts our event loop - if not started yet - and provides it.
+        """
+
+        with self.lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self.thread = threading.Thread(
+                    target=self.loop.run_forever, name="http-client", daemon=True
+                )
+                self.thread.start()
+
+            return self.loop
+
+    def get_pool(
+        self, proxy: Optional[str], verify: bool
+    ) -> httpcore.AsyncConnectionPool:
+        """
+        Provides the connection pool of the given proxy and certificate
+        verification.
+        """
+
+        try:
+            return self.pools[(proxy, verify)]
+        except KeyError:
+            pass
+
+        if proxy and urllib.parse.urlsplit(proxy).scheme not in SUPPORTED_PROXY_SCHEMES:
+            raise UnsupportedProxy(proxy)
+
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+        if not verify:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        pool = self.pools[(proxy, verify)] = httpcore.AsyncConnectionPool(
+            ssl_context=ssl_context,
+            proxy=httpcore.Proxy(proxy, ssl_context=ssl_context) if proxy else None,
+            max_connections=self.max_connections,
+            # Closing our idle connections early would make us reconnect under
+            # load.
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=self.keepalive_expiry,
+            http2=self.http2 and h2 is not None,
+            retries=PyFunceble.factory.Requester.max_retries,
+            network_backend=self.backend,
+        )
+
+        return pool
+
+    async def send(
+        self, url: str, *, timeout: float, verify: bool
+    ) -> httpcore.Response:
+        """
+        Sends a GET request to the given URL.
+        """
+
+        pool = self.get_pool(get_proxy(url), verify)
+        limit = (
+            HTTP_LIMITER.get_limit(get_http_host(url)) if HTTP_LIMITER.enabled else None
+        )
+
+        if limit is not None:
+            await limit.acquire_async()
+
+        try:
+            response = await pool.request(
+                "GET",
+                url,
+                headers={
+                    "Host": get_host_header(url),
+                    "User-Agent": PyFunceble.factory.Requester.session.headers[
+                        "User-Agent"
+                    ],
+                    "Accept": "*/*",
+                },
+                extensions={
+                    "timeout": {
+                        "connect": timeout,
+                        "read": timeout,
+                        "write": timeout,
+                        # Waiting for our own connections is not the fault of
+                        # the upstream.
+                        "pool": None,
+                    }
+                },
+            )
+        finally:
+            if limit is not None:
+                limit.release()
+
+        return response
+
+    async def get_status_code_async(
+        self, url: str, *, timeout: float, verify: bool, allow_redirects: bool
+    ) -> Optional[int]:
+        """
+        Provides the HTTP status code of the given URL - the way
+        :py:meth:`PyFunceble.query.http_status_code.HTTPStatusCode.get_status_code`
+        does.
+
+        :return:
+            The status code or :code:`None` when it has to be queried through
+            PyFunceble.
+        """
+
+        history: List[Tuple[str, int]] = []
+
+        while True:
+            if urllib.parse.urlsplit(url).scheme not in ("http", "https"):
+                return HTTPStatusCode.STD_UNKNOWN_STATUS_CODE
+
+            try:
+                response = await self.send(url, timeout=timeout, verify=verify)
+            except UnsupportedProxy:
+                return None
+            except REQUEST_ERRORS:
+                return HTTPStatusCode.STD_UNKNOWN_STATUS_CODE
+
+            history.append((url, response.status))
+            location = get_header(response, b"location")
+
+            if response.status not in REDIRECT_STATUS_CODES or not location:
+                break
+
+            if len(history) > self.max_redirects:
+                return HTTPStatusCode.STD_UNKNOWN_STATUS_CODE
+
+            url = urllib.parse.urljoin(url, location.decode("latin-1"))
+
+        if not allow_redirects and len(history) > 1:
+            url2netloc = Url2Netloc()
+            first_origin = url2netloc.set_data_to_convert(history[0][0]).get_converted()
+            # Same as PyFunceble: the origin after the first redirect.
+            final_origin = url2netloc.set_data_to_convert(
+                history[1][0] if len(history) > 2 else history[-1][0]
+            ).get_converted()
+
+            if first_origin != final_origin:
+                return history[0][1]
+
+        return history[-1][1]
+
+    def get_status_code(
+        self, url: str, *, timeout: float, verify: bool, allow_redirects: bool
+    ) -> Optional[int]:
+        """
+        Provides - from any thread - the HTTP status code of the given URL.
+
+        :return:
+            The status code or :code:`None` when it has to be queried through
+            PyFunceble.
+        """
+
+        return asyncio.run_coroutine_threadsafe(
+            run_in_context(
+                contextvars.copy_context(),
+                self.get_status_code_async(
+                    url,
+                    timeout=timeout,
+                    verify=verify,
+                    allow_redirects=allow_redirects,
+                ),
+            ),
+            self.start(),
+        ).result()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Closes our connections and stops our event loop.
+        """
+
+        with self.lock:
+            loop, self.loop = self.loop, None
+            thread, self.thread = self.thread, None
+
+        if loop is None:
+            return
+
+        async def close():
+            for pool in self.pools.values():
+                await pool.aclose()
+
+            self.pools.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close(), loop).result(timeout)
+        except concurrent.futures.TimeoutError:
+            pass
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        loop.close()
+
+
+HTTP_CLIENT = HTTPClient()
+"""
+The HTTP client of the worker.
+"""
+
+
+def install_http_client() -> None:
+    """
+    Configures our HTTP client from our settings and installs it behind the
+    HTTP status code lookups of PyFunceble.
+    """
+
+    HTTP_CLIENT.http2 = core_settings.HTTP_CLIENT_HTTP2
+    HTTP_CLIENT.max_connections = core_settings.HTTP_CLIENT_MAX_CONNECTIONS
+    HTTP_CLIENT.keepalive_expiry = core_settings.HTTP_CLIENT_KEEPALIVE_EXPIRY
+    HTTP_CLIENT.max_redirects = core_settings.HTTP_CLIENT_MAX_REDIRECTS
+
+    func = HTTPStatusCode.get_status_code
+
+    if not core_settings.HTTP_CLIENT_ENABLED or hasattr(
+        func, "__wrapped_by_http_client__"
+    ):
+        return
+
+    @functools.wraps(func)
+    def get_status_code(self: HTTPStatusCode) -> int:
+        if not isinstance(self.subject, str):
+            return func(self)
+
+        result = HTTP_CLIENT.get_status_code(
+            self.subject,
+            timeout=self.timeout,
+            verify=self.verify_certificate,
+            allow_redirects=self.allow_redirects,
+        )
+
+        if result is None:
+            return func(self)
+
+        return result
+
+    get_status_code.__wrapped_by_http_client__ = True
+    HTTPStatusCode.get_status_code = get_status_code
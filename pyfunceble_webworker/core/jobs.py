@@ -0,0 +1,1043 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our bulk jobs. Jobs are persisted under our
+data directory and checkpoint their results incrementally so that they can be
+resumed after a restart.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import concurrent.futures
+import contextlib
+import datetime
+import functools
+import itertools
+import logging
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+from typing import IO, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Type
+
+import orjson
+from pydantic import BaseModel
+from PyFunceble import (
+    DomainAndIPAvailabilityChecker,
+    DomainAndIPReputationChecker,
+    DomainAvailabilityChecker,
+    DomainReputationChecker,
+    DomainSyntaxChecker,
+    IPAvailabilityChecker,
+    IPReputationChecker,
+    IPSyntaxChecker,
+    URLAvailabilityChecker,
+    URLReputationChecker,
+    URLSyntaxChecker,
+)
+from PyFunceble.helpers.directory import DirectoryHelper
+
+import pyfunceble_webworker.storage
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+from pyfunceble_webworker.core.dns_cache import (
+    DNS_CACHE,
+    DNSLookup,
+    DNSPrefetcher,
+    get_availability_lookups,
+    get_reputation_lookups,
+    get_url_availability_lookups,
+    get_url_reputation_lookups,
+)
+from pyfunceble_webworker.core.history import (
+    HISTORY_CHECKERS,
+    get_checker_params_key,
+    get_latest_results,
+    record_status,
+)
+from pyfunceble_webworker.core.responses import encode_default, project
+from pyfunceble_webworker.core.scheduler import BULK_LANE, get_scheduler
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.models.availability import AvailabilityStatus
+from pyfunceble_webworker.models.jobs import JobChecker, JobParams, JobState
+from pyfunceble_webworker.models.reputation import ReputationStatus
+from pyfunceble_webworker.models.syntax import SyntaxStatus
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover ## Not available under Windows.
+    fcntl = None
+
+JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+"""
+The pattern of the identifier of our jobs.
+"""
+
+INVALID_SUBJECT_PATTERN = re.compile(r"[\s\x00-\x1f\x7f]")
+"""
+The pattern of the characters a subject of our jobs can't contain. Our subjects
+are persisted one per line.
+"""
+
+UNFINISHED_STATES = (JobState.pending.value, JobState.running.value)
+"""
+The states of the jobs which still have to be run.
+"""
+
+FRESHNESS_CHUNK_SIZE: int = 512
+"""
+The number of subjects whose recorded result we look up at once.
+"""
+
+
+class JobCheckerSpec(NamedTuple):
+    """
+    Describes the checker of a job.
+
+    :param checker:
+        The checker class.
+    :param model:
+        The model of the status of the checker.
+    :param get_kwargs:
+        Provides the arguments of the checker from the parameters of the job.
+    :param get_dns_lookups:
+        Provides the DNS lookups the checker runs against a subject - from its
+        arguments. :code:`None` when it runs none.
+    """
+
+    checker: Type
+    model: Type[BaseModel]
+    get_kwargs: Callable[[JobParams], dict]
+    get_dns_lookups: Optional[Callable[[dict, str], List[DNSLookup]]] = None
+
+
+def get_use_whois_lookup(params: JobParams) -> bool:
+    """
+    Provides whether the WHOIS lookup should be used - according to our
+    settings.
+    """
+
+    if core_settings.ALLOW_WHOIS_LOOKUP_PARAM and params.use_whois_lookup is not None:
+        return params.use_whois_lookup
+
+    return core_settings.ALLOW_WHOIS_LOOKUP
+
+
+def get_availability_kwargs(params: JobParams) -> dict:
+    """
+    Provides the arguments of our availability checkers. Omitted parameters get
+    the default of our single-subject endpoints.
+    """
+
+    result = {
+        x: getattr(params, x) if getattr(params, x) is not None else y
+        for x, y in (
+            ("use_extra_rules", True),
+            ("use_dns_lookup", True),
+            ("use_netinfo_lookup", False),
+            ("use_http_code_lookup", True),
+            ("use_reputation_lookup", False),
+            ("do_syntax_check_first", True),
+        )
+    }
+
+    result["use_whois_lookup"] = get_use_whois_lookup(params)
+    result["use_whois_db"] = False
+
+    return result
+
+
+def get_url_availability_kwargs(params: JobParams) -> dict:
+    """
+    Provides the arguments of our URL availability checker. Omitted parameters
+    get the default of our single-subject endpoint.
+    """
+
+    return {
+        "use_extra_rules": False,
+        "use_whois_lookup": get_use_whois_lookup(params),
+        "use_dns_lookup": False,
+        "use_netinfo_lookup": False,
+        "use_http_code_lookup": True,
+        "use_reputation_lookup": bool(params.use_reputation_lookup),
+        "do_syntax_check_first": params.do_syntax_check_first is not False,
+        "use_whois_db": False,
+    }
+
+
+def get_reputation_kwargs(params: JobParams) -> dict:
+    """
+    Provides the arguments of our reputation checkers.
+    """
+
+    return {"do_syntax_check_first": params.do_syntax_check_first is not False}
+
+
+def get_syntax_kwargs(params: JobParams) -> dict:  # pylint: disable=unused-argument
+    """
+    Provides the arguments of our syntax checkers.
+    """
+
+    return {}
+
+
+JOB_CHECKERS: Dict[JobChecker, JobCheckerSpec] = {
+    JobChecker.availability_domain: JobCheckerSpec(
+        DomainAvailabilityChecker,
+        AvailabilityStatus,
+        get_availability_kwargs,
+        get_availability_lookups,
+    ),
+    JobChecker.availability_ip: JobCheckerSpec(
+        IPAvailabilityChecker,
+        AvailabilityStatus,
+        get_availability_kwargs,
+        get_availability_lookups,
+    ),
+    JobChecker.availability_url: JobCheckerSpec(
+        URLAvailabilityChecker,
+        AvailabilityStatus,
+        get_url_availability_kwargs,
+        get_url_availability_lookups,
+    ),
+    JobChecker.availability_domain_and_ip: JobCheckerSpec(
+        DomainAndIPAvailabilityChecker,
+        AvailabilityStatus,
+        get_availability_kwargs,
+        get_availability_lookups,
+    ),
+    JobChecker.reputation_domain: JobCheckerSpec(
+        DomainReputationChecker,
+        ReputationStatus,
+        get_reputation_kwargs,
+        get_reputation_lookups,
+    ),
+    JobChecker.reputation_ip: JobCheckerSpec(
+        IPReputationChecker, ReputationStatus, get_reputation_kwargs
+    ),
+    JobChecker.reputation_url: JobCheckerSpec(
+        URLReputationChecker,
+        ReputationStatus,
+        get_reputation_kwargs,
+        get_url_reputation_lookups,
+    ),
+    JobChecker.reputation_domain_and_ip: JobCheckerSpec(
+        DomainAndIPReputationChecker,
+        ReputationStatus,
+        get_reputation_kwargs,
+        get_reputation_lookups,
+    ),
+    JobChecker.syntax_domain: JobCheckerSpec(
+        DomainSyntaxChecker, SyntaxStatus, get_syntax_kwargs
+    ),
+    JobChecker.syntax_ip: JobCheckerSpec(
+        IPSyntaxChecker, SyntaxStatus, get_syntax_kwargs
+    ),
+    JobChecker.syntax_url: JobCheckerSpec(
+        URLSyntaxChecker, SyntaxStatus, get_syntax_kwargs
+    ),
+}
+"""
+The checkers our jobs can run.
+"""
+
+
+def check_subject(spec: JobCheckerSpec, kwargs: dict, subject: str) -> dict:
+    """
+    Tests the given subject and provides its (projected) status.
+    """
+
+    status = spec.checker(subject, **kwargs).get_status()
+    record_status(spec.checker, status)
+
+    return project(spec.model, status)
+
+
+def get_jobs_directory() -> str:
+    """
+    Provides the directory where we persist our jobs.
+
+    This directory is shared by all the workers using the same data directory
+    and survives restarts.
+    """
+
+    return os.path.join(
+        pyfunceble_webworker.storage.CONFIG_DIRECTORY, assets_defaults.JOBS_DIRECTORY
+    )
+
+
+def get_job_path(job_id: str, filename: str = "") -> str:
+    """
+    Provides the path of the given file of the given job.
+
+    :raise ValueError:
+        When the given job identifier is not valid.
+    """
+
+    if not JOB_ID_PATTERN.fullmatch(job_id):
+        raise ValueError("Invalid job identifier.")
+
+    return os.path.join(get_jobs_directory(), job_id, filename)
+
+
+def write_json(destination: str, data: dict) -> None:
+    """
+    Writes - atomically - the given data into the given destination.
+
+    Each write goes through its own temporary file: concurrent writers never
+    write into - nor replace - each other's.
+    """
+
+    file_descriptor, temp_destination = tempfile.mkstemp(
+        prefix=f".{os.path.basename(destination)}.",
+        suffix=".tmp",
+        dir=os.path.dirname(destination),
+    )
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as file_stream:
+            file_stream.write(
+                orjson.dumps(data, default=encode_default, option=orjson.OPT_UTC_Z)
+            )
+            file_stream.flush()
+            os.fsync(file_stream.fileno())
+
+        os.replace(temp_destination, destination)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_destination)
+
+        raise
+
+
+def now_iso() -> str:
+    """
+    Provides the current (UTC) time as an ISO string.
+    """
+
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def create_job(
+    checker: JobChecker,
+    subjects: List[str],
+    params: JobParams,
+    client: str,
+    *,
+    distributed: bool = False,
+    freshness: Optional[Dict[str, float]] = None,
+) -> dict:
+    """
+    Creates - and persists - a new job.
+
+    The subjects are written first: a job only exists once its description is
+    written.
+
+    :param distributed:
+        Whether the job should be sharded across our peers.
+    :param freshness:
+        The maximum age (in seconds) - per status - of a recorded result given
+        back instead of testing its subject again. :code:`None` to test all
+        subjects.
+    """
+
+    job_id = secrets.token_hex(16)
+    DirectoryHelper(get_job_path(job_id)).create()
+
+    with open(get_job_path(job_id, assets_defaults.JOB_SUBJECTS_FILE), "wb") as stream:
+        for subject in subjects:
+            stream.write(subject.encode("utf-8") + b"\n")
+
+        stream.flush()
+        os.fsync(stream.fileno())
+
+    job = {
+        "id": job_id,
+        "checker": checker.value,
+        "params": params.model_dump(),
+        "client": client,
+        "distributed": distributed,
+        "freshness": freshness,
+        "state": JobState.pending.value,
+        "total": len(subjects),
+        "created_at": now_iso(),
+        "finished_at": None,
+    }
+
+    write_json(get_job_path(job_id, assets_defaults.JOB_FILE), job)
+
+    return job
+
+
+def read_job(job_id: str) -> Optional[dict]:
+    """
+    Reads the given job.
+
+    :return:
+        The job or :code:`None` when it does not exist.
+    """
+
+    try:
+        with open(get_job_path(job_id, assets_defaults.JOB_FILE), "rb") as stream:
+            return orjson.loads(stream.read())
+    except (OSError, ValueError):
+        return None
+
+
+@contextlib.contextmanager
+def job_update_lock(job_id: str) -> Iterator[None]:
+    """
+    Provides an exclusive lock over the description of the given job.
+
+    .. note::
+        Without :code:`fcntl` (e.g. Windows), we don't lock.
+
+    :raise FileNotFoundError:
+        When the job was deleted.
+    """
+
+    with open(
+        get_job_path(job_id, assets_defaults.JOB_UPDATE_LOCK_FILE),
+        "a",
+        encoding="utf-8",
+    ) as lock_stream:
+        if fcntl is not None:
+            fcntl.flock(lock_stream.fileno(), fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_stream.fileno(), fcntl.LOCK_UN)
+
+
+def update_job(job_id: str, **changes) -> Optional[dict]:
+    """
+    Updates the given job with the given changes.
+
+    The updates - of any worker - are serialized so that none of them gets lost.
+
+    :return:
+        The updated job or :code:`None` when it does not exist (anymore).
+    """
+
+    try:
+        with job_update_lock(job_id):
+            job = read_job(job_id)
+
+            if job is None:
+                return None
+
+            job.update(changes)
+            write_json(get_job_path(job_id, assets_defaults.JOB_FILE), job)
+    except FileNotFoundError:
+        return None
+
+    return job
+
+
+def iter_results(job_id: str) -> Iterator[dict]:
+    """
+    Provides the checkpointed results of the given job.
+
+    A partially written (last) result - left by a crash - is ignored.
+    """
+
+    try:
+        with open(
+            get_job_path(job_id, assets_defaults.JOB_RESULTS_FILE), "rb"
+        ) as stream:
+            for line in stream:
+                if not line.endswith(b"\n"):
+                    break
+
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    break
+    except FileNotFoundError:
+        return
+
+
+def count_results(job_id: str) -> int:
+    """
+    Provides the number of checkpointed results of the given job.
+    """
+
+    runner = RUNNERS.get(job_id)
+
+    if runner is not None and runner.completed is not None:
+        return runner.completed
+
+    result = 0
+
+    try:
+        with open(
+            get_job_path(job_id, assets_defaults.JOB_RESULTS_FILE), "rb"
+        ) as stream:
+            for chunk in iter(functools.partial(stream.read, 1024 * 1024), b""):
+                result += chunk.count(b"\n")
+    except FileNotFoundError:
+        pass
+
+    return result
+
+
+def try_lock_job(job_id: str) -> Optional[IO]:
+    """
+    Tries to lock the given job - for the lifetime of the returned stream.
+
+    .. note::
+        Without :code:`fcntl` (e.g. Windows), we don't lock.
+
+    :return:
+        The locked stream or :code:`None` when the job is locked by another
+        worker.
+    """
+
+    lock_stream = open(  # pylint: disable=consider-using-with
+        get_job_path(job_id, assets_defaults.JOB_LOCK_FILE), "a", encoding="utf-8"
+    )
+
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_stream.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_stream.close()
+            return None
+
+    return lock_stream
+
+
+class JobRunner(threading.Thread):
+    """
+    Provides the runner of a job.
+
+    The subjects are given to the bulk lane of our scheduler and their results
+    are appended to the results file of the job. The results file is synced to
+    disk every :code:`JOBS_CHECKPOINT_SIZE` results or
+    :code:`JOBS_CHECKPOINT_INTERVAL` seconds.
+
+    When (re)started, the subjects already in the results file are skipped.
+
+    :param job:
+        The job to run.
+    :param lock_stream:
+        The stream holding the lock of the job. It is closed - hence the lock
+        released - once the runner stops.
+    """
+
+    def __init__(self, job: dict, lock_stream: IO) -> None:
+        super().__init__(name=f"job-{job['id']}", daemon=True)
+
+        self.job = job
+        self.lock_stream = lock_stream
+
+        self.stop_event = threading.Event()
+        # Unknown until our checkpoint is loaded.
+        self.completed: Optional[int] = None
+
+    def stop(self) -> None:
+        """
+        Asks the runner to stop. Running checks are not waited for: they are
+        run again on resume.
+        """
+
+        self.stop_event.set()
+
+    def load_checkpoint(self) -> Set[int]:
+        """
+        Provides the index of the subjects already tested.
+
+        A partially written (last) result is truncated so that we can append
+        safely.
+        """
+
+        results_file = get_job_path(self.job["id"], assets_defaults.JOB_RESULTS_FILE)
+        result = set()
+        valid_size = 0
+
+        try:
+            with open(results_file, "rb") as stream:
+                for line in stream:
+                    if not line.endswith(b"\n"):
+                        break
+
+                    try:
+                        result.add(orjson.loads(line)["index"])
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        break
+
+                    valid_size += len(line)
+        except FileNotFoundError:
+            return result
+
+        if os.path.getsize(results_file) != valid_size:
+            logging.warning(
+                "Truncating the partial checkpoint of the %s job.", self.job["id"]
+            )
+            os.truncate(results_file, valid_size)
+
+        return result
+
+    def iter_subjects(self, completed: Set[int]) -> Iterator[tuple]:
+        """
+        Provides the index and subject of the subjects still to test.
+        """
+
+        with open(
+            get_job_path(self.job["id"], assets_defaults.JOB_SUBJECTS_FILE),
+            "r",
+            encoding="utf-8",
+            newline="\n",
+        ) as stream:
+            for index, line in enumerate(stream):
+                if index not in completed:
+                    yield index, line.rstrip("\n")
+
+    def is_cancelled(self) -> bool:
+        """
+        Checks if the job was cancelled - by any worker.
+        """
+
+        job = read_job(self.job["id"])
+
+        return job is None or job["state"] == JobState.cancelled.value
+
+    def run(self) -> None:
+        try:
+            self.process()
+        except Exception:  # pylint: disable=broad-except
+            logging.exception("Could not run the %s job.", self.job["id"])
+        finally:
+            with RUNNERS_LOCK:
+                RUNNERS.pop(self.job["id"], None)
+
+            self.lock_stream.close()
+
+    def process(self) -> None:
+        """
+        Runs the job until all subjects are tested or we are asked to stop.
+        """
+
+        job_id = self.job["id"]
+        spec = JOB_CHECKERS[JobChecker(self.job["checker"])]
+        kwargs = spec.get_kwargs(JobParams(**self.job["params"]))
+
+        completed = self.load_checkpoint()
+        self.completed = len(completed)
+
+        if self.job["state"] != JobState.running.value:
+            job = update_job(job_id, state=JobState.running.value)
+
+            if job is None:
+                logging.info("The %s job was deleted. Not running it.", job_id)
+                return
+
+            self.job = job
+
+        if self.job.get("freshness"):
+            # Re-check mode: the subjects with a fresh result are not tested
+            # - nor prefetched - again.
+            self.reuse_fresh_results(spec, kwargs, completed)
+
+        logging.info(
+            "Starting the %s job (%d/%d already tested).",
+            job_id,
+            self.completed,
+            self.job["total"],
+        )
+
+        scheduler = get_scheduler()
+        prefetcher = DNSPrefetcher(
+            (
+                functools.partial(spec.get_dns_lookups, kwargs)
+                if spec.get_dns_lookups and DNS_CACHE.enabled
+                else None
+            ),
+            max_in_flight=core_settings.JOBS_DNS_PREFETCH_MAX_IN_FLIGHT,
+            look_ahead=core_settings.JOBS_DNS_PREFETCH_LOOK_AHEAD,
+        )
+        # The DNS records of the upcoming subjects are resolved - concurrently -
+        # ahead of their check so that their checkers get cached answers.
+        subjects = prefetcher.iter_ahead(self.iter_subjects(completed))
+        pending: Dict[concurrent.futures.Future, tuple] = {}
+        exhausted = False
+        cancelled = False
+
+        with prefetcher, open(
+            get_job_path(job_id, assets_defaults.JOB_RESULTS_FILE), "ab"
+        ) as results_stream:
+            unsynced = 0
+            last_checkpoint = time.monotonic()
+
+            while not self.stop_event.is_set():
+                while not exhausted and len(pending) < core_settings.JOBS_MAX_IN_FLIGHT:
+                    try:
+                        index, subject = next(subjects)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    future = scheduler.submit(
+                        functools.partial(check_subject, spec, kwargs, subject),
+                        lane=BULK_LANE,
+                        client=self.job["client"],
+                    )
+                    pending[future] = (index, subject)
+
+                if not pending:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    pending, timeout=1.0, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    index, subject = pending.pop(future)
+
+                    if future.cancelled():
+                        # The scheduler is shutting down.
+                        self.stop()
+                        continue
+
+                    result = {"index": index, "subject": subject}
+
+                    try:
+                        result["status"] = future.result()
+                    except Exception as exception:  # pylint: disable=broad-except
+                        result["error"] = str(exception) or type(exception).__name__
+
+                    self.record(results_stream, result)
+                    unsynced += 1
+
+                if unsynced and (
+                    unsynced >= core_settings.JOBS_CHECKPOINT_SIZE
+                    or time.monotonic() - last_checkpoint
+                    >= core_settings.JOBS_CHECKPOINT_INTERVAL
+                ):
+                    self.checkpoint(results_stream)
+                    unsynced = 0
+                    last_checkpoint = time.monotonic()
+
+                    if self.is_cancelled():
+                        cancelled = True
+                        break
+
+            for future in pending:
+                future.cancel()
+
+            self.checkpoint(results_stream)
+
+        if cancelled or self.stop_event.is_set():
+            logging.info("Stopped the %s job.", job_id)
+            return
+
+        self.finish()
+
+    def reuse_fresh_results(
+        self, spec: JobCheckerSpec, kwargs: dict, completed: Set[int]
+    ) -> None:
+        """
+        Gives back - instead of testing them again - the recorded results of the
+        subjects which are still fresh according to the freshness policy of the
+        job. Their index is added to the given completed ones.
+
+        A result is fresh when its status is listed by the policy and it is not
+        older than the age given for it. Only the results tested with the same
+        parameters as the job are considered.
+        """
+
+        if spec.checker not in HISTORY_CHECKERS:
+            return
+
+        name = HISTORY_CHECKERS[spec.checker][0]
+        params = get_checker_params_key(spec.checker, kwargs)
+        freshness = self.job["freshness"]
+        subjects = self.iter_subjects(completed)
+        reused = 0
+
+        with open(
+            get_job_path(self.job["id"], assets_defaults.JOB_RESULTS_FILE), "ab"
+        ) as results_stream:
+            while not self.stop_event.is_set():
+                chunk = list(itertools.islice(subjects, FRESHNESS_CHUNK_SIZE))
+
+                if not chunk:
+                    break
+
+                latest = get_latest_results(name, params, [x[1] for x in chunk])
+                now = time.time()
+
+                for index, subject in chunk:
+                    if subject not in latest:
+                        continue
+
+                    tested_at, status, result = latest[subject]
+
+                    if status not in freshness or now - tested_at > freshness[status]:
+                        continue
+
+                    self.record(
+                        results_stream,
+                        {
+                            "index": index,
+                            "subject": subject,
+                            "status": orjson.loads(result),
+                            "stored": True,
+                        },
+                    )
+                    completed.add(index)
+                    reused += 1
+
+            self.checkpoint(results_stream)
+
+        logging.info(
+            "Gave back %d recorded result(s) of the %s job.", reused, self.job["id"]
+        )
+
+    def record(self, results_stream: IO, result: dict) -> None:
+        """
+        Appends the given result to the given results stream.
+        """
+
+        results_stream.write(
+            orjson.dumps(result, default=encode_default, option=orjson.OPT_UTC_Z)
+            + b"\n"
+        )
+        self.completed += 1
+
+    def finish(self) -> None:
+        """
+        Marks the job as done - unless it was cancelled meanwhile.
+        """
+
+        if not self.is_cancelled():
+            update_job(self.job["id"], state=JobState.done.value, finished_at=now_iso())
+
+        logging.info("Finished the %s job.", self.job["id"])
+
+    @staticmethod
+    def checkpoint(results_stream: IO) -> None:
+        """
+        Syncs the given results stream to disk.
+        """
+
+        results_stream.flush()
+        os.fsync(results_stream.fileno())
+
+
+JOB_RUNNERS: Dict[bool, Type[JobRunner]] = {False: JobRunner}
+"""
+The runner class of our jobs, indexed by whether the job is distributed. The
+runner of the distributed jobs is registered by our coordinator.
+"""
+
+RUNNERS: Dict[str, JobRunner] = {}
+"""
+The runners of this process, indexed by job identifier.
+"""
+
+RUNNERS_LOCK = threading.Lock()
+"""
+The lock protecting our runners.
+"""
+
+
+def start_job(job: dict) -> bool:
+    """
+    Starts the runner of the given job - unless it is already run by a worker.
+
+    :return:
+        Whether we started the runner.
+    """
+
+    with RUNNERS_LOCK:
+        if job["id"] in RUNNERS:
+            return False
+
+        lock_stream = try_lock_job(job["id"])
+
+        if lock_stream is None:
+            return False
+
+        # The job may have been finished by another worker meanwhile.
+        job = read_job(job["id"])
+
+        if job is None or job["state"] not in UNFINISHED_STATES:
+            lock_stream.close()
+            return False
+
+        try:
+            runner_class = JOB_RUNNERS[job.get("distributed", False)]
+        except KeyError:
+            lock_stream.close()
+            return False
+
+        runner = RUNNERS[job["id"]] = runner_class(job, lock_stream)
+
+    runner.start()
+
+    return True
+
+
+def cancel_job(job_id: str) -> Optional[dict]:
+    """
+    Cancels the given job. The runner - of any worker - stops at its next
+    checkpoint.
+    """
+
+    job = read_job(job_id)
+
+    if job is None or job["state"] not in UNFINISHED_STATES:
+        return job
+
+    job = update_job(job_id, state=JobState.cancelled.value, finished_at=now_iso())
+
+    runner = RUNNERS.get(job_id)
+
+    if runner is not None:
+        runner.stop()
+
+    return job
+
+
+def resume_jobs() -> List[str]:
+    """
+    Resumes the unfinished jobs no worker is running - e.g. after a restart.
+
+    :return:
+        The identifier of the resumed jobs.
+    """
+
+    try:
+        job_ids = sorted(os.listdir(get_jobs_directory()))
+    except FileNotFoundError:
+        return []
+
+    result = []
+
+    for job_id in job_ids:
+        if not JOB_ID_PATTERN.fullmatch(job_id) or job_id in RUNNERS:
+            continue
+
+        job = read_job(job_id)
+
+        if job is not None and job["state"] in UNFINISHED_STATES and start_job(job):
+            result.append(job_id)
+
+    if result:
+        logging.info("Resumed %d job(s).", len(result))
+
+    return result
+
+
+def cleanup_jobs() -> List[str]:
+    """
+    Deletes the jobs which finished more than :code:`JOBS_RETENTION_DAYS` ago.
+
+    :return:
+        The identifier of the deleted jobs.
+    """
+
+    try:
+        job_ids = os.listdir(get_jobs_directory())
+    except FileNotFoundError:
+        return []
+
+    retention = datetime.timedelta(days=core_settings.JOBS_RETENTION_DAYS)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    result = []
+
+    for job_id in job_ids:
+        if not JOB_ID_PATTERN.fullmatch(job_id):
+            continue
+
+        job = read_job(job_id)
+
+        if job is None:
+            # Creation interrupted before the job was described.
+            try:
+                modified_at = datetime.datetime.fromtimestamp(
+                    os.path.getmtime(get_job_path(job_id)), datetime.timezone.utc
+                )
+            except FileNotFoundError:
+                # Deleted meanwhile - e.g. by another worker.
+                continue
+
+            expired = now - modified_at > retention
+        else:
+            expired = (
+                job["state"] not in UNFINISHED_STATES
+                and job["finished_at"] is not None
+                and now - datetime.datetime.fromisoformat(job["finished_at"])
+                > retention
+            )
+
+        if expired:
+            shutil.rmtree(get_job_path(job_id), ignore_errors=True)
+            result.append(job_id)
+
+    return result
+
+
+def shutdown_jobs(timeout: float = 5.0) -> None:
+    """
+    Stops our runners. Their results are checkpointed before they stop.
+    """
+
+    with RUNNERS_LOCK:
+        runners = list(RUNNERS.values())
+
+    for runner in runners:
+        runner.stop()
+
+    for runner in runners:
+        runner.join(timeout)
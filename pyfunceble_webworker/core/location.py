@@ -0,0 +1,187 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the location of the current node.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+
+import inflection
+import requests
+
+import pyfunceble_webworker.storage
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.models.info import CoreLocation
+
+
+def get_location_file() -> str:
+    """
+    Provides the path of the file where we persist the location of the current
+    node.
+    """
+
+    return os.path.join(
+        pyfunceble_webworker.storage.CONFIG_DIRECTORY, assets_defaults.LOCATION_FILE
+    )
+
+
+def set_location(location: dict) -> None:
+    """
+    Sets the location served by our endpoints.
+
+    We replace the whole mapping so that readers never see a partial update.
+    """
+
+    pyfunceble_webworker.storage.LOCATION = {
+        x: location.get(x) for x in CoreLocation.model_fields
+    }
+
+
+def load_location() -> dict:
+    """
+    Loads the location of the current node from our settings or - when not
+    overwritten - from the last persisted lookup.
+
+    .. note::
+        This never reaches the network.
+    """
+
+    if core_settings.LOCATION:
+        set_location(core_settings.LOCATION)
+    else:
+        try:
+            with open(get_location_file(), "r", encoding="utf-8") as file_stream:
+                set_location(json.load(file_stream))
+        except (OSError, ValueError):
+            logging.info("No persisted location data to load.")
+
+    return pyfunceble_webworker.storage.LOCATION
+
+
+def fetch_location() -> dict:
+    """
+    Fetches the location of the current node from the lookup service.
+
+    :raise requests.RequestException:
+        When the lookup service could not be reached or did not answer as
+        expected.
+    """
+
+    req = requests.get(
+        str(core_settings.LOCATION_LOOKUP_URL),
+        params={
+            "fields": ",".join(
+                [
+                    inflection.camelize(x, uppercase_first_letter=False)
+                    for x in CoreLocation.model_fields
+                ]
+            )
+        },
+        timeout=core_settings.LOCATION_LOOKUP_TIMEOUT,
+    )
+    req.raise_for_status()
+
+    return {inflection.underscore(x): y for x, y in req.json().items()}
+
+
+def update_location() -> bool:
+    """
+    Updates - and persists - the location of the current node.
+
+    Failures are logged and the previously known location is kept.
+
+    :return:
+        Whether the location was updated.
+    """
+
+    if core_settings.LOCATION:
+        return False
+
+    logging.info("Starting to fetch location data.")
+
+    try:
+        location = fetch_location()
+    except (requests.RequestException, ValueError) as exception:
+        logging.critical("Could not fetch location information. (%s)", exception)
+        return False
+
+    set_location(location)
+
+    location_file = get_location_file()
+    temp_location_file = None
+
+    try:
+        # The workers sharing our data directory may persist theirs
+        # concurrently: each gets its own temporary file.
+        file_descriptor, temp_location_file = tempfile.mkstemp(
+            prefix=f".{os.path.basename(location_file)}.",
+            suffix=".tmp",
+            dir=os.path.dirname(location_file),
+        )
+
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file_stream:
+            json.dump(pyfunceble_webworker.storage.LOCATION, file_stream)
+
+        os.replace(temp_location_file, location_file)
+    except OSError as exception:
+        logging.critical("Could not persist location information. (%s)", exception)
+
+        if temp_location_file is not None:
+            with contextlib.suppress(OSError):
+                os.remove(temp_location_file)
+
+    logging.info("Finished to fetch location data.")
+
+    return True
@@ -0,0 +1,140 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module which provides everything related to our logging.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import atexit
+import contextvars
+import logging
+import logging.config
+import logging.handlers
+import queue
+from typing import Optional
+
+ACCESS_LOGGER = logging.getLogger("pyfunceble_webworker.access")
+"""
+The logger of our access log.
+"""
+
+ACCESS_RECORD: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "access_record", default=None
+)
+"""
+The access log record of the current request - if the access log is enabled.
+"""
+
+LISTENER: Optional[logging.handlers.QueueListener] = None
+"""
+The listener which writes the queued records.
+"""
+
+
+def start_logging(config: dict, *, use_queue: bool = True) -> None:
+    """
+    Configures our logging from the given :py:func:`logging.config.dictConfig`
+    configuration.
+
+    :param use_queue:
+        Moves the handlers of the root logger behind a queue. The records are
+        then written by a background thread instead of the thread which emits
+        them.
+    """
+
+    global LISTENER  # pylint: disable=global-statement
+
+    stop_logging()
+    logging.config.dictConfig(config)
+
+    if not use_queue:
+        return
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    records = queue.SimpleQueue()
+
+    root.addHandler(logging.handlers.QueueHandler(records))
+
+    LISTENER = logging.handlers.QueueListener(
+        records, *handlers, respect_handler_level=True
+    )
+    LISTENER.start()
+
+
+def stop_logging() -> None:
+    """
+    Writes the queued records - if any - and stops our listener.
+    """
+
+    global LISTENER  # pylint: disable=global-statement
+
+    if LISTENER is not None:
+        LISTENER.stop()
+        LISTENER = None
+
+
+# The records still queued at exit would be lost otherwise.
+atexit.register(stop_logging)
+
+
+def set_subject_count(count: int) -> None:
+    """
+    Sets the number of subjects handled by the current request - as given by
+    the access log.
+    """
+
+    record = ACCESS_RECORD.get()
+
+    if record is not None:
+        record["subjects"] = count
@@ -0,0 +1,102 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our process pool.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from pyfunceble_webworker.core.settings import core_settings
+
+PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+"""
+The process pool shared by all our CPU bound tasks.
+"""
+
+
+def get_max_workers() -> int:
+    """
+    Provides the number of processes to start.
+    """
+
+    if core_settings.CONVERTER_MAX_WORKERS:
+        return core_settings.CONVERTER_MAX_WORKERS
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+
+    return os.cpu_count() or 1
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Provides the process pool. The pool is created on first use.
+    """
+
+    global PROCESS_POOL
+
+    if PROCESS_POOL is None:
+        PROCESS_POOL = ProcessPoolExecutor(max_workers=get_max_workers())
+
+    return PROCESS_POOL
+
+
+def shutdown_process_pool() -> None:
+    """
+    Shutdowns the process pool - if it was ever started.
+    """
+
+    global PROCESS_POOL
+
+    if PROCESS_POOL is not None:
+        PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+        PROCESS_POOL = None
@@ -0,0 +1,199 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module which provides the profiling of our requests.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import contextvars
+import cProfile
+import marshal
+import pstats
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+PROFILE: contextvars.ContextVar[Optional["RequestProfile"]] = contextvars.ContextVar(
+    "profile", default=None
+)
+"""
+The profile of the current request - if it is profiled.
+"""
+
+PROFILER_LOCK = threading.Lock()
+"""
+Lets our profiled calls run one at a time: since Python 3.12, only one profiler
+may be active - in the whole interpreter - at a time.
+"""
+
+
+class RequestProfile:
+    """
+    Collects the profile of a request.
+
+    A request may run in several threads - the event loop, the threadpool and
+    the workers of our scheduler. Each profiled call gets its own profiler and
+    all of them are merged at the end. Profiled calls - of all requests - run
+    one at a time.
+    """
+
+    def __init__(self) -> None:
+        self.profilers: List[cProfile.Profile] = []
+        self.lock = threading.Lock()
+
+        self.started_at = time.perf_counter()
+        self.wall_time: Optional[float] = None
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Runs the given function under a profiler.
+        """
+
+        profiler = cProfile.Profile()
+
+        with PROFILER_LOCK:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiling tool - not ours - is active.
+                return func(*args, **kwargs)
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+
+                with self.lock:
+                    self.profilers.append(profiler)
+
+    def finish(self) -> None:
+        """
+        Marks the end of the request.
+        """
+
+        self.wall_time = time.perf_counter() - self.started_at
+
+    def get_stats(self) -> Optional[pstats.Stats]:
+        """
+        Provides the merged statistics of all our profilers.
+        """
+
+        with self.lock:
+            profilers = list(self.profilers)
+
+        if not profilers:
+            return None
+
+        stats = pstats.Stats(profilers[0])
+
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+
+        return stats
+
+    def to_dict(self, limit: int) -> dict:
+        """
+        Provides the summary of the profile: the given number of functions
+        with the highest cumulative time.
+        """
+
+        stats = self.get_stats()
+        functions = []
+
+        if stats:
+            entries = sorted(stats.stats.items(), key=lambda x: x[1][3], reverse=True)
+
+            for (filename, line, name), (
+                primitive_calls,
+                calls,
+                own,
+                cumulative,
+                _,
+            ) in entries[:limit]:
+                functions.append(
+                    {
+                        "function": name,
+                        "location": f"{filename}:{line}",
+                        "calls": calls,
+                        "primitive_calls": primitive_calls,
+                        "own_time": round(own, 6),
+                        "cumulative_time": round(cumulative, 6),
+                    }
+                )
+
+        return {
+            "wall_time": round(self.wall_time, 6) if self.wall_time else None,
+            "profiled_time": round(stats.total_tt, 6) if stats else 0.0,
+            "profiled_calls": len(self.profilers),
+            "functions": functions,
+        }
+
+    def dump(self) -> bytes:
+        """
+        Provides the profile in the :py:mod:`pstats` format - as written by
+        :py:meth:`pstats.Stats.dump_stats`.
+        """
+
+        stats = self.get_stats()
+
+        return marshal.dumps(stats.stats if stats else {})
+
+
+def profile_call(func: Callable, *args, **kwargs) -> Any:
+    """
+    Runs the given function - under a profiler when the current request is
+    profiled.
+    """
+
+    profile = PROFILE.get()
+
+    if profile is None:
+        return func(*args, **kwargs)
+
+    return profile.run(func, *args, **kwargs)
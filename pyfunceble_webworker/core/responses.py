@@ -0,0 +1,376 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our responses and the fast path used to
+render the result of our checkers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import enum
+import functools
+import typing
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+import msgpack
+import orjson
+from fastapi import Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover ## Optional dependency.
+    cbor2 = None
+
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.models.projection import ProjectionParams
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Provides a JSON response which is encoded through orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+def encode_default(value: Any) -> Any:
+    """
+    Provides the representation of the values unknown to our binary encoders.
+
+    The values are represented the same way as in our JSON responses.
+    """
+
+    if isinstance(value, datetime.datetime):
+        if value.utcoffset() == datetime.timedelta(0):
+            return value.replace(tzinfo=None).isoformat() + "Z"
+        return value.isoformat()
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    raise TypeError(f"Object of type {type(value)} is not serializable.")
+
+
+class MessagePackResponse(Response):
+    """
+    Provides a MessagePack response.
+    """
+
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=encode_default, use_bin_type=True)
+
+
+class CBORResponse(Response):
+    """
+    Provides a CBOR response.
+
+    .. note::
+        Only available when :code:`cbor2` is installed.
+    """
+
+    media_type = "application/cbor"
+
+    def render(self, content: Any) -> bytes:
+        return cbor2.dumps(
+            to_cbor_native(content),
+            default=lambda encoder, x: encoder.encode(encode_default(x)),
+        )
+
+
+def to_cbor_native(value: Any) -> Any:
+    """
+    Provides the given value with its dates and times converted the same way as
+    in our JSON responses.
+
+    .. note::
+        :code:`cbor2` natively encodes the dates and times - as CBOR tags - so
+        they never reach its :code:`default` hook.
+    """
+
+    if isinstance(value, dict):
+        return {x: to_cbor_native(y) for x, y in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [to_cbor_native(x) for x in value]
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return encode_default(value)
+
+    return value
+
+
+MEDIA_TYPE2RESPONSE: Dict[str, Type[Response]] = {
+    "application/json": FastJSONResponse,
+    "application/msgpack": MessagePackResponse,
+    "application/x-msgpack": MessagePackResponse,
+    "application/vnd.msgpack": MessagePackResponse,
+}
+"""
+The response class to use for each supported media type.
+"""
+
+if cbor2 is not None:
+    MEDIA_TYPE2RESPONSE["application/cbor"] = CBORResponse
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Provides the media type to use for the given :code:`Accept` header.
+
+    We fall back to JSON when none of the accepted media types is supported.
+    """
+
+    if not accept:
+        return responses_defaults.DEFAULT_MEDIA_TYPE
+
+    candidates = []
+
+    for index, part in enumerate(accept.split(",")):
+        media_type, *params = [x.strip() for x in part.split(";")]
+        quality = 1.0
+
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+
+        if quality > 0:
+            candidates.append((-quality, index, media_type.lower()))
+
+    for _, _, media_type in sorted(candidates):
+        if media_type in MEDIA_TYPE2RESPONSE:
+            return media_type
+
+        if media_type in ("*/*", "application/*"):
+            break
+
+    return responses_defaults.DEFAULT_MEDIA_TYPE
+
+
+def get_media_type(
+    accept: Optional[str] = Header(None, include_in_schema=False),
+) -> str:
+    """
+    Provides the media type negotiated with the end-user.
+    """
+
+    return negotiate(accept)
+
+
+def unwrap_annotation(annotation: Any) -> Any:
+    """
+    Provides the given annotation without its :code:`Optional` wrapper.
+    """
+
+    if typing.get_origin(annotation) is typing.Union:
+        arguments = [x for x in typing.get_args(annotation) if x is not type(None)]
+
+        if len(arguments) == 1:
+            return arguments[0]
+
+    return annotation
+
+
+@functools.lru_cache(maxsize=None)
+def get_model_layout(
+    model: Type[BaseModel],
+) -> Tuple[Tuple[str, Optional[Type[BaseModel]], bool], ...]:
+    """
+    Provides the layout of the given model.
+
+    Each entry is a tuple of the field name, the model of the (nested) field -
+    if any - and whether the field should be given as integer.
+    """
+
+    result = []
+
+    for name, field in model.model_fields.items():
+        annotation = unwrap_annotation(field.annotation)
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            result.append((name, annotation, False))
+        else:
+            result.append((name, None, annotation is int))
+
+    return tuple(result)
+
+
+def get_fields(
+    model: Type[BaseModel], projection: Optional[ProjectionParams] = None
+) -> Optional[FrozenSet[str]]:
+    """
+    Provides the fields to provide, as requested through the given projection.
+
+    :raise HTTPException:
+        When an unknown field is requested.
+    """
+
+    if projection is None:
+        return None
+
+    if projection.fields:
+        fields = frozenset(x.strip() for x in projection.fields.split(",") if x.strip())
+    elif projection.compact:
+        fields = frozenset(responses_defaults.COMPACT_FIELDS)
+    else:
+        return None
+
+    unknown = fields - model.model_fields.keys()
+
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown field(s): {', '.join(sorted(unknown))}.",
+        )
+
+    return fields
+
+
+@functools.lru_cache(maxsize=None)
+def get_projection(model: Type[BaseModel]) -> Callable[..., ProjectionParams]:
+    """
+    Provides the dependency which gives the projection requested by the
+    end-user - once validated against the given model.
+
+    Unknown fields are therefore rejected before the route runs - e.g. before
+    a check is made for nothing.
+    """
+
+    def dependency(projection: ProjectionParams = Depends()) -> ProjectionParams:
+        get_fields(model, projection)
+
+        return projection
+
+    return dependency
+
+
+def project(
+    model: Type[BaseModel], data: Any, fields: Optional[FrozenSet[str]] = None
+) -> dict:
+    """
+    Projects the given data into the layout of the given model.
+
+    Unlike a validation, we only keep the keys known by the model and leave the
+    values as they are. This is safe as long as the given data comes from a
+    trusted source - like the status of our checkers.
+
+    :param data:
+        The data to project. It can be a :py:class:`dict` or any object
+        - like the status of our checkers - which exposes the fields as
+        attributes.
+    :param fields:
+        The fields to provide. Any other field is not read at all.
+    """
+
+    if isinstance(data, dict):
+        getter = data.get
+    else:
+
+        def getter(name: str) -> Any:
+            return getattr(data, name, None)
+
+    result = {}
+
+    for name, sub_model, as_int in get_model_layout(model):
+        if fields is not None and name not in fields:
+            continue
+
+        value = getter(name)
+
+        if value is not None:
+            if sub_model is not None:
+                value = project(sub_model, value)
+            elif as_int and isinstance(value, float):
+                value = int(value)
+
+        result[name] = value
+
+    return result
+
+
+def respond(
+    content: Any, media_type: str = responses_defaults.DEFAULT_MEDIA_TYPE
+) -> Response:
+    """
+    Provides the response encoding the given content in the given media type.
+    """
+
+    return MEDIA_TYPE2RESPONSE[media_type](content, headers={"Vary": "Accept"})
+
+
+def render(
+    model: Type[BaseModel],
+    data: Any,
+    projection: Optional[ProjectionParams] = None,
+    media_type: str = responses_defaults.DEFAULT_MEDIA_TYPE,
+) -> Response:
+    """
+    Renders the given (trusted) data as the given model.
+
+    As we give a response back, FastAPI does not validate nor serialize the data
+    again. The :code:`response_model` of the route is still used to document the
+    endpoint.
+
+    :param projection:
+        The projection requested by the end-user.
+    :param media_type:
+        The media type negotiated with the end-user.
+    """
+
+    return respond(project(model, data, get_fields(model, projection)), media_type)
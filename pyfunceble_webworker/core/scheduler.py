@@ -0,0 +1,413 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the scheduler of our checkers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextvars
+import functools
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
+
+from pyfunceble_webworker.core.dns_cache import DNSLookup, resolve_all_async
+from pyfunceble_webworker.core.history import record_status
+from pyfunceble_webworker.core.profiling import profile_call
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.core.tracing import start_span
+
+INTERACTIVE_LANE: str = "interactive"
+"""
+The lane of the single-subject requests.
+"""
+
+BULK_LANE: str = "bulk"
+"""
+The lane of the batch and job items.
+"""
+
+WAIT_WINDOW: int = 1024
+"""
+The number of queue waits (per lane) we keep to compute our percentiles.
+"""
+
+
+class Task(NamedTuple):
+    """
+    Describes a scheduled task.
+    """
+
+    func: Callable[[], Any]
+    future: concurrent.futures.Future
+    enqueued_at: float
+
+
+class Lane:
+    """
+    Provides a lane of our scheduler.
+
+    Each lane holds a queue per client. Clients are served in turn (round
+    robin) so that one client can't starve the others.
+
+    :param weight:
+        The share of the workers the lane gets when all lanes are busy.
+    """
+
+    def __init__(self, name: str, weight: int) -> None:
+        self.name = name
+        self.weight = weight
+
+        self.queues: Dict[str, Deque[Task]] = {}
+        self.clients: Deque[str] = collections.deque()
+        self.size = 0
+
+        self.pass_value = 0.0
+        self.started = 0
+        self.waits: Deque[float] = collections.deque(maxlen=WAIT_WINDOW)
+
+    def push(self, client: str, task: Task) -> None:
+        """
+        Queues the given task of the given client.
+        """
+
+        if client not in self.queues:
+            self.queues[client] = collections.deque()
+            self.clients.append(client)
+
+        self.queues[client].append(task)
+        self.size += 1
+
+    def pop(self) -> Task:
+        """
+        Provides the next task - of the next client.
+        """
+
+        client = self.clients.popleft()
+        queue = self.queues[client]
+        task = queue.popleft()
+
+        if queue:
+            self.clients.append(client)
+        else:
+            del self.queues[client]
+
+        self.size -= 1
+
+        return task
+
+    def get_wait_percentiles(self) -> Dict[str, float]:
+        """
+        Provides the percentiles (in seconds) of the latest queue waits.
+        """
+
+        waits = sorted(self.waits)
+
+        if not waits:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        return {
+            f"p{x}": waits[min(len(waits) - 1, int(len(waits) * x / 100))]
+            for x in (50, 95, 99)
+        }
+
+
+class Scheduler:
+    """
+    Provides a weighted fair scheduler.
+
+    Tasks are run by a fixed number of threads. When multiple lanes are
+    waiting, each lane is served proportionally to its weight (stride
+    scheduling). Inside a lane, clients are served in turn.
+
+    :param max_workers:
+        The number of threads running our tasks.
+    :param weights:
+        The weight of each lane.
+    """
+
+    def __init__(self, max_workers: int, weights: Dict[str, int]) -> None:
+        self.max_workers = max_workers
+        self.lanes = {x: Lane(x, y) for x, y in weights.items()}
+
+        self.condition = threading.Condition()
+        self.virtual_time = 0.0
+        self.running = 0
+        self.stopped = False
+
+        self.threads: List[threading.Thread] = []
+
+        for index in range(max_workers):
+            thread = threading.Thread(
+                target=self.work, name=f"scheduler-{index}", daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(
+        self, func: Callable[[], Any], *, lane: str, client: str = ""
+    ) -> concurrent.futures.Future:
+        """
+        Schedules the given function.
+
+        :param lane:
+            The lane to schedule into.
+        :param client:
+            The client which submitted the function.
+        """
+
+        future = concurrent.futures.Future()
+
+        with self.condition:
+            if self.stopped:
+                raise RuntimeError("Cannot schedule after shutdown.")
+
+            selected_lane = self.lanes[lane]
+
+            if not selected_lane.size:
+                # An idle lane does not earn credit while it was idle.
+                selected_lane.pass_value = max(
+                    selected_lane.pass_value, self.virtual_time
+                )
+
+            selected_lane.push(client, Task(func, future, time.monotonic()))
+            self.condition.notify()
+
+        return future
+
+    def next_task(self) -> Optional[Task]:
+        """
+        Provides the next task to run.
+
+        .. warning::
+            Should only be called while holding our condition.
+        """
+
+        candidates = [x for x in self.lanes.values() if x.size]
+
+        if not candidates:
+            return None
+
+        lane = min(candidates, key=lambda x: x.pass_value)
+        self.virtual_time = lane.pass_value
+        lane.pass_value += 1 / lane.weight
+
+        task = lane.pop()
+        lane.waits.append(time.monotonic() - task.enqueued_at)
+        lane.started += 1
+
+        return task
+
+    def work(self) -> None:
+        """
+        Runs the scheduled tasks until shutdown.
+        """
+
+        while True:
+            with self.condition:
+                task = self.next_task()
+
+                while task is None and not self.stopped:
+                    self.condition.wait()
+                    task = self.next_task()
+
+                if task is None:
+                    return
+
+                self.running += 1
+
+            try:
+                if task.future.set_running_or_notify_cancel():
+                    try:
+                        task.future.set_result(task.func())
+                    except BaseException as exception:  # pylint: disable=broad-except
+                        task.future.set_exception(exception)
+            finally:
+                with self.condition:
+                    self.running -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stops our threads and cancels the queued tasks.
+        """
+
+        with self.condition:
+            self.stopped = True
+
+            for lane in self.lanes.values():
+                while lane.size:
+                    lane.pop().future.cancel()
+
+            self.condition.notify_all()
+
+    def get_stats(self) -> dict:
+        """
+        Provides the statistics of our scheduler.
+        """
+
+        with self.condition:
+            return {
+                "workers": self.max_workers,
+                "running": self.running,
+                "lanes": {
+                    x.name: {
+                        "weight": x.weight,
+                        "queued": x.size,
+                        "started": x.started,
+                        "wait": x.get_wait_percentiles(),
+                    }
+                    for x in self.lanes.values()
+                },
+            }
+
+
+SCHEDULER: Optional[Scheduler] = None
+"""
+The scheduler shared by all our checkers.
+"""
+
+SCHEDULER_LOCK = threading.Lock()
+"""
+The lock protecting the creation of our scheduler.
+"""
+
+
+def get_scheduler() -> Scheduler:
+    """
+    Provides the scheduler. The scheduler is created on first use.
+    """
+
+    global SCHEDULER
+
+    with SCHEDULER_LOCK:
+        if SCHEDULER is None:
+            SCHEDULER = Scheduler(
+                core_settings.SCHEDULER_MAX_WORKERS,
+                {
+                    INTERACTIVE_LANE: core_settings.SCHEDULER_INTERACTIVE_WEIGHT,
+                    BULK_LANE: core_settings.SCHEDULER_BULK_WEIGHT,
+                },
+            )
+
+    return SCHEDULER
+
+
+def shutdown_scheduler() -> None:
+    """
+    Shutdowns the scheduler - if it was ever started.
+    """
+
+    global SCHEDULER
+
+    with SCHEDULER_LOCK:
+        if SCHEDULER is not None:
+            SCHEDULER.shutdown()
+            SCHEDULER = None
+
+
+async def run_checker(
+    checker: Callable,
+    subject: str,
+    *,
+    lane: str = INTERACTIVE_LANE,
+    client: str = "",
+    get_dns_lookups: Optional[Callable[[dict, str], List[DNSLookup]]] = None,
+    **kwargs,
+) -> Any:
+    """
+    Runs - through our scheduler - the given checker and provides its status.
+
+    :param checker:
+        The checker class. It is initialized with the given subject and
+        arguments.
+    :param lane:
+        The lane to schedule into.
+    :param client:
+        The client the check is made for.
+    :param get_dns_lookups:
+        Provides the DNS lookups the checker runs against the subject - from
+        its arguments. They are run on the event loop before the check is
+        scheduled.
+    """
+
+    if get_dns_lookups is not None and core_settings.DNS_ASYNC_ENABLED:
+        # The lookups are chosen through the syntax checkers of PyFunceble -
+        # which may read their datasets: not on the event loop.
+        lookups = await asyncio.get_running_loop().run_in_executor(
+            None, get_dns_lookups, kwargs, subject
+        )
+
+        # Our threads are not held while waiting for the nameservers: the check
+        # finds the responses in our DNS cache.
+        await resolve_all_async(lookups)
+
+    def check():
+        with start_span(
+            "check",
+            attributes={"pyfunceble.checker": checker.__name__, "scheduler.lane": lane},
+        ):
+            status = checker(subject, **kwargs).get_status()
+
+        record_status(checker, status)
+        return status
+
+    # The check runs in the context of the request - e.g. its profile and its
+    # current span - while our workers run it.
+    context = contextvars.copy_context()
+
+    return await asyncio.wrap_future(
+        get_scheduler().submit(
+            functools.partial(context.run, profile_call, check),
+            lane=lane,
+            client=client,
+        )
+    )
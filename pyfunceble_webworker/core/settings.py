@@ -51,7 +51,7 @@ License:
     limitations under the License.
 """
 
-from typing import List
+from typing import Dict, List, Optional
 
 from pydantic import AnyHttpUrl
 from pydantic_settings import BaseSettings
@@ -73,6 +73,457 @@ class CoreSettings(BaseSettings):
     Activate or deactivates the WHOIS lookup - when available.
     """
 
+    CONVERTER_MAX_WORKERS: Optional[int] = None
+    """
+    The maximum number of processes to use for the bulk conversions.
+
+    When not given, we follow the number of CPUs available to us.
+    """
+
+    CONVERTER_CHUNK_SIZE: int = 5000
+    """
+    The number of lines to give to each process of the bulk conversions.
+
+    Any input smaller than this is converted directly - without going through
+    the process pool.
+    """
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    """
+    The minimum size (in bytes) of a response before we compress it.
+    """
+
+    COMPRESSION_GZIP_LEVEL: int = 6
+    """
+    The compression level to use when compressing with gzip.
+    """
+
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    """
+    The compression level to use when compressing with zstd.
+    """
+
+    DATASETS_LINKS: Dict[str, AnyHttpUrl] = {}
+    """
+    Overwrites the link to download the datasets from. The keys are the name of
+    the datasets (:code:`iana`, :code:`psl`, :code:`user_agents` and
+    :code:`ipv4_reputation`).
+    """
+
+    DATASETS_DOWNLOAD_TIMEOUT: float = 30.0
+    """
+    The timeout (in seconds) of the download of a dataset.
+    """
+
+    LOCATION: Dict[str, Optional[str]] = {}
+    """
+    Overwrites the location of the current node. When given, the location is
+    never looked up. The keys are :code:`continent`, :code:`continent_code`,
+    :code:`country` and :code:`country_code`.
+    """
+
+    LOCATION_LOOKUP_URL: AnyHttpUrl = "http://ip-api.com/json"
+    """
+    The URL of the service to use to lookup the location of the current node.
+    """
+
+    LOCATION_LOOKUP_TIMEOUT: float = 10.0
+    """
+    The timeout (in seconds) of the lookup of the location of the current node.
+    """
+
+    RATE_LIMIT_ENABLED: bool = False
+    """
+    Whether we limit the rate of the requests of each client.
+    """
+
+    RATE_LIMIT_EXPENSIVE_CAPACITY: int = 30
+    """
+    The number of requests a client can burst into our expensive routes
+    (availability, reputation).
+    """
+
+    RATE_LIMIT_EXPENSIVE_REFILL_RATE: float = 1.0
+    """
+    The number of requests (per second) a client can sustain into our expensive
+    routes (availability, reputation).
+    """
+
+    RATE_LIMIT_CHEAP_CAPACITY: int = 300
+    """
+    The number of requests a client can burst into our cheap routes (syntax,
+    converter).
+    """
+
+    RATE_LIMIT_CHEAP_REFILL_RATE: float = 10.0
+    """
+    The number of requests (per second) a client can sustain into our cheap
+    routes (syntax, converter).
+    """
+
+    RATE_LIMIT_API_KEY_HEADER: str = "X-API-Key"
+    """
+    The header which holds the API key of a client.
+    """
+
+    RATE_LIMIT_API_KEYS: List[str] = []
+    """
+    The known API keys. Clients giving a known API key get their own budget
+    instead of sharing the one of their IP.
+    """
+
+    UPSTREAM_WHOIS_MAX_CONCURRENCY: Optional[int] = 2
+    """
+    The maximum number of queries running - at the same time - against each
+    WHOIS server. :code:`None` for no limit.
+    """
+
+    UPSTREAM_WHOIS_QUERIES_PER_SECOND: Optional[float] = 1.0
+    """
+    The maximum number of queries started - per second - against each WHOIS
+    server. :code:`None` for no limit.
+    """
+
+    UPSTREAM_WHOIS_SERVER: Optional[str] = None
+    """
+    The WHOIS server (:code:`host[:port]`) to send all WHOIS queries to -
+    instead of the one of the IANA database. Mostly useful to test against
+    a local stand-in.
+    """
+
+    UPSTREAM_DNS_MAX_CONCURRENCY: Optional[int] = None
+    """
+    The maximum number of queries running - at the same time - against each
+    DNS nameserver. :code:`None` for no limit.
+    """
+
+    UPSTREAM_DNS_QUERIES_PER_SECOND: Optional[float] = None
+    """
+    The maximum number of queries started - per second - against each DNS
+    nameserver. :code:`None` for no limit.
+    """
+
+    UPSTREAM_HTTP_MAX_CONCURRENCY: Optional[int] = 8
+    """
+    The maximum number of requests running - at the same time - against each
+    HTTP host. :code:`None` for no limit.
+    """
+
+    UPSTREAM_HTTP_QUERIES_PER_SECOND: Optional[float] = None
+    """
+    The maximum number of requests started - per second - against each HTTP
+    host. :code:`None` for no limit.
+    """
+
+    ADAPTIVE_TIMEOUTS_ENABLED: bool = True
+    """
+    Whether the timeouts of our DNS and WHOIS queries are learned - per
+    nameserver and WHOIS server - from their latest latencies.
+    """
+
+    ADAPTIVE_TIMEOUTS_PERCENTILE: float = 99.0
+    """
+    The percentile of the latest latencies of an upstream its timeout is
+    learned from.
+    """
+
+    ADAPTIVE_TIMEOUTS_MULTIPLIER: float = 2.0
+    """
+    The multiplier applied to the percentile of the latest latencies of an
+    upstream to get its timeout.
+    """
+
+    ADAPTIVE_TIMEOUTS_WINDOW: int = 256
+    """
+    The number of latencies (per upstream) we keep to learn its timeout.
+    """
+
+    ADAPTIVE_TIMEOUTS_MIN_SAMPLES: int = 16
+    """
+    The number of latencies of an upstream we need before we learn its timeout.
+    Until then, the timeout of PyFunceble's configuration is applied.
+    """
+
+    ADAPTIVE_TIMEOUTS_DNS_MIN: float = 0.5
+    """
+    The minimum timeout (in seconds) we may learn for a DNS nameserver.
+    """
+
+    ADAPTIVE_TIMEOUTS_DNS_MAX: float = 10.0
+    """
+    The maximum timeout (in seconds) we may learn for a DNS nameserver.
+    """
+
+    ADAPTIVE_TIMEOUTS_WHOIS_MIN: float = 2.0
+    """
+    The minimum timeout (in seconds) we may learn for a WHOIS server.
+    """
+
+    ADAPTIVE_TIMEOUTS_WHOIS_MAX: float = 30.0
+    """
+    The maximum timeout (in seconds) we may learn for a WHOIS server.
+    """
+
+    DNS_CACHE_ENABLED: bool = True
+    """
+    Whether the DNS responses are cached - as long as told by their TTL.
+    """
+
+    DNS_CACHE_MAX_SIZE: int = 10000
+    """
+    The maximum number of DNS responses we cache.
+    """
+
+    DNS_CACHE_MAX_TTL: float = 300.0
+    """
+    The maximum time (in seconds) a DNS response is cached - whatever its TTL.
+    """
+
+    DNS_CACHE_NEGATIVE_TTL: float = 60.0
+    """
+    The time (in seconds) a negative DNS response is cached when it does not
+    tell us - through its SOA record - for how long.
+    """
+
+    DNS_CACHE_FAILURE_TTL: float = 5.0
+    """
+    The time (in seconds) a DNS failure (timeout, SERVFAIL, ...) is cached.
+    """
+
+    DNS_ASYNC_ENABLED: bool = True
+    """
+    Whether the DNS lookups of our availability and reputation endpoints run on
+    the event loop - ahead of their check - instead of in our threads.
+    """
+
+    HTTP_CLIENT_ENABLED: bool = True
+    """
+    Whether the HTTP status codes are queried through our shared (async) HTTP
+    client instead of through PyFunceble.
+    """
+
+    HTTP_CLIENT_HTTP2: bool = True
+    """
+    Whether our HTTP client negotiates HTTP/2 with HTTPS origins. Only
+    available when :code:`h2` is installed.
+    """
+
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    """
+    The maximum number of connections - per proxy - opened by our HTTP client.
+    """
+
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 5.0
+    """
+    The time (in seconds) an idle connection is kept open by our HTTP client.
+    """
+
+    HTTP_CLIENT_MAX_REDIRECTS: int = 10
+    """
+    The maximum number of redirects followed by our HTTP client.
+    """
+
+    HISTORY_ENABLED: bool = True
+    """
+    Whether the results of our checkers are recorded - under our data
+    directory.
+    """
+
+    HISTORY_RETENTION_DAYS: int = 30
+    """
+    The number of days we keep a recorded result.
+    """
+
+    HISTORY_MAX_RESULTS_PER_SUBJECT: int = 100
+    """
+    The maximum number of results we keep - per subject and checker. The oldest
+    ones are deleted first.
+    """
+
+    HISTORY_BATCH_SIZE: int = 512
+    """
+    The maximum number of results recorded at once.
+    """
+
+    HISTORY_FLUSH_INTERVAL: float = 1.0
+    """
+    The maximum time (in seconds) a result waits before being recorded.
+    """
+
+    SCHEDULER_MAX_WORKERS: int = 32
+    """
+    The number of threads running our checkers.
+    """
+
+    SCHEDULER_INTERACTIVE_WEIGHT: int = 8
+    """
+    The share of the threads given to the single-subject requests when bulk
+    work is waiting too.
+    """
+
+    SCHEDULER_BULK_WEIGHT: int = 1
+    """
+    The share of the threads given to the bulk work when single-subject
+    requests are waiting too.
+    """
+
+    JOBS_MAX_SUBJECTS: int = 100000
+    """
+    The maximum number of subjects of a job.
+    """
+
+    JOBS_MAX_IN_FLIGHT: int = 16
+    """
+    The maximum number of subjects - of a job - given to our scheduler at the
+    same time.
+    """
+
+    JOBS_DNS_PREFETCH_MAX_IN_FLIGHT: int = 32
+    """
+    The maximum number of subjects - of a job - whose DNS records are
+    prefetched at the same time. :code:`0` to disable the prefetching.
+    """
+
+    JOBS_DNS_PREFETCH_LOOK_AHEAD: int = 256
+    """
+    The number of subjects - of a job - whose DNS records are prefetched ahead
+    of their check.
+    """
+
+    JOBS_CHECKPOINT_SIZE: int = 100
+    """
+    The number of results after which the results of a job are synced to disk.
+    """
+
+    JOBS_CHECKPOINT_INTERVAL: float = 5.0
+    """
+    The time (in seconds) after which the results of a job are synced to disk.
+    """
+
+    JOBS_RETENTION_DAYS: int = 7
+    """
+    The number of days we keep a finished job.
+    """
+
+    COORDINATOR_ENABLED: bool = False
+    """
+    Whether we run in coordinator mode: jobs can be sharded across our peers.
+    """
+
+    COORDINATOR_PEERS: List[AnyHttpUrl] = []
+    """
+    The base URL of our peers. More peers can be registered through our API.
+    """
+
+    COORDINATOR_API_KEY: Optional[str] = None
+    """
+    The API key to give to our peers.
+    """
+
+    COORDINATOR_ADMIN_API_KEY: Optional[str] = None
+    """
+    The API key - given through the :code:`RATE_LIMIT_API_KEY_HEADER` header -
+    required to register or unregister peers through our API. Peers can't be
+    registered through our API when unset.
+    """
+
+    COORDINATOR_SHARD_SIZE: int = 10000
+    """
+    The maximum number of subjects of a shard.
+    """
+
+    COORDINATOR_SHARD_RETRIES: int = 3
+    """
+    The number of times the subjects of a failed shard are reassigned to another
+    peer.
+    """
+
+    COORDINATOR_MAX_ERRORS: int = 5
+    """
+    The number of consecutive errors after which a shard is considered failed.
+    """
+
+    COORDINATOR_POLL_INTERVAL: float = 2.0
+    """
+    The time (in seconds) between 2 polls of our peers.
+    """
+
+    COORDINATOR_REQUEST_TIMEOUT: float = 10.0
+    """
+    The timeout (in seconds) of the requests to our peers.
+    """
+
+    COORDINATOR_VIRTUAL_NODES: int = 64
+    """
+    The number of virtual nodes of each peer on our hash ring.
+    """
+
+    LOG_QUEUE_ENABLED: bool = True
+    """
+    Whether our log records are written by a background thread - through a
+    queue - instead of the thread which emits them.
+    """
+
+    ACCESS_LOG_ENABLED: bool = False
+    """
+    Whether we write one structured line per request - into the
+    :code:`pyfunceble_webworker.access` logger.
+    """
+
+    TRACING_ENABLED: bool = False
+    """
+    Whether we trace our requests - and the stages and queries of our checks.
+    """
+
+    TRACING_EXPORTER: str = "file"
+    """
+    Where we export our spans: :code:`file` or :code:`otlp`.
+    """
+
+    TRACING_FILE: Optional[str] = None
+    """
+    The file where the :code:`file` exporter appends our spans. Defaults to
+    :code:`traces.jsonl` under our data directory.
+    """
+
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    """
+    The OTLP/HTTP endpoint the :code:`otlp` exporter sends our spans to.
+    """
+
+    TRACING_OTLP_HEADERS: Dict[str, str] = {}
+    """
+    The headers (JSON object) sent to the OTLP/HTTP endpoint - e.g. for
+    authentication.
+    """
+
+    TRACING_SERVICE_NAME: str = "pyfunceble-webworker"
+    """
+    The name we give to the collector.
+    """
+
+    TRACING_SAMPLE_RATIO: float = 1.0
+    """
+    The ratio of the traces started by us which are recorded. Traces started by
+    our callers follow their decision.
+    """
+
+    PROFILING_ENABLED: bool = False
+    """
+    Whether a request can ask - through :code:`PROFILING_HEADER` or the
+    :code:`profile` query parameter - to be profiled.
+    """
+
+    PROFILING_HEADER: str = "X-Profile"
+    """
+    The header asking for a profile.
+    """
+
+    PROFILING_LIMIT: int = 30
+    """
+    The number of functions listed by a JSON profile.
+    """
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,418 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the timeouts - learned from the observed
+latencies - of the queries we send to the upstreams (DNS nameservers and WHOIS
+servers).
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import collections
+import functools
+import threading
+import time
+from typing import Callable, Deque, Dict, Optional
+
+import dns.asyncquery
+import dns.exception
+import dns.query
+from PyFunceble.query.whois.query_tool import WhoisQueryTool
+
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.core.upstreams import get_whois_server
+
+TIMEOUT_ERRORS = (dns.exception.Timeout, TimeoutError)
+"""
+The errors telling us that a DNS query timed out.
+"""
+
+
+class LatencyWindow:
+    """
+    Provides the latest latencies observed against a single upstream.
+
+    Only the answered queries give us a latency. A timed out query makes us
+    back off instead: until the next answer, the timeout of the upstream is at
+    least the timeout which was applied times the given multiplier. An upstream
+    which slowed down beyond its learned timeout therefore gets the time it
+    now needs - and answers which teach us its new latencies.
+
+    :param size:
+        The number of latencies we keep.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.lock = threading.Lock()
+        self.latencies: Deque[float] = collections.deque(maxlen=size)
+        self.queries = 0
+        self.failures = 0
+        self.backoff: Optional[float] = None
+
+        self.sorted_latencies: Optional[list] = None
+
+    def observe(self, latency: float) -> None:
+        """
+        Records the latency of an answered query.
+        """
+
+        with self.lock:
+            self.latencies.append(latency)
+            self.queries += 1
+            self.backoff = None
+            self.sorted_latencies = None
+
+    def observe_failure(
+        self, timeout: Optional[float] = None, multiplier: float = 2.0
+    ) -> None:
+        """
+        Records a failed query.
+
+        :param timeout:
+            The timeout (in seconds) which was applied - when the query timed
+            out.
+        :param multiplier:
+            What we multiply the applied timeout with to back off.
+        """
+
+        with self.lock:
+            self.queries += 1
+            self.failures += 1
+
+            if timeout:
+                # Concurrent queries which timed out with the same timeout
+                # only back off once.
+                self.backoff = max(self.backoff or 0.0, timeout * multiplier)
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Provides the given percentile (in seconds) of the latest latencies.
+        """
+
+        with self.lock:
+            if self.sorted_latencies is None:
+                self.sorted_latencies = sorted(self.latencies)
+
+            latencies = self.sorted_latencies
+
+        if not latencies:
+            return None
+
+        return latencies[
+            min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+        ]
+
+
+class AdaptiveTimeouts:
+    """
+    Provides the registry of the timeouts of a kind of upstream.
+
+    Once enough latencies are known, the timeout of an upstream is the given
+    percentile of its latest latencies times the given multiplier - kept
+    between the given bounds. Until then, the timeout given by PyFunceble's
+    configuration is applied. An upstream which times out gets - up to the
+    maximum - a longer timeout until it answers again.
+
+    :param minimum:
+        The minimum timeout (in seconds) we may learn.
+    :param maximum:
+        The maximum timeout (in seconds) we may learn.
+    """
+
+    def __init__(self, minimum: float, maximum: float) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+
+        self.enabled = False
+        self.percentile = 99.0
+        self.multiplier = 2.0
+        self.window = 256
+        self.min_samples = 16
+
+        self.lock = threading.Lock()
+        self.windows: Dict[str, LatencyWindow] = {}
+
+    def get_window(self, upstream: str) -> LatencyWindow:
+        """
+        Provides the latencies of the given upstream.
+        """
+
+        try:
+            return self.windows[upstream]
+        except KeyError:
+            with self.lock:
+                return self.windows.setdefault(upstream, LatencyWindow(self.window))
+
+    def get_learned_timeout(self, upstream: str) -> Optional[float]:
+        """
+        Provides the timeout learned for the given upstream - if any.
+        """
+
+        window = self.get_window(upstream)
+
+        if len(window.latencies) < self.min_samples:
+            return None
+
+        return min(
+            self.maximum,
+            max(self.minimum, window.get_percentile(self.percentile) * self.multiplier),
+        )
+
+    def get_timeout(
+        self, upstream: str, default: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Provides the timeout to apply to a query against the given upstream.
+
+        :param default:
+            The timeout to apply when we did not learn one, yet.
+        """
+
+        if not self.enabled:
+            return default
+
+        learned = self.get_learned_timeout(upstream)
+        timeout = default if learned is None else learned
+
+        backoff = self.get_backoff(upstream)
+
+        if backoff is not None and timeout is not None:
+            return max(timeout, backoff)
+
+        return timeout
+
+    def get_backoff(self, upstream: str) -> Optional[float]:
+        """
+        Provides the timeout the given upstream backed off to - if any.
+        """
+
+        backoff = self.get_window(upstream).backoff
+
+        return None if backoff is None else min(self.maximum, backoff)
+
+    def observe_timeout(self, upstream: str, timeout: Optional[float]) -> None:
+        """
+        Records a query against the given upstream which timed out.
+
+        :param timeout:
+            The timeout (in seconds) which was applied.
+        """
+
+        self.get_window(upstream).observe_failure(timeout, self.multiplier)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """
+        Provides what we learned - per upstream.
+        """
+
+        with self.lock:
+            windows = dict(self.windows)
+
+        return {
+            upstream: {
+                "queries": window.queries,
+                "failures": window.failures,
+                "samples": len(window.latencies),
+                "latency": {f"p{x}": window.get_percentile(x) for x in (50, 95, 99)},
+                "timeout": self.get_learned_timeout(upstream),
+                "backoff": self.get_backoff(upstream),
+            }
+            for upstream, window in windows.items()
+        }
+
+
+DNS_TIMEOUTS = AdaptiveTimeouts(0.5, 10.0)
+"""
+The timeouts of our DNS nameservers.
+"""
+
+WHOIS_TIMEOUTS = AdaptiveTimeouts(2.0, 30.0)
+"""
+The timeouts of our WHOIS servers.
+"""
+
+
+def wrap_dns_query(func: Callable) -> Callable:
+    """
+    Wraps the given :py:mod:`dns.query` (or :py:mod:`dns.asyncquery`) function
+    so that it applies - and learns - the timeout of the queried nameserver.
+    """
+
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(query, where: str, *args, **kwargs):
+            if "timeout" in kwargs:
+                kwargs["timeout"] = DNS_TIMEOUTS.get_timeout(where, kwargs["timeout"])
+
+            started_at = time.monotonic()
+
+            try:
+                response = await func(query, where, *args, **kwargs)
+            except TIMEOUT_ERRORS:
+                DNS_TIMEOUTS.observe_timeout(where, kwargs.get("timeout"))
+                raise
+
+            DNS_TIMEOUTS.get_window(where).observe(time.monotonic() - started_at)
+            return response
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(query, where: str, *args, **kwargs):
+            if "timeout" in kwargs:
+                kwargs["timeout"] = DNS_TIMEOUTS.get_timeout(where, kwargs["timeout"])
+
+            started_at = time.monotonic()
+
+            try:
+                response = func(query, where, *args, **kwargs)
+            except TIMEOUT_ERRORS:
+                DNS_TIMEOUTS.observe_timeout(where, kwargs.get("timeout"))
+                raise
+
+            DNS_TIMEOUTS.get_window(where).observe(time.monotonic() - started_at)
+            return response
+
+    wrapper.__wrapped_by_timeouts__ = True
+    return wrapper
+
+
+def wrap_whois_query(func: Callable) -> Callable:
+    """
+    Wraps the :py:meth:`~PyFunceble.query.whois.query_tool.WhoisQueryTool.query`
+    method so that it applies - and learns - the timeout of the queried WHOIS
+    server.
+
+    .. note::
+        PyFunceble swallows the failures of its WHOIS queries. An empty record
+        is therefore what tells us that a query failed - and the time it took
+        whether it timed out.
+    """
+
+    @functools.wraps(func)
+    def wrapper(tool: WhoisQueryTool, *args, **kwargs):
+        server = get_whois_server(tool)
+
+        if not server or tool.lookup_record.record is not None:
+            # Nothing will be sent: no subject or already queried.
+            return func(tool, *args, **kwargs)
+
+        configured_timeout = tool.query_timeout
+        timeout = tool.query_timeout = WHOIS_TIMEOUTS.get_timeout(
+            server, configured_timeout
+        )
+
+        started_at = time.monotonic()
+
+        try:
+            record = func(tool, *args, **kwargs)
+        finally:
+            # The applied timeout is what the record of the tool tells.
+            tool.query_timeout = configured_timeout
+
+        latency = time.monotonic() - started_at
+
+        if record:
+            WHOIS_TIMEOUTS.get_window(server).observe(latency)
+        elif latency >= timeout:
+            WHOIS_TIMEOUTS.observe_timeout(server, timeout)
+        else:
+            # Refused, closed or rate limited: waiting longer would not help.
+            WHOIS_TIMEOUTS.get_window(server).observe_failure()
+
+        return record
+
+    wrapper.__wrapped_by_timeouts__ = True
+    return wrapper
+
+
+def install_adaptive_timeouts() -> None:
+    """
+    Configures our timeouts from our settings and installs them in front of the
+    queries of PyFunceble.
+
+    .. warning::
+        This must be installed before our upstream limits so that the time
+        spent waiting for them is not mistaken for latency.
+    """
+
+    for timeouts, minimum, maximum in (
+        (
+            DNS_TIMEOUTS,
+            core_settings.ADAPTIVE_TIMEOUTS_DNS_MIN,
+            core_settings.ADAPTIVE_TIMEOUTS_DNS_MAX,
+        ),
+        (
+            WHOIS_TIMEOUTS,
+            core_settings.ADAPTIVE_TIMEOUTS_WHOIS_MIN,
+            core_settings.ADAPTIVE_TIMEOUTS_WHOIS_MAX,
+        ),
+    ):
+        timeouts.enabled = core_settings.ADAPTIVE_TIMEOUTS_ENABLED
+        timeouts.minimum = minimum
+        timeouts.maximum = maximum
+        timeouts.percentile = core_settings.ADAPTIVE_TIMEOUTS_PERCENTILE
+        timeouts.multiplier = core_settings.ADAPTIVE_TIMEOUTS_MULTIPLIER
+        timeouts.window = core_settings.ADAPTIVE_TIMEOUTS_WINDOW
+        timeouts.min_samples = core_settings.ADAPTIVE_TIMEOUTS_MIN_SAMPLES
+        timeouts.windows.clear()
+
+    if not core_settings.ADAPTIVE_TIMEOUTS_ENABLED:
+        return
+
+    if not hasattr(WhoisQueryTool.query, "__wrapped_by_timeouts__"):
+        WhoisQueryTool.query = wrap_whois_query(WhoisQueryTool.query)
+
+    for module in (dns.query, dns.asyncquery):
+        for name in ("udp", "tcp", "https", "tls"):
+            func = getattr(module, name)
+
+            if not hasattr(func, "__wrapped_by_timeouts__"):
+                setattr(module, name, wrap_dns_query(func))
@@ -0,0 +1,863 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module which provides the tracing of our requests. The spans are
+exported in the OpenTelemetry (OTLP/JSON) format - to a file or to an
+OTLP/HTTP collector.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import dns.asyncquery
+import dns.query
+import dns.rcode
+import dns.rdatatype
+import orjson
+import PyFunceble.checker.availability.base
+import PyFunceble.checker.reputation.base
+import PyFunceble.factory
+import requests
+from PyFunceble.query.whois.query_tool import WhoisQueryTool
+
+import pyfunceble_webworker.storage
+from pyfunceble_webworker import __session_id__, __version__
+from pyfunceble_webworker.core.defaults import assets as assets_defaults
+from pyfunceble_webworker.core.http_client import HTTPClient
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.core.upstreams import get_whois_server
+
+INTERNAL_KIND: int = 1
+"""
+The kind of the spans of our own work.
+"""
+
+SERVER_KIND: int = 2
+"""
+The kind of the spans of the requests we serve.
+"""
+
+CLIENT_KIND: int = 3
+"""
+The kind of the spans of the queries we send to the upstreams.
+"""
+
+ERROR_STATUS: int = 2
+"""
+The status of the spans which failed.
+"""
+
+MAX_QUEUE_SIZE: int = 2048
+"""
+The maximum number of spans waiting to be exported. Spans over it are dropped.
+"""
+
+MAX_BATCH_SIZE: int = 512
+"""
+The maximum number of spans exported at once.
+"""
+
+EXPORT_INTERVAL: float = 5.0
+"""
+The maximum time (in seconds) a span waits before being exported.
+"""
+
+STAGES: Dict[str, str] = {
+    "query_common_checker": "stage.syntax",
+    "try_to_query_status_from_syntax_lookup": "stage.syntax_lookup",
+    "try_to_query_status_from_whois": "stage.whois",
+    "try_to_query_status_from_dns": "stage.dns",
+    "try_to_query_status_from_dns_lookup": "stage.dns",
+    "try_to_query_status_from_netinfo": "stage.netinfo",
+    "try_to_query_status_from_http_status_code": "stage.http_status_code",
+    "try_to_query_status_from_reputation": "stage.reputation",
+    "try_to_query_status_from_platform": "stage.platform",
+    "try_to_query_status_from_extra_rules": "stage.extra_rules",
+}
+"""
+The stages of our checkers - method to span name.
+"""
+
+
+class Span:
+    """
+    Describes an operation of a trace.
+    """
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "sampled",
+        "name",
+        "kind",
+        "attributes",
+        "events",
+        "status_code",
+        "status_message",
+        "start_time",
+        "end_time",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        trace_id: int,
+        parent_id: Optional[int] = None,
+        sampled: bool = True,
+        kind: int = INTERNAL_KIND,
+        attributes: Optional[dict] = None,
+    ) -> None:
+        self.trace_id = trace_id
+        self.span_id = random.getrandbits(64) or 1
+        self.parent_id = parent_id
+        self.sampled = sampled
+
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.events: List[dict] = []
+
+        self.status_code = 0
+        self.status_message = ""
+
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Sets the given attribute.
+        """
+
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        """
+        Marks the span as failed.
+        """
+
+        self.status_code = ERROR_STATUS
+        self.status_message = message
+
+    def record_exception(self, exception: BaseException) -> None:
+        """
+        Records the given exception and marks the span as failed.
+        """
+
+        self.set_error(str(exception))
+        self.events.append(
+            {
+                "name": "exception",
+                "time": time.time_ns(),
+                "attributes": {
+                    "exception.type": type(exception).__qualname__,
+                    "exception.message": str(exception),
+                },
+            }
+        )
+
+    def get_traceparent(self) -> str:
+        """
+        Provides the W3C :code:`traceparent` header of the span.
+        """
+
+        return (
+            f"00-{self.trace_id:032x}-{self.span_id:016x}-"
+            f"{'01' if self.sampled else '00'}"
+        )
+
+
+class SpanContext:
+    """
+    Describes the remote parent of a span - as given by a :code:`traceparent`
+    header.
+    """
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: int, span_id: int, sampled: bool) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """
+    Parses the given W3C :code:`traceparent` header.
+
+    :return:
+        :code:`None` when the header is missing or invalid.
+    """
+
+    if not value:
+        return None
+
+    parts = value.strip().lower().split("-")
+
+    if len(parts) < 4 or parts[0] == "ff" or len(parts[0]) != 2:
+        return None
+
+    version, trace_id, span_id, flags = parts[:4]
+
+    if (version == "00" and len(parts) != 4) or (
+        len(trace_id) != 32 or len(span_id) != 16 or len(flags) != 2
+    ):
+        return None
+
+    try:
+        context = SpanContext(
+            int(trace_id, 16), int(span_id, 16), bool(int(flags, 16) & 1)
+        )
+    except ValueError:
+        return None
+
+    if not context.trace_id or not context.span_id:
+        return None
+
+    return context
+
+
+def encode_value(value: Any) -> dict:
+    """
+    Encodes the given attribute value.
+    """
+
+    if isinstance(value, bool):
+        return {"boolValue": value}
+
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [encode_value(x) for x in value]}}
+
+    return {"stringValue": str(value)}
+
+
+def encode_attributes(attributes: dict) -> List[dict]:
+    """
+    Encodes the given attributes.
+    """
+
+    return [
+        {"key": key, "value": encode_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def encode_spans(spans: List[Span], resource: dict) -> bytes:
+    """
+    Encodes the given spans as an OTLP/JSON :code:`ExportTraceServiceRequest`.
+    """
+
+    encoded = []
+
+    for span in spans:
+        data = {
+            "traceId": f"{span.trace_id:032x}",
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_time),
+            "endTimeUnixNano": str(span.end_time),
+            "attributes": encode_attributes(span.attributes),
+            "status": {"code": span.status_code},
+        }
+
+        if span.parent_id:
+            data["parentSpanId"] = f"{span.parent_id:016x}"
+
+        if span.status_message:
+            data["status"]["message"] = span.status_message
+
+        if span.events:
+            data["events"] = [
+                {
+                    "name": x["name"],
+                    "timeUnixNano": str(x["time"]),
+                    "attributes": encode_attributes(x["attributes"]),
+                }
+                for x in span.events
+            ]
+
+        encoded.append(data)
+
+    return orjson.dumps(
+        {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": encode_attributes(resource)},
+                    "scopeSpans": [
+                        {
+                            "scope": {
+                                "name": "pyfunceble_webworker",
+                                "version": __version__,
+                            },
+                            "spans": encoded,
+                        }
+                    ],
+                }
+            ]
+        }
+    )
+
+
+class FileSpanExporter:
+    """
+    Appends the exported spans to the given file - one OTLP/JSON request per
+    line.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def export(self, payload: bytes) -> None:
+        """
+        Exports the given payload.
+        """
+
+        with open(self.path, "ab") as file_stream:
+            file_stream.write(payload + b"\n")
+
+
+class OTLPSpanExporter:
+    """
+    Sends the exported spans to the given OTLP/HTTP endpoint - e.g.
+    :code:`http://localhost:4318/v1/traces`.
+    """
+
+    def __init__(
+        self, endpoint: str, *, headers: Optional[dict] = None, timeout: float = 10.0
+    ) -> None:
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self.session.headers["Content-Type"] = "application/json"
+
+    def export(self, payload: bytes) -> None:
+        """
+        Exports the given payload.
+        """
+
+        self.session.post(
+            self.endpoint, data=payload, timeout=self.timeout
+        ).raise_for_status()
+
+
+class Tracer:
+    """
+    Provides our tracer. Ended spans are exported - in batches - by a
+    background thread.
+
+    :param exporter:
+        The exporter to export with.
+    :param resource:
+        The attributes describing ourselves - e.g. :code:`service.name`.
+    :param sample_ratio:
+        The ratio of the traces started by us which are recorded. Traces
+        started by our callers follow their decision.
+    """
+
+    def __init__(self, exporter, *, resource: dict, sample_ratio: float = 1.0) -> None:
+        self.exporter = exporter
+        self.resource = resource
+        self.sample_ratio = sample_ratio
+
+        self.queue: Deque[Span] = collections.deque()
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.dropped = 0
+
+        self.thread = threading.Thread(
+            target=self.run, name="pyfunceble-tracing", daemon=True
+        )
+        self.thread.start()
+
+    @contextlib.contextmanager
+    def start_span(
+        self,
+        name: str,
+        *,
+        kind: int = INTERNAL_KIND,
+        attributes: Optional[dict] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Iterator[Span]:
+        """
+        Starts a span - as a child of the given remote parent, or of the
+        current span.
+        """
+
+        parent = parent or CURRENT_SPAN.get()
+
+        if parent is None:
+            span = Span(
+                name,
+                trace_id=random.getrandbits(128) or 1,
+                sampled=random.random() < self.sample_ratio,
+                kind=kind,
+                attributes=attributes,
+            )
+        else:
+            span = Span(
+                name,
+                trace_id=parent.trace_id,
+                parent_id=parent.span_id,
+                sampled=parent.sampled,
+                kind=kind,
+                attributes=attributes,
+            )
+
+        token = CURRENT_SPAN.set(span)
+
+        try:
+            yield span
+        except BaseException as exception:
+            span.record_exception(exception)
+            raise
+        finally:
+            CURRENT_SPAN.reset(token)
+            span.end_time = time.time_ns()
+
+            if span.sampled:
+                self.push(span)
+
+    def push(self, span: Span) -> None:
+        """
+        Queues the given (ended) span for export.
+        """
+
+        with self.condition:
+            if self.stopped or len(self.queue) >= MAX_QUEUE_SIZE:
+                self.dropped += 1
+                return
+
+            self.queue.append(span)
+
+            if len(self.queue) >= MAX_BATCH_SIZE:
+                self.condition.notify()
+
+    def run(self) -> None:
+        """
+        Exports the queued spans until we are stopped.
+        """
+
+        while True:
+            with self.condition:
+                if not self.stopped and len(self.queue) < MAX_BATCH_SIZE:
+                    self.condition.wait(EXPORT_INTERVAL)
+
+                batch = [
+                    self.queue.popleft()
+                    for _ in range(min(len(self.queue), MAX_BATCH_SIZE))
+                ]
+                done = self.stopped and not self.queue
+
+            if batch:
+                try:
+                    self.exporter.export(encode_spans(batch, self.resource))
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception("Could not export %d span(s).", len(batch))
+
+            if done:
+                break
+
+    def shutdown(self) -> None:
+        """
+        Exports the queued spans and stops our thread.
+        """
+
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+        self.thread.join(EXPORT_INTERVAL * 2)
+
+
+CURRENT_SPAN: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+"""
+The span of the current operation.
+"""
+
+TRACER: Optional[Tracer] = None
+"""
+Our tracer - when the tracing is enabled.
+"""
+
+
+def start_span(
+    name: str,
+    *,
+    kind: int = INTERNAL_KIND,
+    attributes: Optional[dict] = None,
+    parent: Optional[SpanContext] = None,
+):
+    """
+    Starts a span through our tracer. When the tracing is disabled, nothing is
+    recorded and :code:`None` is given as span.
+    """
+
+    if TRACER is None:
+        return contextlib.nullcontext()
+
+    return TRACER.start_span(name, kind=kind, attributes=attributes, parent=parent)
+
+
+def get_exporter():
+    """
+    Provides the exporter configured through our settings.
+    """
+
+    if core_settings.TRACING_EXPORTER == "otlp":
+        return OTLPSpanExporter(
+            core_settings.TRACING_OTLP_ENDPOINT,
+            headers=core_settings.TRACING_OTLP_HEADERS,
+        )
+
+    return FileSpanExporter(
+        core_settings.TRACING_FILE
+        or os.path.join(
+            pyfunceble_webworker.storage.CONFIG_DIRECTORY, assets_defaults.TRACES_FILE
+        )
+    )
+
+
+def traced(
+    func: Callable,
+    name: str,
+    *,
+    kind: int = INTERNAL_KIND,
+    get_attributes: Optional[Callable[..., dict]] = None,
+    get_result_attributes: Optional[Callable[..., dict]] = None,
+) -> Callable:
+    """
+    Wraps the given function - or coroutine function - into a span.
+
+    :param get_attributes:
+        Provides the attributes of the span from the arguments of the function.
+    :param get_result_attributes:
+        Provides the attributes of the span from the result and the arguments
+        of the function.
+    """
+
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with start_span(
+                name,
+                kind=kind,
+                attributes=get_attributes(*args, **kwargs) if get_attributes else None,
+            ) as span:
+                result = await func(*args, **kwargs)
+
+                if span is not None and get_result_attributes:
+                    span.attributes.update(
+                        get_result_attributes(result, *args, **kwargs)
+                    )
+
+                return result
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(
+                name,
+                kind=kind,
+                attributes=get_attributes(*args, **kwargs) if get_attributes else None,
+            ) as span:
+                result = func(*args, **kwargs)
+
+                if span is not None and get_result_attributes:
+                    span.attributes.update(
+                        get_result_attributes(result, *args, **kwargs)
+                    )
+
+                return result
+
+    wrapper.__wrapped_by_tracer__ = True
+
+    return wrapper
+
+
+def get_dns_attributes(query, where: str, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of a :py:mod:`dns.query` function call.
+    """
+
+    attributes = {"server.address": where, "server.port": kwargs.get("port")}
+
+    if query.question:
+        attributes["dns.question.name"] = query.question[0].name.to_text()
+        attributes["dns.question.type"] = dns.rdatatype.to_text(
+            query.question[0].rdtype
+        )
+
+    return attributes
+
+
+def get_dns_result_attributes(response, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of the response of a :py:mod:`dns.query` function.
+    """
+
+    return {
+        "dns.response.code": dns.rcode.to_text(response.rcode()),
+        "dns.answer.count": len(response.answer),
+    }
+
+
+def get_whois_attributes(tool: WhoisQueryTool, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of a WHOIS query.
+    """
+
+    return {"server.address": get_whois_server(tool), "whois.subject": tool.subject}
+
+
+def get_http_attributes(method: str) -> Callable[..., dict]:
+    """
+    Provides the function which gives the attributes of a HTTP request of the
+    given method.
+    """
+
+    def get_attributes(url: str, *args, **kwargs) -> dict:
+        return {"http.request.method": method, "url.full": url}
+
+    return get_attributes
+
+
+def get_http_result_attributes(response, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of a HTTP response.
+    """
+
+    return {"http.response.status_code": response.status_code}
+
+
+def get_http_client_attributes(client: HTTPClient, url: str, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of a request of our HTTP client.
+    """
+
+    return {"http.request.method": "GET", "url.full": url}
+
+
+def get_http_client_result_attributes(response, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of a response of our HTTP client.
+    """
+
+    return {"http.response.status_code": response.status}
+
+
+def get_stage_attributes(checker, *args, **kwargs) -> dict:
+    """
+    Provides the attributes of a stage of a checker.
+    """
+
+    return {"pyfunceble.subject": checker.idna_subject}
+
+
+def get_stage_result_attributes(result, checker, *args, **kwargs) -> dict:
+    """
+    Provides the status of a checker once one of its stages ran.
+    """
+
+    return {
+        "pyfunceble.status": checker.status.status,
+        "pyfunceble.status_source": checker.status.status_source,
+    }
+
+
+def iter_checker_classes() -> Iterator[type]:
+    """
+    Provides all the availability and reputation checkers of PyFunceble.
+    """
+
+    pending = [
+        PyFunceble.checker.availability.base.AvailabilityCheckerBase,
+        PyFunceble.checker.reputation.base.ReputationCheckerBase,
+    ]
+
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+
+        yield cls
+
+
+def install_tracing() -> None:
+    """
+    Installs our spans around the stages of the checkers of PyFunceble and
+    around the queries they send.
+    """
+
+    for cls in iter_checker_classes():
+        for method, name in STAGES.items():
+            func = cls.__dict__.get(method)
+
+            if func is not None and not hasattr(func, "__wrapped_by_tracer__"):
+                setattr(
+                    cls,
+                    method,
+                    traced(
+                        func,
+                        name,
+                        get_attributes=get_stage_attributes,
+                        get_result_attributes=get_stage_result_attributes,
+                    ),
+                )
+
+    for module in (dns.query, dns.asyncquery):
+        for name in ("udp", "tcp", "https", "tls"):
+            func = getattr(module, name)
+
+            if not hasattr(func, "__wrapped_by_tracer__"):
+                setattr(
+                    module,
+                    name,
+                    traced(
+                        func,
+                        "dns.query",
+                        kind=CLIENT_KIND,
+                        get_attributes=get_dns_attributes,
+                        get_result_attributes=get_dns_result_attributes,
+                    ),
+                )
+
+    if not hasattr(WhoisQueryTool.query, "__wrapped_by_tracer__"):
+        WhoisQueryTool.query = traced(
+            WhoisQueryTool.query,
+            "whois.query",
+            kind=CLIENT_KIND,
+            get_attributes=get_whois_attributes,
+        )
+
+    requester = PyFunceble.factory.Requester
+
+    for name in ("get", "head"):
+        func = getattr(requester, name)
+
+        if not hasattr(func, "__wrapped_by_tracer__"):
+            setattr(
+                requester,
+                name,
+                traced(
+                    func,
+                    "http.request",
+                    kind=CLIENT_KIND,
+                    get_attributes=get_http_attributes(name.upper()),
+                    get_result_attributes=get_http_result_attributes,
+                ),
+            )
+
+    if not hasattr(HTTPClient.send, "__wrapped_by_tracer__"):
+        HTTPClient.send = traced(
+            HTTPClient.send,
+            "http.request",
+            kind=CLIENT_KIND,
+            get_attributes=get_http_client_attributes,
+            get_result_attributes=get_http_client_result_attributes,
+        )
+
+
+def start_tracing() -> None:
+    """
+    Starts our tracer - as configured through our settings - and installs our
+    spans.
+    """
+
+    global TRACER  # pylint: disable=global-statement
+
+    if TRACER is not None:
+        return
+
+    TRACER = Tracer(
+        get_exporter(),
+        resource={
+            "service.name": core_settings.TRACING_SERVICE_NAME,
+            "service.version": __version__,
+            "service.instance.id": __session_id__,
+        },
+        sample_ratio=core_settings.TRACING_SAMPLE_RATIO,
+    )
+
+    install_tracing()
+
+
+def shutdown_tracing() -> None:
+    """
+    Exports the pending spans and stops our tracer.
+    """
+
+    global TRACER  # pylint: disable=global-statement
+
+    if TRACER is not None:
+        TRACER.shutdown()
+        TRACER = None
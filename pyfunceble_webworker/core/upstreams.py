@@ -0,0 +1,449 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the limits of the queries we send to the
+upstreams (WHOIS servers, DNS nameservers and HTTP hosts).
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import collections
+import functools
+import threading
+import time
+import urllib.parse
+from typing import Callable, Deque, Dict, Optional, Union
+
+import dns.asyncquery
+import dns.query
+import PyFunceble.factory
+from PyFunceble.query.whois.query_tool import WhoisQueryTool
+
+from pyfunceble_webworker.core.settings import core_settings
+
+
+class UpstreamLimit:
+    """
+    Provides the limit of a single upstream.
+
+    Queries are admitted in their order of arrival (FIFO) as long as less than
+    :code:`max_concurrency` are running. Their start is then spaced so that no
+    more than :code:`queries_per_second` are sent.
+
+    :param max_concurrency:
+        The maximum number of queries running at the same time. :code:`None`
+        for no limit.
+    :param queries_per_second:
+        The maximum number of queries started per second. :code:`None` for no
+        limit.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        queries_per_second: Optional[float] = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.queries_per_second = queries_per_second
+
+        self.condition = threading.Condition()
+        # Our threads wait with a ticket, our coroutines with a future.
+        self.waiters: Deque[Union[object, asyncio.Future]] = collections.deque()
+        self.active = 0
+        self.next_start = 0.0
+
+    def __enter__(self) -> "UpstreamLimit":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    def acquire(self) -> float:
+        """
+        Waits until we are allowed to query the upstream.
+
+        :return:
+            The time (in seconds) we waited.
+        """
+
+        started_at = time.monotonic()
+        ticket = object()
+
+        with self.condition:
+            self.waiters.append(ticket)
+
+            while self.waiters[0] is not ticket or self.is_full():
+                self.condition.wait()
+
+            start = self.admit()
+            self.wake_up()
+
+        delay = start - time.monotonic()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return time.monotonic() - started_at
+
+    async def acquire_async(self) -> float:
+        """
+        Waits - without blocking the event loop - until we are allowed to query
+        the upstream.
+
+        :return:
+            The time (in seconds) we waited.
+        """
+
+        started_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+
+        with self.condition:
+            self.waiters.append(future)
+            self.wake_up()
+
+        try:
+            start = await future
+        except asyncio.CancelledError:
+            with self.condition:
+                if future in self.waiters:
+                    self.waiters.remove(future)
+                else:
+                    # We were admitted in the meantime.
+                    self.active -= 1
+
+                self.wake_up()
+            raise
+
+        delay = start - time.monotonic()
+
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+
+        return time.monotonic() - started_at
+
+    def is_full(self) -> bool:
+        """
+        Tells whether the maximum number of running queries is reached.
+        """
+
+        return bool(self.max_concurrency and self.active >= self.max_concurrency)
+
+    def admit(self) -> float:
+        """
+        Admits the first waiter.
+
+        .. warning::
+            The lock must be held by the caller.
+
+        :return:
+            The time (monotonic) the admitted query may start at.
+        """
+
+        self.waiters.popleft()
+        self.active += 1
+
+        start = max(time.monotonic(), self.next_start)
+
+        if self.queries_per_second:
+            self.next_start = start + 1 / self.queries_per_second
+
+        return start
+
+    def wake_up(self) -> None:
+        """
+        Admits the waiting coroutines - in order - and wakes our waiting threads
+        up so that the next waiter may be admitted right away.
+
+        .. warning::
+            The lock must be held by the caller.
+        """
+
+        while (
+            self.waiters
+            and isinstance(self.waiters[0], asyncio.Future)
+            and not self.is_full()
+        ):
+            future = self.waiters[0]
+            future.get_loop().call_soon_threadsafe(set_start, future, self.admit())
+
+        self.condition.notify_all()
+
+    def release(self) -> None:
+        """
+        Releases our slot.
+        """
+
+        with self.condition:
+            self.active -= 1
+            self.wake_up()
+
+
+def set_start(future: asyncio.Future, start: float) -> None:
+    """
+    Tells the given waiting coroutine when it may start its query.
+    """
+
+    if not future.done():
+        future.set_result(start)
+
+
+class UpstreamLimiter:
+    """
+    Provides the registry of the limits of a kind of upstream.
+
+    :param max_concurrency:
+        The maximum number of queries running - at the same time - against each
+        upstream.
+    :param queries_per_second:
+        The maximum number of queries started - per second - against each
+        upstream.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        queries_per_second: Optional[float] = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.queries_per_second = queries_per_second
+
+        self.lock = threading.Lock()
+        self.limits: Dict[str, UpstreamLimit] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Tells whether the upstreams are limited at all.
+        """
+
+        return bool(self.max_concurrency or self.queries_per_second)
+
+    def get_limit(self, upstream: str) -> UpstreamLimit:
+        """
+        Provides the limit of the given upstream.
+        """
+
+        try:
+            return self.limits[upstream]
+        except KeyError:
+            with self.lock:
+                return self.limits.setdefault(
+                    upstream,
+                    UpstreamLimit(self.max_concurrency, self.queries_per_second),
+                )
+
+    def wrap(self, func: Callable, get_upstream: Callable[..., str]) -> Callable:
+        """
+        Wraps the given function - or coroutine function - so that each call is
+        limited according to the upstream given by :code:`get_upstream` - which
+        receives the same arguments.
+        """
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                upstream = get_upstream(*args, **kwargs)
+
+                if not upstream:
+                    return await func(*args, **kwargs)
+
+                limit = self.get_limit(upstream)
+                await limit.acquire_async()
+
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    limit.release()
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                upstream = get_upstream(*args, **kwargs)
+
+                if not upstream:
+                    return func(*args, **kwargs)
+
+                with self.get_limit(upstream):
+                    return func(*args, **kwargs)
+
+        wrapper.__wrapped_by_limiter__ = True
+        return wrapper
+
+
+WHOIS_PORT: int = 43
+"""
+The standard port of the WHOIS servers.
+"""
+
+WHOIS_LIMITER = UpstreamLimiter()
+"""
+The limiter of our WHOIS servers.
+"""
+
+DNS_LIMITER = UpstreamLimiter()
+"""
+The limiter of our DNS nameservers.
+"""
+
+HTTP_LIMITER = UpstreamLimiter()
+"""
+The limiter of the HTTP hosts we query.
+"""
+
+
+def get_whois_server(tool: WhoisQueryTool, *args, **kwargs) -> Optional[str]:
+    """
+    Provides the WHOIS server the given tool is about to query.
+
+    :return:
+        :code:`None` when the tool has no subject: PyFunceble then raises its
+        own error.
+    """
+
+    if not isinstance(tool.subject, str):
+        return None
+
+    return tool.server or tool.get_whois_server()
+
+
+def get_nameserver(query, where: str, *args, **kwargs) -> str:
+    """
+    Provides the nameserver a :py:mod:`dns.query` (or :py:mod:`dns.asyncquery`)
+    function is about to query.
+    """
+
+    return where
+
+
+def get_http_host(url: str, *args, **kwargs) -> Optional[str]:
+    """
+    Provides the host a HTTP request is about to query.
+    """
+
+    return urllib.parse.urlsplit(url).netloc.lower() or None
+
+
+def install_upstream_limits() -> None:
+    """
+    Configures our limiters from our settings and installs them in front of the
+    queries of PyFunceble.
+
+    .. note::
+        The DNS limits are installed at the :py:mod:`dns.query` (and
+        :py:mod:`dns.asyncquery`) level, the WHOIS ones at the
+        :py:class:`~PyFunceble.query.whois.query_tool.WhoisQueryTool` level and
+        the HTTP ones in front of PyFunceble's requester.
+    """
+
+    for limiter, max_concurrency, queries_per_second in (
+        (
+            WHOIS_LIMITER,
+            core_settings.UPSTREAM_WHOIS_MAX_CONCURRENCY,
+            core_settings.UPSTREAM_WHOIS_QUERIES_PER_SECOND,
+        ),
+        (
+            DNS_LIMITER,
+            core_settings.UPSTREAM_DNS_MAX_CONCURRENCY,
+            core_settings.UPSTREAM_DNS_QUERIES_PER_SECOND,
+        ),
+        (
+            HTTP_LIMITER,
+            core_settings.UPSTREAM_HTTP_MAX_CONCURRENCY,
+            core_settings.UPSTREAM_HTTP_QUERIES_PER_SECOND,
+        ),
+    ):
+        limiter.max_concurrency = max_concurrency
+        limiter.queries_per_second = queries_per_second
+        limiter.limits.clear()
+
+    if WHOIS_LIMITER.enabled and not hasattr(
+        WhoisQueryTool.query, "__wrapped_by_limiter__"
+    ):
+        WhoisQueryTool.query = WHOIS_LIMITER.wrap(
+            WhoisQueryTool.query, get_whois_server
+        )
+
+    if DNS_LIMITER.enabled:
+        for module in (dns.query, dns.asyncquery):
+            for name in ("udp", "tcp", "https", "tls"):
+                func = getattr(module, name)
+
+                if not hasattr(func, "__wrapped_by_limiter__"):
+                    setattr(module, name, DNS_LIMITER.wrap(func, get_nameserver))
+
+    if HTTP_LIMITER.enabled:
+        requester = PyFunceble.factory.Requester
+
+        for name in ("get", "head"):
+            func = getattr(requester, name)
+
+            if not hasattr(func, "__wrapped_by_limiter__"):
+                setattr(requester, name, HTTP_LIMITER.wrap(func, get_http_host))
+
+
+def install_whois_server() -> None:
+    """
+    Sends all WHOIS queries to the server given by our settings - if any -
+    instead of the one of the IANA database.
+    """
+
+    if not core_settings.UPSTREAM_WHOIS_SERVER:
+        return
+
+    server = urllib.parse.urlsplit(f"//{core_settings.UPSTREAM_WHOIS_SERVER}")
+
+    WhoisQueryTool.get_whois_server = lambda self: server.hostname
+    WhoisQueryTool.STD_PORT = server.port or WHOIS_PORT
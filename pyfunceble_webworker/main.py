@@ -56,19 +56,13 @@ import logging
 import os
 import secrets
 
-import inflection
 import PyFunceble.facility
 import PyFunceble.storage
-import requests
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import RedirectResponse
 from fastapi_utils.tasks import repeat_every
 from PyFunceble.config.loader import ConfigLoader
-from PyFunceble.downloader.iana import IANADownloader
-from PyFunceble.downloader.ipv4_reputation import IPV4ReputationDownloader
-from PyFunceble.downloader.public_suffix import PublicSuffixDownloader
-from PyFunceble.downloader.user_agents import UserAgentsDownloader
 from PyFunceble.helpers.dict import DictHelper
 from PyFunceble.helpers.directory import DirectoryHelper
 from PyFunceble.helpers.environment_variable import EnvironmentVariableHelper
@@ -78,11 +72,43 @@ from starlette.middleware.cors import CORSMiddleware
 
 import pyfunceble_webworker.storage
 from pyfunceble_webworker import __version__
+from pyfunceble_webworker.core.datasets import (
+    get_snapshot_directory,
+    load_datasets,
+    restore_snapshot,
+    update_datasets,
+)
 from pyfunceble_webworker.core.defaults import assets as assets_defaults
 from pyfunceble_webworker.core.defaults import pyfunceble as pyfunceble_defaults
 from pyfunceble_webworker.core.defaults import routes as routes_defaults
+from pyfunceble_webworker.core.dns_cache import (
+    install_async_query_tool,
+    install_atomic_nameservers,
+    install_dns_cache,
+)
+from pyfunceble_webworker.core.history import (
+    cleanup_history,
+    shutdown_history,
+    start_history,
+)
+from pyfunceble_webworker.core.http_client import HTTP_CLIENT, install_http_client
+from pyfunceble_webworker.core.jobs import cleanup_jobs, resume_jobs, shutdown_jobs
+from pyfunceble_webworker.core.location import load_location, update_location
+from pyfunceble_webworker.core.logs import start_logging
+from pyfunceble_webworker.core.pool import shutdown_process_pool
+from pyfunceble_webworker.core.scheduler import shutdown_scheduler
 from pyfunceble_webworker.core.settings import core_settings
-from pyfunceble_webworker.models.info import CoreLocation
+from pyfunceble_webworker.core.timeouts import install_adaptive_timeouts
+from pyfunceble_webworker.core.tracing import shutdown_tracing, start_tracing
+from pyfunceble_webworker.core.upstreams import (
+    install_upstream_limits,
+    install_whois_server,
+)
+from pyfunceble_webworker.middlewares.access_log import AccessLogMiddleware
+from pyfunceble_webworker.middlewares.compression import CompressionMiddleware
+from pyfunceble_webworker.middlewares.profiling import ProfilingMiddleware
+from pyfunceble_webworker.middlewares.rate_limit import Budget, RateLimitMiddleware
+from pyfunceble_webworker.middlewares.tracing import TracingMiddleware
 from pyfunceble_webworker.models.links import Links
 from pyfunceble_webworker.routes.v1.api import api_router as v1_api_router
 
@@ -93,6 +119,10 @@ if not env_var_helper.set_name("PYFUNCEBLE_WORKERS_DATA_DIR").exists():
 
 pyfunceble_webworker.storage.CONFIG_DIRECTORY = env_var_helper.get_value()
 
+# The directory used by PyFunceble at import time. It already provides the
+# datasets PyFunceble needed to start.
+BUNDLED_CONFIG_DIRECTORY = PyFunceble.storage.CONFIG_DIRECTORY
+
 PyFunceble.storage.CONFIG_DIRECTORY = os.path.join(
     pyfunceble_webworker.storage.CONFIG_DIRECTORY,
     secrets.token_hex(8),
@@ -101,6 +131,32 @@ PyFunceble.storage.CONFIG_DIRECTORY = os.path.join(
 DirectoryHelper(PyFunceble.storage.CONFIG_DIRECTORY).create()
 DirectoryHelper(pyfunceble_webworker.storage.CONFIG_DIRECTORY).create()
 
+# We serve from the datasets shared by all workers - previously persisted or
+# bundled - while they get refreshed in the background.
+restore_snapshot(get_snapshot_directory(), BUNDLED_CONFIG_DIRECTORY)
+
+# We give each upstream the time it usually needs to answer ...
+install_adaptive_timeouts()
+# ... and never hit it harder than allowed - even under load.
+install_upstream_limits()
+install_whois_server()
+# ... and never twice for the same DNS answer.
+install_dns_cache()
+# Our checks run concurrently but share the nameservers of PyFunceble.
+install_atomic_nameservers()
+# ... and the connections to the HTTP hosts.
+install_http_client()
+
+if core_settings.TRACING_ENABLED:
+    start_tracing()
+
+# We remember what we tested - without slowing the checks down.
+if core_settings.HISTORY_ENABLED:
+    start_history()
+
+# We serve the last known location while it gets refreshed in the background.
+load_location()
+
 file_helper = FileHelper()
 pyfunceble_config_loader = ConfigLoader()
 
@@ -124,6 +180,9 @@ pyfunceble_config_loader.custom_config = Merge(
 ).into(pyfunceble_config_loader.custom_config)
 pyfunceble_config_loader.start()
 
+# Our asynchronous DNS lookups query the way the (configured) PyFunceble does.
+install_async_query_tool()
+
 
 app = FastAPI(
     title=assets_defaults.PROJECT_NAME,
@@ -144,8 +203,36 @@ with importlib.resources.path(
         logger_data["handlers"]["file"]["filename"],
     )
 
-    logging.config.dictConfig(logger_data)
+    start_logging(logger_data, use_queue=core_settings.LOG_QUEUE_ENABLED)
+
+
+if core_settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        header=core_settings.PROFILING_HEADER,
+        limit=core_settings.PROFILING_LIMIT,
+    )
 
+if core_settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        groups={
+            "expensive": routes_defaults.EXPENSIVE_ROUTES,
+            "cheap": routes_defaults.CHEAP_ROUTES,
+        },
+        budgets={
+            "expensive": Budget(
+                core_settings.RATE_LIMIT_EXPENSIVE_CAPACITY,
+                core_settings.RATE_LIMIT_EXPENSIVE_REFILL_RATE,
+            ),
+            "cheap": Budget(
+                core_settings.RATE_LIMIT_CHEAP_CAPACITY,
+                core_settings.RATE_LIMIT_CHEAP_REFILL_RATE,
+            ),
+        },
+        api_key_header=core_settings.RATE_LIMIT_API_KEY_HEADER,
+        api_keys=core_settings.RATE_LIMIT_API_KEYS,
+    )
 
 if core_settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -156,6 +243,22 @@ if core_settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=core_settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=core_settings.COMPRESSION_GZIP_LEVEL,
+    zstd_level=core_settings.COMPRESSION_ZSTD_LEVEL,
+)
+
+if core_settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(
+        AccessLogMiddleware,
+        subject_routes=routes_defaults.EXPENSIVE_ROUTES + routes_defaults.CHEAP_ROUTES,
+    )
+
+if core_settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
 app.include_router(v1_api_router, prefix=routes_defaults.V1_URL_PREFIX)
 
 
@@ -199,6 +302,60 @@ def cleanup_data_dir() -> None:
     DirectoryHelper(PyFunceble.storage.CONFIG_DIRECTORY).delete()
 
 
+@app.on_event("shutdown")
+def cleanup_process_pool() -> None:
+    """
+    Stops our process pool on shutdown.
+    """
+
+    shutdown_process_pool()
+
+
+@app.on_event("shutdown")
+def cleanup_jobs_runners() -> None:
+    """
+    Stops - and checkpoints - our job runners on shutdown.
+    """
+
+    shutdown_jobs()
+
+
+@app.on_event("shutdown")
+def cleanup_scheduler() -> None:
+    """
+    Stops our scheduler on shutdown.
+    """
+
+    shutdown_scheduler()
+
+
+@app.on_event("shutdown")
+def cleanup_history_store() -> None:
+    """
+    Records the queued results of our checkers.
+    """
+
+    shutdown_history()
+
+
+@app.on_event("shutdown")
+def cleanup_http_client() -> None:
+    """
+    Closes the connections of our HTTP client.
+    """
+
+    HTTP_CLIENT.shutdown()
+
+
+@app.on_event("shutdown")
+def cleanup_tracing() -> None:
+    """
+    Exports the pending spans.
+    """
+
+    shutdown_tracing()
+
+
 @app.on_event("startup")
 @repeat_every(seconds=60 * 60 * 24, wait_first=False)
 def periodic_data_update() -> None:
@@ -206,57 +363,44 @@ def periodic_data_update() -> None:
     Process a periodic update of PyFunceble internal files.
     """
 
-    logging.info("Starting to update PyFunceble's reputation dataset.")
-    IPV4ReputationDownloader().start()
-    logging.info("Finished to update PyFunceble's reputation dataset.")
+    if not pyfunceble_webworker.storage.LOADED_DATASETS:
+        logging.info("Starting to load PyFunceble's datasets.")
+        load_datasets()
+        logging.info("Finished to load PyFunceble's datasets.")
+
+    update_datasets()
 
-    logging.info("Starting to update PyFunceble's user-agent dataset.")
-    UserAgentsDownloader().start()
-    PyFunceble.storage.USER_AGENTS = dict()
-    logging.info("Finished to update PyFunceble's user-agent dataset.")
 
-    logging.info("Starting to update PyFunceble's PSL dataset.")
-    PublicSuffixDownloader().start()
-    PyFunceble.storage.PUBLIC_SUFFIX = dict()
-    logging.info("Finished to update PyFunceble's PSL dataset.")
+@app.on_event("startup")
+@repeat_every(seconds=60 * 70, wait_first=False)
+def periodic_location_update() -> None:
+    """
+    Process a periodic update of our location.
+    """
 
-    logging.info("Starting to update PyFunceble's IANA dataset.")
-    IANADownloader().start()
-    PyFunceble.storage.IANA = dict()
-    logging.info("Finished to update PyFunceble's IANA dataset.")
+    update_location()
 
 
 @app.on_event("startup")
-@repeat_every(seconds=60 * 70, wait_first=False, raise_exceptions=True)
-def periodic_location_update():
+@repeat_every(seconds=60, wait_first=False)
+def periodic_jobs_resume() -> None:
     """
-    Process a periodic update of our location.
+    Process a periodic resume of the jobs no worker is running - and a cleanup
+    of the expired ones.
     """
 
-    logging.info("Starting to fetch location data.")
-
-    req = requests.get(
-        "http://ip-api.com/json",
-        params={
-            "fields": ",".join(
-                [
-                    inflection.camelize(x, uppercase_first_letter=False)
-                    for x in CoreLocation().__dict__.keys()
-                ]
-            )
-        },
-    )
+    cleanup_jobs()
+    resume_jobs()
 
-    if req.status_code != 200:
-        logging.critical(
-            "Could not fetch location information. (status_code: %s)", req.status_code
-        )
-    else:
 
-        for key, value in req.json().items():
-            pyfunceble_webworker.storage.LOCATION[inflection.underscore(key)] = value
+@app.on_event("startup")
+@repeat_every(seconds=60 * 60, wait_first=False)
+def periodic_history_cleanup() -> None:
+    """
+    Process a periodic cleanup of the expired results of our history.
+    """
 
-        logging.info("Finished to fetch location data.")
+    cleanup_history()
 
 
 @app.get(
@@ -0,0 +1,130 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module which provides the middleware which writes our access log.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from pyfunceble_webworker.core.logs import ACCESS_LOGGER, ACCESS_RECORD
+
+
+class AccessLogMiddleware:
+    """
+    Provides the middleware which writes one structured (logfmt) line per
+    request: method, route, status, number of subjects and latency.
+
+    The route is the template of the matched route - e.g.
+    :code:`/v1/jobs/{job_id}` - so that the lines can be aggregated.
+
+    :param subject_routes:
+        The prefix of the routes handling - by default - a single subject.
+        Routes handling several subjects give their count through
+        :py:func:`~pyfunceble_webworker.core.logs.set_subject_count`.
+    :param logger:
+        The logger to write to.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        subject_routes: tuple = (),
+        logger: logging.Logger = ACCESS_LOGGER,
+    ) -> None:
+        self.app = app
+        self.subject_routes = subject_routes
+        self.logger = logger
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        record = {
+            "subjects": 1 if scope["path"].startswith(self.subject_routes) else 0,
+            "status": 500,
+        }
+        started_at = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                record["status"] = message["status"]
+
+            await send(message)
+
+        token = ACCESS_RECORD.set(record)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            ACCESS_RECORD.reset(token)
+
+            route = getattr(scope.get("route"), "path_format", None)
+            latency = (time.perf_counter() - started_at) * 1000
+
+            self.logger.info(
+                "method=%s route=%s status=%d subjects=%d latency_ms=%.3f",
+                scope["method"],
+                route or scope["path"],
+                record["status"],
+                record["subjects"],
+                latency,
+                extra={
+                    "http_method": scope["method"],
+                    "http_route": route,
+                    "http_status": record["status"],
+                    "subjects": record["subjects"],
+                    "latency_ms": latency,
+                },
+            )
@@ -0,0 +1,278 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our compression middleware.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import abc
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover ## Optional dependency.
+    zstandard = None
+
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+"""
+The content types we never compress.
+"""
+
+
+class CompressionResponder(abc.ABC):
+    """
+    Provides the base of all our responders.
+
+    The initial message is kept until we know the size of the response. Small
+    responses are given as they are, the others are compressed. Streaming
+    responses are compressed chunk by chunk, each chunk being flushed so that
+    the client can decode it as soon as it arrives.
+    """
+
+    content_encoding: Optional[str] = None
+
+    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def start(self, *, compressed: bool, more_body: bool, size: int) -> None:
+        """
+        Sends the initial message.
+        """
+
+        self.started = True
+
+        if compressed:
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = self.content_encoding
+
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(size)
+
+        await self.send(self.initial_message)
+
+    async def send_with_compression(self, message: Message) -> None:
+        """
+        Compresses - when needed - the given message before sending it.
+        """
+
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+
+            self.passthrough = "content-encoding" in headers or headers.get(
+                "content-type", ""
+            ).startswith(EXCLUDED_CONTENT_TYPES)
+        elif message_type != "http.response.body":
+            if not self.started:
+                await self.start(compressed=False, more_body=False, size=0)
+
+            await self.send(message)
+        elif self.passthrough or (
+            not self.started
+            and not message.get("more_body", False)
+            and len(message.get("body", b"")) < self.minimum_size
+        ):
+            if not self.started:
+                await self.start(compressed=False, more_body=False, size=0)
+
+            await self.send(message)
+        else:
+            more_body = message.get("more_body", False)
+            body = self.compress(message.get("body", b""), more_body=more_body)
+
+            if not self.started:
+                await self.start(compressed=True, more_body=more_body, size=len(body))
+
+            message["body"] = body
+            await self.send(message)
+
+    @abc.abstractmethod
+    def compress(self, body: bytes, *, more_body: bool) -> bytes:
+        """
+        Compresses the given body.
+
+        :param more_body:
+            Whether more chunks are coming. If not, the compressed stream is
+            closed.
+        """
+
+
+class GzipResponder(CompressionResponder):
+    """
+    Provides the gzip responder.
+    """
+
+    content_encoding: str = "gzip"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int) -> None:
+        super().__init__(app, minimum_size)
+
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, *, more_body: bool) -> bytes:
+        return self.compressor.compress(body) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+        )
+
+
+class ZstdResponder(CompressionResponder):
+    """
+    Provides the zstd responder.
+
+    .. note::
+        Only available when :code:`zstandard` is installed.
+    """
+
+    content_encoding: str = "zstd"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int) -> None:
+        super().__init__(app, minimum_size)
+
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, body: bytes, *, more_body: bool) -> bytes:
+        return self.compressor.compress(body) + self.compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            if more_body
+            else zstandard.COMPRESSOBJ_FLUSH_FINISH
+        )
+
+
+class CompressionMiddleware:
+    """
+    Provides the middleware which compresses our responses according to the
+    :code:`Accept-Encoding` header of the request.
+
+    :param minimum_size:
+        The minimum size (in bytes) of a response before we compress it.
+    :param gzip_level:
+        The gzip compression level.
+    :param zstd_level:
+        The zstd compression level.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    @staticmethod
+    def negotiate(accept_encoding: str) -> Optional[str]:
+        """
+        Provides the encoding to use for the given :code:`Accept-Encoding`
+        header. When multiple encodings share the same weight, we prefer zstd.
+        """
+
+        supported = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+        weights = {}
+
+        for part in accept_encoding.lower().split(","):
+            encoding, *params = [x.strip() for x in part.split(";")]
+            quality = 1.0
+
+            for param in params:
+                if param.startswith("q="):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+
+            weights[encoding] = quality
+
+        candidates = [
+            (weights.get(x, weights.get("*", 0.0)), -index, x)
+            for index, x in enumerate(supported)
+        ]
+        quality, _, encoding = max(candidates)
+
+        return encoding if quality > 0 else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.negotiate(Headers(scope=scope).get("Accept-Encoding", ""))
+
+        if encoding == "zstd":
+            responder = ZstdResponder(self.app, self.minimum_size, self.zstd_level)
+        elif encoding == "gzip":
+            responder = GzipResponder(self.app, self.minimum_size, self.gzip_level)
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        await responder(scope, receive, send)
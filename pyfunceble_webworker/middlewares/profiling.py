@@ -0,0 +1,183 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module which provides the middleware which profiles the requests
+asking for it.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import urllib.parse
+from typing import List, Optional
+
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from pyfunceble_webworker.core.profiling import PROFILE, RequestProfile
+
+JSON_FORMAT = "json"
+"""
+The format which gives the profile alongside the (JSON) result.
+"""
+
+PSTATS_FORMAT = "pstats"
+"""
+The format which gives the profile as a downloadable :py:mod:`pstats` file.
+"""
+
+
+class ProfilingMiddleware:
+    """
+    Provides the middleware which profiles the requests asking for it - through
+    the given header or query parameter.
+
+    With the :code:`json` format (the default), the JSON response is replaced
+    by :code:`{"result": ..., "profile": ...}`. With the :code:`pstats` format -
+    or when the response is not JSON - the profile is given as a file which
+    can be read with :py:mod:`pstats` or any compatible viewer.
+
+    :param header:
+        The header asking for a profile.
+    :param query_param:
+        The query parameter asking for a profile.
+    :param limit:
+        The number of functions listed by the :code:`json` format.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        header: str = "X-Profile",
+        query_param: str = "profile",
+        limit: int = 30,
+    ) -> None:
+        self.app = app
+        self.header = header
+        self.query_param = query_param
+        self.limit = limit
+
+    def get_format(self, scope: Scope) -> Optional[str]:
+        """
+        Provides the format of the profile asked by the given request - if any.
+        """
+
+        value = Headers(scope=scope).get(self.header)
+
+        if value is None:
+            values = urllib.parse.parse_qs(
+                scope.get("query_string", b"").decode("latin-1"),
+                keep_blank_values=True,
+            ).get(self.query_param)
+
+            if not values:
+                return None
+
+            value = values[0]
+
+        value = value.strip().lower()
+
+        if value in ("0", "false", "no"):
+            return None
+
+        return PSTATS_FORMAT if value == PSTATS_FORMAT else JSON_FORMAT
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile_format = self.get_format(scope)
+
+        if not profile_format:
+            await self.app(scope, receive, send)
+            return
+
+        initial_message: Message = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal initial_message
+
+            if message["type"] == "http.response.start":
+                initial_message = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        profile = RequestProfile()
+        token = PROFILE.set(profile)
+
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            PROFILE.reset(token)
+            profile.finish()
+
+        headers = MutableHeaders(raw=initial_message["headers"])
+        body = b"".join(chunks)
+
+        if profile_format == JSON_FORMAT and headers.get("content-type", "").startswith(
+            "application/json"
+        ):
+            body = orjson.dumps(
+                {
+                    "result": orjson.loads(body) if body else None,
+                    "profile": profile.to_dict(self.limit),
+                }
+            )
+        else:
+            body = profile.dump()
+
+            headers["Content-Type"] = "application/octet-stream"
+            headers["Content-Disposition"] = 'attachment; filename="profile.prof"'
+
+        headers["Content-Length"] = str(len(body))
+
+        await send(initial_message)
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,343 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides our per-client rate limiting.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import math
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from pyfunceble_webworker.core.clients import identify_client
+
+
+class Budget(NamedTuple):
+    """
+    Describes the budget of a group of routes.
+
+    :param capacity:
+        The maximum number of requests a client can burst.
+    :param refill_rate:
+        The number of requests (per second) given back to a client.
+    """
+
+    capacity: int
+    refill_rate: float
+
+
+class TokenBucket:
+    """
+    Provides a token bucket.
+
+    The bucket starts full and is refilled - continuously - at the given rate.
+    """
+
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at")
+
+    def __init__(self, budget: Budget, now: float) -> None:
+        self.capacity = budget.capacity
+        self.refill_rate = budget.refill_rate
+        self.tokens = float(budget.capacity)
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        """
+        Gives back the tokens earned since the last update.
+        """
+
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+    def consume(self, now: float, cost: int = 1) -> bool:
+        """
+        Tries to consume the given number of tokens.
+
+        A cost above the available tokens puts the bucket into debt: no token is
+        available until it is paid back.
+
+        :return:
+            Whether a token was available.
+        """
+
+        self.refill(now)
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= cost
+        return True
+
+    def is_full(self, now: float) -> bool:
+        """
+        Checks if the bucket is full - at the given time.
+        """
+
+        return self.tokens + (now - self.updated_at) * self.refill_rate >= self.capacity
+
+    @property
+    def remaining(self) -> int:
+        """
+        Provides the number of requests which can be made right away.
+        """
+
+        return max(0, int(self.tokens))
+
+    @property
+    def reset(self) -> int:
+        """
+        Provides the number of seconds until the bucket is full again.
+        """
+
+        return math.ceil((self.capacity - self.tokens) / self.refill_rate)
+
+    @property
+    def retry_after(self) -> int:
+        """
+        Provides the number of seconds until the next token is available.
+        """
+
+        return max(1, math.ceil((1 - self.tokens) / self.refill_rate))
+
+
+class RateLimiter:
+    """
+    Provides the registry of the buckets of all clients.
+
+    Buckets which are full again are equivalent to new ones, therefore they
+    are regularly pruned to keep the memory bounded.
+
+    :param budgets:
+        The budget of each group of routes.
+    :param prune_every:
+        The number of acquisitions between 2 prunings.
+    """
+
+    def __init__(self, budgets: Dict[str, Budget], *, prune_every: int = 1000) -> None:
+        self.budgets = budgets
+        self.prune_every = prune_every
+
+        self.buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self.acquisitions = 0
+
+    def acquire(
+        self, group: str, client: str, now: Optional[float] = None, cost: int = 1
+    ) -> Tuple[bool, TokenBucket]:
+        """
+        Tries to admit a request of the given client into the given group of
+        routes.
+
+        :param cost:
+            The number of requests the request stands for.
+
+        :return:
+            Whether the request is admitted and the bucket of the client.
+        """
+
+        if now is None:
+            now = time.monotonic()
+
+        self.acquisitions += 1
+
+        if self.acquisitions % self.prune_every == 0:
+            self.prune(now)
+
+        try:
+            bucket = self.buckets[(group, client)]
+        except KeyError:
+            bucket = self.buckets[(group, client)] = TokenBucket(
+                self.budgets[group], now
+            )
+
+        return bucket.consume(now, cost), bucket
+
+    def prune(self, now: float) -> None:
+        """
+        Deletes the buckets which are full again.
+        """
+
+        self.buckets = {x: y for x, y in self.buckets.items() if not y.is_full(now)}
+
+
+class RateLimitMiddleware:
+    """
+    Provides the middleware which limits the rate of the requests of each
+    client.
+
+    Clients are identified by their API key - when known - or by their IP.
+    Responses carry the :code:`RateLimit-*` headers. Rejected requests are
+    answered with a 429.
+
+    The admitted requests are given the means to charge their client more -
+    see :py:func:`charge_request`.
+
+    :param groups:
+        The route prefixes of each group of routes. Routes outside of all
+        groups are not limited.
+    :param budgets:
+        The budget of each group of routes.
+    :param api_key_header:
+        The header which may hold the API key of the client.
+    :param api_keys:
+        The known API keys. Unknown keys are ignored.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        groups: Dict[str, Iterable[str]],
+        budgets: Dict[str, Budget],
+        api_key_header: str = "X-API-Key",
+        api_keys: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.groups = {x: tuple(y) for x, y in groups.items()}
+        self.api_key_header = api_key_header
+        self.api_keys = frozenset(api_keys)
+
+        self.limiter = RateLimiter(budgets)
+
+    def get_group(self, path: str) -> Optional[str]:
+        """
+        Provides the group of routes of the given path.
+        """
+
+        for group, prefixes in self.groups.items():
+            if path.startswith(prefixes):
+                return group
+
+        return None
+
+    def get_client(self, scope: Scope) -> str:
+        """
+        Provides the identity of the client of the given request.
+        """
+
+        return identify_client(scope, self.api_key_header, self.api_keys)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = self.get_group(scope["path"])
+
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        admitted, bucket = self.limiter.acquire(group, self.get_client(scope))
+
+        rate_limit_headers = {
+            "RateLimit-Limit": str(bucket.capacity),
+            "RateLimit-Remaining": str(bucket.remaining),
+            "RateLimit-Reset": str(bucket.reset),
+            "RateLimit-Policy": (
+                f"{bucket.capacity};w={math.ceil(bucket.capacity / bucket.refill_rate)}"
+            ),
+        }
+
+        if not admitted:
+            response = JSONResponse(
+                {"detail": "Too Many Requests"},
+                status_code=429,
+                headers={
+                    **rate_limit_headers,
+                    "Retry-After": str(bucket.retry_after),
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["rate_limit"] = (self, self.get_client(scope))
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.update(rate_limit_headers)
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def charge_request(request: Request, path: str, cost: int) -> Optional[TokenBucket]:
+    """
+    Charges the client of the given request with the given number of requests
+    into the group of routes of the given path.
+
+    This is for the requests which stand for many: e.g. a job stands for a
+    request per subject.
+
+    :return:
+        The bucket of the client when it is over budget. :code:`None` when the
+        charge is admitted - or not limited.
+    """
+
+    try:
+        middleware, client = request.state.rate_limit
+    except AttributeError:
+        return None
+
+    group = middleware.get_group(path)
+
+    if group is None:
+        return None
+
+    admitted, bucket = middleware.limiter.acquire(group, client, cost=cost)
+
+    return None if admitted else bucket
@@ -51,7 +51,7 @@ License:
     limitations under the License.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel
 
@@ -72,3 +72,8 @@ class SystemInfo(BaseModel):
     version: CoreVersion
     id: str
     location: CoreLocation
+
+
+class Readiness(BaseModel):
+    ready: bool
+    datasets: Dict[str, bool]
@@ -0,0 +1,154 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the models of our bulk jobs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, NonNegativeFloat
+
+
+class JobChecker(Enum):
+    availability_domain: str = "availability/domain"
+    availability_ip: str = "availability/ip"
+    availability_url: str = "availability/url"
+    availability_domain_and_ip: str = "availability/domain-and-ip"
+    reputation_domain: str = "reputation/domain"
+    reputation_ip: str = "reputation/ip"
+    reputation_url: str = "reputation/url"
+    reputation_domain_and_ip: str = "reputation/domain-and-ip"
+    syntax_domain: str = "syntax/domain"
+    syntax_ip: str = "syntax/ip"
+    syntax_url: str = "syntax/url"
+
+
+class JobState(Enum):
+    pending: str = "PENDING"
+    running: str = "RUNNING"
+    done: str = "DONE"
+    cancelled: str = "CANCELLED"
+
+
+class JobParams(BaseModel):
+    use_extra_rules: Optional[bool] = None
+    use_whois_lookup: Optional[bool] = None
+    use_dns_lookup: Optional[bool] = None
+    use_netinfo_lookup: Optional[bool] = None
+    use_http_code_lookup: Optional[bool] = None
+    use_reputation_lookup: Optional[bool] = None
+    do_syntax_check_first: Optional[bool] = None
+
+
+class JobRequest(BaseModel):
+    checker: JobChecker = Field(
+        ...,
+        summary="Checker",
+        description="The checker to test the subjects against.",
+    )
+    subjects: List[str] = Field(
+        ...,
+        summary="Subjects",
+        description="The subjects to test. Duplicates are tested once. A subject "
+        "can't contain whitespace nor control characters.",
+    )
+    params: JobParams = Field(
+        JobParams(),
+        summary="Parameters",
+        description="The parameters of the checker. Omitted parameters get the "
+        "default of the equivalent single-subject endpoint.",
+    )
+    distributed: bool = Field(
+        False,
+        summary="Distributed",
+        description="Shards the job across our peers. Only available in "
+        "coordinator mode.",
+    )
+    freshness: Optional[Dict[str, NonNegativeFloat]] = Field(
+        None,
+        summary="Freshness Policy",
+        description="Enables the re-check mode: the maximum age (in seconds) - per "
+        "status - of a recorded result given back instead of testing its subject "
+        "again. Subjects without fresh result - or whose latest status is not "
+        "listed - are tested. The statuses must be ones of the checker. Only "
+        "available when the history is enabled.",
+    )
+
+
+class JobShard(BaseModel):
+    peer: str
+    remote_id: Optional[str] = None
+    state: str
+    total: int
+    completed: int
+    attempts: int
+
+
+class Job(BaseModel):
+    id: str
+    checker: JobChecker
+    state: JobState
+    total: int
+    completed: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    distributed: bool = False
+    freshness: Optional[Dict[str, float]] = None
+    shards: Optional[List[JobShard]] = None
+
+
+class JobResult(BaseModel):
+    index: int
+    subject: str
+    status: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    stored: Optional[bool] = None
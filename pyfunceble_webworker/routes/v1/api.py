@@ -51,24 +51,38 @@ License:
     limitations under the License.
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from PyFunceble.storage import PROJECT_VERSION
 from starlette.responses import HTMLResponse
 
 import pyfunceble_webworker.storage
 from pyfunceble_webworker import __session_id__, __version__
+from pyfunceble_webworker.core.datasets import DATASETS
 from pyfunceble_webworker.core.defaults import assets as assets_defaults
-from pyfunceble_webworker.models.info import CoreLocation, CoreVersion, SystemInfo
+from pyfunceble_webworker.core.scheduler import get_scheduler
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.core.timeouts import DNS_TIMEOUTS, WHOIS_TIMEOUTS
+from pyfunceble_webworker.models.info import (
+    CoreLocation,
+    CoreVersion,
+    Readiness,
+    SystemInfo,
+)
 from pyfunceble_webworker.models.links import (
     DocumentationURL,
     Links,
     ProjectsURL,
     SupportURL,
 )
+from pyfunceble_webworker.models.scheduler import SchedulerStats
+from pyfunceble_webworker.models.timeouts import TimeoutsStats
 from pyfunceble_webworker.routes.v1.endpoints import (
     availability,
     converter,
+    coordinator,
+    history,
+    jobs,
     reputation,
     syntax,
 )
@@ -133,7 +147,71 @@ def info() -> SystemInfo:
     )
 
 
+@api_router.get(
+    "/ready",
+    response_model=Readiness,
+    name="Readiness",
+    description="Tells whether the current node is ready to serve our checkers. "
+    "Answers with a 503 until all datasets are loaded.",
+    responses={503: {"model": Readiness, "description": "Not ready, yet."}},
+)
+def ready(response: Response) -> Readiness:
+    """
+    Provides the readiness of the running project.
+    """
+
+    datasets = {x: x in pyfunceble_webworker.storage.LOADED_DATASETS for x in DATASETS}
+
+    if not all(datasets.values()):
+        response.status_code = 503
+
+    return Readiness(ready=all(datasets.values()), datasets=datasets)
+
+
+@api_router.get(
+    "/scheduler",
+    response_model=SchedulerStats,
+    name="Scheduler",
+    description="Provides the statistics of the scheduler of our checkers. "
+    "Queue waits are given in seconds and computed over the latest scheduled "
+    "checks of each lane.",
+)
+def scheduler() -> SchedulerStats:
+    """
+    Provides the statistics of the scheduler of the running project.
+    """
+
+    return SchedulerStats(**get_scheduler().get_stats())
+
+
+@api_router.get(
+    "/timeouts",
+    response_model=TimeoutsStats,
+    name="Timeouts",
+    description="Provides the timeouts we learned - per DNS nameserver and WHOIS "
+    "server - and the latencies they were learned from. Latencies and timeouts "
+    "are given in seconds. A timeout is null until enough latencies are known.",
+)
+def timeouts() -> TimeoutsStats:
+    """
+    Provides the adaptive timeouts of the running project.
+    """
+
+    return TimeoutsStats(
+        enabled=core_settings.ADAPTIVE_TIMEOUTS_ENABLED,
+        dns=DNS_TIMEOUTS.get_stats(),
+        whois=WHOIS_TIMEOUTS.get_stats(),
+    )
+
+
 api_router.include_router(availability.router, tags=["availability"])
 api_router.include_router(syntax.router, tags=["syntax"])
 api_router.include_router(reputation.router, tags=["reputation"])
 api_router.include_router(converter.router, tags=["converter"])
+api_router.include_router(jobs.router, tags=["jobs"])
+
+if core_settings.HISTORY_ENABLED:
+    api_router.include_router(history.router, tags=["history"])
+
+if core_settings.COORDINATOR_ENABLED:
+    api_router.include_router(coordinator.router, tags=["coordinator"])
@@ -59,14 +59,28 @@ from PyFunceble import (
     URLAvailabilityChecker,
 )
 
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.core.dns_cache import (
+    get_availability_lookups,
+    get_url_availability_lookups,
+)
+from pyfunceble_webworker.core.responses import (
+    get_media_type,
+    get_projection,
+    render,
+)
+from pyfunceble_webworker.core.scheduler import run_checker
 from pyfunceble_webworker.core.settings import core_settings
 from pyfunceble_webworker.models.availability import (
     AvailabilityStatus,
     CheckerParams,
     URLCheckerParams,
 )
+from pyfunceble_webworker.models.projection import ProjectionParams
 
-router = APIRouter(prefix="/availability")
+router = APIRouter(
+    prefix="/availability", responses=responses_defaults.NEGOTIATED_RESPONSES
+)
 
 
 @router.post(
@@ -76,12 +90,14 @@ router = APIRouter(prefix="/availability")
     description="Checks the availability of the given subject against our domain "
     "availability checker.",
 )
-def domain_availability(
+async def domain_availability(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(AvailabilityStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the availability of the given domain.
@@ -92,22 +108,22 @@ def domain_availability(
     else:
         use_whois_lookup = core_settings.ALLOW_WHOIS_LOOKUP
 
-    return (
-        DomainAvailabilityChecker(
-            subject,
-            use_extra_rules=params.use_extra_rules,
-            use_whois_lookup=use_whois_lookup,
-            use_dns_lookup=params.use_dns_lookup,
-            use_netinfo_lookup=params.use_netinfo_lookup,
-            use_http_code_lookup=params.use_http_code_lookup,
-            use_reputation_lookup=params.use_reputation_lookup,
-            do_syntax_check_first=params.do_syntax_check_first,
-            use_whois_db=False,
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        DomainAvailabilityChecker,
+        subject,
+        get_dns_lookups=get_availability_lookups,
+        use_extra_rules=params.use_extra_rules,
+        use_whois_lookup=use_whois_lookup,
+        use_dns_lookup=params.use_dns_lookup,
+        use_netinfo_lookup=params.use_netinfo_lookup,
+        use_http_code_lookup=params.use_http_code_lookup,
+        use_reputation_lookup=params.use_reputation_lookup,
+        do_syntax_check_first=params.do_syntax_check_first,
+        use_whois_db=False,
     )
 
+    return render(AvailabilityStatus, status, projection, media_type)
+
 
 @router.post(
     "/url",
@@ -116,12 +132,14 @@ def domain_availability(
     description="Checks the availability of the given subject against our url "
     "availability checker.",
 )
-def url_availability(
+async def url_availability(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: URLCheckerParams = Depends()
+    params: URLCheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(AvailabilityStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the availability of the given domain.
@@ -132,22 +150,22 @@ def url_availability(
     else:
         use_whois_lookup = core_settings.ALLOW_WHOIS_LOOKUP
 
-    return (
-        URLAvailabilityChecker(
-            subject,
-            use_extra_rules=False,
-            use_whois_lookup=use_whois_lookup,
-            use_dns_lookup=False,
-            use_netinfo_lookup=False,
-            use_http_code_lookup=True,
-            use_reputation_lookup=params.use_reputation_lookup,
-            do_syntax_check_first=params.do_syntax_check_first,
-            use_whois_db=False,
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        URLAvailabilityChecker,
+        subject,
+        get_dns_lookups=get_url_availability_lookups,
+        use_extra_rules=False,
+        use_whois_lookup=use_whois_lookup,
+        use_dns_lookup=False,
+        use_netinfo_lookup=False,
+        use_http_code_lookup=True,
+        use_reputation_lookup=params.use_reputation_lookup,
+        do_syntax_check_first=params.do_syntax_check_first,
+        use_whois_db=False,
     )
 
+    return render(AvailabilityStatus, status, projection, media_type)
+
 
 @router.post(
     "/ip",
@@ -156,12 +174,14 @@ def url_availability(
     description="Checks the availability of the given subject against our IP "
     "(v4 & v6) availability checker.",
 )
-def ip_availability(
+async def ip_availability(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(AvailabilityStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the availability of the given IP.
@@ -172,22 +192,22 @@ def ip_availability(
     else:
         use_whois_lookup = core_settings.ALLOW_WHOIS_LOOKUP
 
-    return (
-        IPAvailabilityChecker(
-            subject,
-            use_extra_rules=params.use_extra_rules,
-            use_whois_lookup=use_whois_lookup,
-            use_dns_lookup=params.use_dns_lookup,
-            use_netinfo_lookup=params.use_netinfo_lookup,
-            use_http_code_lookup=params.use_http_code_lookup,
-            use_reputation_lookup=params.use_reputation_lookup,
-            do_syntax_check_first=params.do_syntax_check_first,
-            use_whois_db=False,
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        IPAvailabilityChecker,
+        subject,
+        get_dns_lookups=get_availability_lookups,
+        use_extra_rules=params.use_extra_rules,
+        use_whois_lookup=use_whois_lookup,
+        use_dns_lookup=params.use_dns_lookup,
+        use_netinfo_lookup=params.use_netinfo_lookup,
+        use_http_code_lookup=params.use_http_code_lookup,
+        use_reputation_lookup=params.use_reputation_lookup,
+        do_syntax_check_first=params.do_syntax_check_first,
+        use_whois_db=False,
     )
 
+    return render(AvailabilityStatus, status, projection, media_type)
+
 
 @router.post(
     "/domain-and-ip",
@@ -196,12 +216,14 @@ def ip_availability(
     description="Checks the availability of the given subject against our "
     "domain and IP (v4 & v6) availability checker.",
 )
-def domain_ip_availability(
+async def domain_ip_availability(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(AvailabilityStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the availability of the given domain or IP.
@@ -212,18 +234,18 @@ def domain_ip_availability(
     else:
         use_whois_lookup = core_settings.ALLOW_WHOIS_LOOKUP
 
-    return (
-        DomainAndIPAvailabilityChecker(
-            subject,
-            use_extra_rules=params.use_extra_rules,
-            use_whois_lookup=use_whois_lookup,
-            use_dns_lookup=params.use_dns_lookup,
-            use_netinfo_lookup=params.use_netinfo_lookup,
-            use_http_code_lookup=params.use_http_code_lookup,
-            use_reputation_lookup=params.use_reputation_lookup,
-            do_syntax_check_first=params.do_syntax_check_first,
-            use_whois_db=False,
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        DomainAndIPAvailabilityChecker,
+        subject,
+        get_dns_lookups=get_availability_lookups,
+        use_extra_rules=params.use_extra_rules,
+        use_whois_lookup=use_whois_lookup,
+        use_dns_lookup=params.use_dns_lookup,
+        use_netinfo_lookup=params.use_netinfo_lookup,
+        use_http_code_lookup=params.use_http_code_lookup,
+        use_reputation_lookup=params.use_reputation_lookup,
+        do_syntax_check_first=params.do_syntax_check_first,
+        use_whois_db=False,
     )
+
+    return render(AvailabilityStatus, status, projection, media_type)
@@ -52,9 +52,10 @@ License:
     limitations under the License.
 """
 
+from itertools import repeat
 from typing import List, Optional
 
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, Depends, Query
 from PyFunceble.checker.syntax.ip import IPSyntaxChecker
 from PyFunceble.converter.adblock_input_line2subject import AdblockInputLine2Subject
 from PyFunceble.converter.cidr2subject import CIDR2Subject
@@ -64,6 +65,12 @@ from PyFunceble.converter.rpz_policy2subject import RPZPolicy2Subject
 from PyFunceble.converter.subject2complements import Subject2Complements
 from PyFunceble.converter.wildcard2subject import Wildcard2Subject
 
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.core.logs import set_subject_count
+from pyfunceble_webworker.core.pool import get_process_pool
+from pyfunceble_webworker.core.responses import get_media_type, respond
+from pyfunceble_webworker.core.settings import core_settings
+
 router = APIRouter(prefix="/converter")
 
 
@@ -114,6 +121,70 @@ def adblock(
     ).get_converted()
 
 
+def convert_adblock_chunk(lines: List[str], aggressive: bool) -> List[List[str]]:
+    """
+    Provides the conversion of each of the given AdBlock filter lines.
+
+    .. note::
+        This function is executed inside our process pool.
+    """
+
+    converter = AdblockInputLine2Subject(aggressive=aggressive)
+
+    return [converter.set_data_to_convert(x).get_converted() for x in lines]
+
+
+@router.post(
+    "/adblock/bulk",
+    response_model=List[str],
+    summary="AdBlock Filter List Decoder",
+    responses=responses_defaults.NEGOTIATED_RESPONSES,
+    description="Decodes the subjects of the given AdBlock filter lines. "
+    "Large inputs are decoded in parallel. The subjects are given back in the "
+    "order of the input.",
+)
+def adblock_bulk(
+    *,
+    data: List[str] = Body(
+        ..., embed=True, summary="Data", description="The lines to convert."
+    ),
+    aggressive: bool = Query(
+        False,
+        summary="Aggressive Mode",
+        description="Activates the conversion in a more aggressive mater.",
+    ),
+    media_type: str = Depends(get_media_type),
+) -> List[str]:
+    """
+    Provides the conversion of the testable subjects of the given AdBlock filter
+    lines.
+    """
+
+    set_subject_count(len(data))
+
+    chunk_size = max(core_settings.CONVERTER_CHUNK_SIZE, 1)
+
+    if len(data) <= chunk_size:
+        converted = [convert_adblock_chunk(data, aggressive)]
+    else:
+        converted = get_process_pool().map(
+            convert_adblock_chunk,
+            [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)],
+            repeat(aggressive),
+        )
+
+    # dict preserves the insertion order, so we can deduplicate while keeping the
+    # order of the input.
+    return respond(
+        list(
+            dict.fromkeys(
+                subject for chunk in converted for line in chunk for subject in line
+            )
+        ),
+        media_type,
+    )
+
+
 @router.post(
     "/cidr",
     response_model=List[str],
@@ -0,0 +1,142 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the endpoints of our coordinator.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import hmac
+from typing import List, Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+
+from pyfunceble_webworker.core.coordinator import (
+    get_peers,
+    probe_peer,
+    register_peer,
+    unregister_peer,
+)
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.models.coordinator import Peer, PeerRegistration
+
+router = APIRouter(prefix="/coordinator")
+
+
+def check_admin_api_key(request: Request) -> None:
+    """
+    Ensures that the current request is given our admin API key.
+
+    Our peers are sent our jobs - and trusted with their results - so only our
+    admin may register or unregister them.
+    """
+
+    if not core_settings.COORDINATOR_ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="Peer registration disabled.")
+
+    api_key: Optional[str] = request.headers.get(
+        core_settings.RATE_LIMIT_API_KEY_HEADER
+    )
+
+    if not api_key or not hmac.compare_digest(
+        api_key.encode(), core_settings.COORDINATOR_ADMIN_API_KEY.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid API key.")
+
+
+@router.get(
+    "/peers",
+    response_model=List[Peer],
+    summary="Peers",
+    description="Provides our peers along with their identity and readiness.",
+)
+def peers() -> List[Peer]:
+    """
+    Provides our peers.
+    """
+
+    return [Peer(**probe_peer(x)) for x in get_peers()]
+
+
+@router.post(
+    "/peers",
+    response_model=Peer,
+    summary="Peer Registration",
+    description="Registers a new peer. The peer has to answer on its "
+    "information endpoint. Requires the admin API key.",
+    dependencies=[Depends(check_admin_api_key)],
+)
+def peer_registration(peer: PeerRegistration = Body(...)) -> Peer:
+    """
+    Registers the given peer.
+    """
+
+    result = probe_peer(str(peer.url).rstrip("/"))
+
+    if result["id"] is None:
+        raise HTTPException(status_code=422, detail="Peer not reachable.")
+
+    register_peer(result["url"])
+
+    return Peer(**result)
+
+
+@router.delete(
+    "/peers",
+    response_model=List[str],
+    summary="Peer Unregistration",
+    description="Unregisters the given peer. Peers from the settings can't be "
+    "unregistered. Requires the admin API key.",
+    dependencies=[Depends(check_admin_api_key)],
+)
+def peer_unregistration(peer: PeerRegistration = Body(...)) -> List[str]:
+    """
+    Unregisters the given peer.
+    """
+
+    return unregister_peer(str(peer.url))
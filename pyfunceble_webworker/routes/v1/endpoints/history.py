@@ -0,0 +1,135 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the endpoints of the history of our subjects.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import itertools
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from pyfunceble_webworker.core import history
+from pyfunceble_webworker.models.history import (
+    CheckerHistory,
+    HistoryTransition,
+    SubjectHistory,
+)
+from pyfunceble_webworker.models.jobs import JobChecker
+
+router = APIRouter(prefix="/history")
+
+
+def to_datetime(timestamp: float) -> datetime.datetime:
+    """
+    Provides the (UTC) datetime of the given timestamp.
+    """
+
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+
+@router.get(
+    "/{subject:path}",
+    response_model=SubjectHistory,
+    summary="Subject History",
+    description="Provides the status transitions of the given subject - per "
+    "checker and in the order they were tested. The first recorded status is "
+    "given as the first transition. Results are recorded within "
+    "`HISTORY_FLUSH_INTERVAL` seconds.",
+)
+def subject_history(
+    subject: str,
+    checker: Optional[JobChecker] = Query(
+        None,
+        summary="Checker",
+        description="The checker to provide the history of. All when omitted.",
+    ),
+) -> SubjectHistory:
+    """
+    Provides the history of the given subject.
+    """
+
+    rows = history.HISTORY.get_history(subject, checker)
+
+    if not rows:
+        raise HTTPException(status_code=404, detail="No history for this subject.")
+
+    checkers = []
+
+    for name, results in itertools.groupby(rows, key=lambda x: x[0]):
+        results = list(results)
+        transitions = []
+        previous_status = None
+
+        for _, tested_at, status, status_source in results:
+            if status != previous_status:
+                transitions.append(
+                    HistoryTransition(
+                        tested_at=to_datetime(tested_at),
+                        status=status,
+                        status_source=status_source,
+                        previous_status=previous_status,
+                    )
+                )
+                previous_status = status
+
+        checkers.append(
+            CheckerHistory(
+                checker=JobChecker(name),
+                checks=len(results),
+                first_tested_at=to_datetime(results[0][1]),
+                last_tested_at=to_datetime(results[-1][1]),
+                status=results[-1][2],
+                transitions=transitions,
+            )
+        )
+
+    return SubjectHistory(subject=subject, checkers=checkers)
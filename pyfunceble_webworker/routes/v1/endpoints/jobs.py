@@ -0,0 +1,296 @@
+"""
+This project is part of the PyFunceble project. The objective of this project
+is to provide the PyFunceble project behind a Web REST API.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This is the module that provides the endpoints of our bulk jobs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+PyFunceble link:
+    https://github.com/funilrys/PyFunceble
+
+PyFunceble documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+PyFunceble homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import itertools
+from typing import List
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+
+from pyfunceble_webworker.core.clients import get_client
+from pyfunceble_webworker.core.coordinator import read_shards
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.core.defaults import routes as routes_defaults
+from pyfunceble_webworker.core.jobs import (
+    INVALID_SUBJECT_PATTERN,
+    JOB_CHECKERS,
+    JOB_ID_PATTERN,
+    cancel_job,
+    count_results,
+    create_job,
+    iter_results,
+    read_job,
+    start_job,
+)
+from pyfunceble_webworker.core.logs import set_subject_count
+from pyfunceble_webworker.core.responses import (
+    get_fields,
+    get_media_type,
+    project,
+    respond,
+)
+from pyfunceble_webworker.core.settings import core_settings
+from pyfunceble_webworker.middlewares.rate_limit import charge_request
+from pyfunceble_webworker.models.jobs import (
+    Job,
+    JobChecker,
+    JobRequest,
+    JobResult,
+    JobShard,
+)
+from pyfunceble_webworker.models.projection import ProjectionParams
+
+router = APIRouter(prefix="/jobs")
+
+
+def get_job(job_id: str) -> dict:
+    """
+    Provides the given job.
+
+    :raise HTTPException:
+        When the job does not exist.
+    """
+
+    job = read_job(job_id) if JOB_ID_PATTERN.fullmatch(job_id) else None
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+
+    return job
+
+
+def to_model(job: dict) -> Job:
+    """
+    Provides the model of the given job.
+    """
+
+    shards = read_shards(job["id"]) if job.get("distributed") else None
+
+    if shards is not None:
+        shards = [
+            JobShard(
+                total=len(x["indexes"]),
+                completed=x["fetched"],
+                **{y: x[y] for y in ("peer", "remote_id", "state", "attempts")},
+            )
+            for x in shards
+        ]
+
+    return Job(
+        completed=count_results(job["id"]),
+        shards=shards,
+        **{x: job.get(x) for x in Job.model_fields if x not in ("completed", "shards")},
+    )
+
+
+@router.post(
+    "",
+    response_model=Job,
+    status_code=202,
+    summary="Job Submission",
+    description="Submits a list of subjects to test against the given checker. "
+    "The job is run in the background and survives restarts: subjects already "
+    "tested are never tested again. In re-check mode, the subjects with a fresh "
+    "recorded result are not tested at all: their recorded result is given back.",
+)
+def submit_job(
+    request: Request,
+    job_request: JobRequest = Body(...),
+    client: str = Depends(get_client),
+) -> Job:
+    """
+    Submits a new job.
+    """
+
+    # dict preserves the insertion order, so we can deduplicate while keeping the
+    # order of the input.
+    subjects = list(dict.fromkeys(x.strip() for x in job_request.subjects if x.strip()))
+    set_subject_count(len(subjects))
+
+    if not subjects:
+        raise HTTPException(status_code=422, detail="No subject to test.")
+
+    invalid = [x for x in subjects if INVALID_SUBJECT_PATTERN.search(x)]
+
+    if invalid:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Subject(s) with whitespace or control characters: "
+            f"{', '.join(repr(x) for x in invalid[:10])}.",
+        )
+
+    if job_request.distributed and not core_settings.COORDINATOR_ENABLED:
+        raise HTTPException(
+            status_code=422, detail="Distributed jobs need the coordinator mode."
+        )
+
+    if job_request.freshness is not None and not core_settings.HISTORY_ENABLED:
+        raise HTTPException(
+            status_code=422, detail="The re-check mode needs the history."
+        )
+
+    if job_request.freshness is not None:
+        # A typo would silently make the subjects of that status tested again.
+        model = JOB_CHECKERS[job_request.checker].model
+        statuses = {x.value for x in model.model_fields["status"].annotation}
+        unknown = [x for x in job_request.freshness if x.upper() not in statuses]
+
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown status(es): {', '.join(unknown)} "
+                f"(known: {', '.join(sorted(statuses))}).",
+            )
+
+    if len(subjects) > core_settings.JOBS_MAX_SUBJECTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many subjects (max: {core_settings.JOBS_MAX_SUBJECTS}).",
+        )
+
+    # Each subject is charged as a request to the equivalent single-subject route.
+    bucket = charge_request(
+        request,
+        f"{routes_defaults.V1_URL_PREFIX}/{job_request.checker.value}",
+        len(subjects),
+    )
+
+    if bucket is not None:
+        raise HTTPException(
+            status_code=429,
+            detail="Too Many Requests",
+            headers={"Retry-After": str(bucket.retry_after)},
+        )
+
+    job = create_job(
+        job_request.checker,
+        subjects,
+        job_request.params,
+        client,
+        distributed=job_request.distributed,
+        freshness=(
+            {x.upper(): y for x, y in job_request.freshness.items()}
+            if job_request.freshness is not None
+            else None
+        ),
+    )
+    start_job(job)
+
+    return to_model(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=Job,
+    summary="Job Progress",
+    description="Provides the progress of the given job.",
+)
+def job_progress(job_id: str) -> Job:
+    """
+    Provides the progress of the given job.
+    """
+
+    return to_model(get_job(job_id))
+
+
+@router.get(
+    "/{job_id}/results",
+    response_model=List[JobResult],
+    summary="Job Results",
+    responses=responses_defaults.NEGOTIATED_RESPONSES,
+    description="Provides the results of the given job - in the order they were "
+    "tested. The projection applies to the status of each result.",
+)
+def job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0, summary="Offset", description="The results to skip."),
+    limit: int = Query(
+        1000,
+        ge=1,
+        le=10000,
+        summary="Limit",
+        description="The maximum number of results to provide.",
+    ),
+    projection: ProjectionParams = Depends(),
+    media_type: str = Depends(get_media_type),
+):
+    """
+    Provides the results of the given job.
+    """
+
+    model = JOB_CHECKERS[JobChecker(get_job(job_id)["checker"])].model
+    fields = get_fields(model, projection)
+    result = []
+
+    for item in itertools.islice(iter_results(job_id), offset, offset + limit):
+        if item.get("status") is not None and fields is not None:
+            item["status"] = project(model, item["status"], fields)
+
+        result.append(project(JobResult, item))
+
+    return respond(result, media_type)
+
+
+@router.delete(
+    "/{job_id}",
+    response_model=Job,
+    summary="Job Cancellation",
+    description="Cancels the given job. The results tested so far are kept.",
+)
+def job_cancellation(job_id: str) -> Job:
+    """
+    Cancels the given job.
+    """
+
+    get_job(job_id)
+
+    return to_model(cancel_job(job_id))
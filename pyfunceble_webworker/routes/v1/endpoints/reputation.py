@@ -59,9 +59,23 @@ from PyFunceble import (
     URLReputationChecker,
 )
 
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.core.dns_cache import (
+    get_reputation_lookups,
+    get_url_reputation_lookups,
+)
+from pyfunceble_webworker.core.responses import (
+    get_media_type,
+    get_projection,
+    render,
+)
+from pyfunceble_webworker.core.scheduler import run_checker
+from pyfunceble_webworker.models.projection import ProjectionParams
 from pyfunceble_webworker.models.reputation import CheckerParams, ReputationStatus
 
-router = APIRouter(prefix="/reputation")
+router = APIRouter(
+    prefix="/reputation", responses=responses_defaults.NEGOTIATED_RESPONSES
+)
 
 
 @router.post(
@@ -71,25 +85,28 @@ router = APIRouter(prefix="/reputation")
     description="Checks the reputation of the given subject against our domain "
     "reputation checker.",
 )
-def domain_reputation(
+async def domain_reputation(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(ReputationStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the reputation of the given domain.
     """
 
-    return (
-        DomainReputationChecker(
-            subject, do_syntax_check_first=params.do_syntax_check_first
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        DomainReputationChecker,
+        subject,
+        get_dns_lookups=get_reputation_lookups,
+        do_syntax_check_first=params.do_syntax_check_first,
     )
 
+    return render(ReputationStatus, status, projection, media_type)
+
 
 @router.post(
     "/url",
@@ -98,25 +115,28 @@ def domain_reputation(
     description="Checks the reputation of the given URL against our URL "
     "reputation checker.",
 )
-def url_reputation(
+async def url_reputation(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(ReputationStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the reputation of the given URL.
     """
 
-    return (
-        URLReputationChecker(
-            subject, do_syntax_check_first=params.do_syntax_check_first
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        URLReputationChecker,
+        subject,
+        get_dns_lookups=get_url_reputation_lookups,
+        do_syntax_check_first=params.do_syntax_check_first,
     )
 
+    return render(ReputationStatus, status, projection, media_type)
+
 
 @router.post(
     "/domain-and-ip",
@@ -125,25 +145,28 @@ def url_reputation(
     description="Checks the reputation of the given subject against our "
     "domain and IP (v4 & v6) reputation checker.",
 )
-def domain_ip_reputation(
+async def domain_ip_reputation(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(ReputationStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the reputation of the given domain or IP.
     """
 
-    return (
-        DomainAndIPReputationChecker(
-            subject, do_syntax_check_first=params.do_syntax_check_first
-        )
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        DomainAndIPReputationChecker,
+        subject,
+        get_dns_lookups=get_reputation_lookups,
+        do_syntax_check_first=params.do_syntax_check_first,
     )
 
+    return render(ReputationStatus, status, projection, media_type)
+
 
 @router.post(
     "/ip",
@@ -152,19 +175,23 @@ def domain_ip_reputation(
     description="Checks the reputation of the given subject against our IP "
     "(v4 & v6) reputation checker.",
 )
-def ip_reputation(
+async def ip_reputation(
     *,
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
     ),
-    params: CheckerParams = Depends()
+    params: CheckerParams = Depends(),
+    projection: ProjectionParams = Depends(get_projection(ReputationStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the reputation of the given IP.
     """
 
-    return (
-        IPReputationChecker(subject, do_syntax_check_first=params.do_syntax_check_first)
-        .get_status()
-        .to_dict()
+    status = await run_checker(
+        IPReputationChecker,
+        subject,
+        do_syntax_check_first=params.do_syntax_check_first,
     )
+
+    return render(ReputationStatus, status, projection, media_type)
@@ -51,12 +51,20 @@ License:
     limitations under the License.
 """
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Depends
 from PyFunceble import DomainSyntaxChecker, IPSyntaxChecker, URLSyntaxChecker
 
+from pyfunceble_webworker.core.defaults import responses as responses_defaults
+from pyfunceble_webworker.core.profiling import profile_call
+from pyfunceble_webworker.core.responses import (
+    get_media_type,
+    get_projection,
+    render,
+)
+from pyfunceble_webworker.models.projection import ProjectionParams
 from pyfunceble_webworker.models.syntax import SyntaxStatus
 
-router = APIRouter(prefix="/syntax")
+router = APIRouter(prefix="/syntax", responses=responses_defaults.NEGOTIATED_RESPONSES)
 
 
 @router.post(
@@ -69,13 +77,20 @@ router = APIRouter(prefix="/syntax")
 def domain_syntax(
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
-    )
+    ),
+    projection: ProjectionParams = Depends(get_projection(SyntaxStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the syntax of the given domain.
     """
 
-    return DomainSyntaxChecker(subject).get_status().to_dict()
+    return render(
+        SyntaxStatus,
+        profile_call(DomainSyntaxChecker(subject).get_status),
+        projection,
+        media_type,
+    )
 
 
 @router.post(
@@ -88,13 +103,20 @@ def domain_syntax(
 def ip_syntax(
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
-    )
+    ),
+    projection: ProjectionParams = Depends(get_projection(SyntaxStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the syntax of the given IP (v4 or v6).
     """
 
-    return IPSyntaxChecker(subject).get_status().to_dict()
+    return render(
+        SyntaxStatus,
+        profile_call(IPSyntaxChecker(subject).get_status),
+        projection,
+        media_type,
+    )
 
 
 @router.post(
@@ -107,10 +129,17 @@ def ip_syntax(
 def url_syntax(
     subject: str = Body(
         ..., embed=True, summary="Subject", description="The subject to work with."
-    )
+    ),
+    projection: ProjectionParams = Depends(get_projection(SyntaxStatus)),
+    media_type: str = Depends(get_media_type),
 ):
     """
     Checks the syntax of the given URL.
     """
 
-    return URLSyntaxChecker(subject).get_status().to_dict()
+    return render(
+        SyntaxStatus,
+        profile_call(URLSyntaxChecker(subject).get_status),
+        projection,
+        media_type,
+    )
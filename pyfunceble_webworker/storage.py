@@ -53,3 +53,4 @@ License:
 
 LOCATION: dict = dict()
 CONFIG_DIRECTORY: str = ""
+LOADED_DATASETS: dict = dict()
@@ -99,6 +99,9 @@ def get_requirements(*, mode="standard"):
         "pyfunceble-dev": ["requirements.pyfdev.txt"],
         "pyf-dev": ["requirements.pyfdev.txt"],
         "pyfdev": ["requirements.pyfdev.txt"],
+        "cbor": ["requirements.cbor.txt"],
+        "zstd": ["requirements.zstd.txt"],
+        "http2": ["requirements.http2.txt"],
     }
 
     ignored_modes_for_all = [
@@ -162,6 +165,9 @@ if __name__ == "__main__":
             "dev": get_requirements(mode="dev"),
             "full": get_requirements(mode="full"),
             "all": get_requirements(mode="all"),
+            "cbor": get_requirements(mode="cbor"),
+            "zstd": get_requirements(mode="zstd"),
+            "http2": get_requirements(mode="http2"),
         },
         description="The PyFunceble project behind a REST API.",
         long_description=get_long_description(),